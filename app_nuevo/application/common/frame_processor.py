@@ -1,8 +1,11 @@
+import asyncio
+import contextlib
+import itertools
 import logging
 from abc import ABC, abstractmethod
 from enum import IntEnum
 
-from app_nuevo.domain.value_objects.frames import Frame
+from app_nuevo.domain.value_objects.frames import Frame, SystemFrame
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -14,12 +17,31 @@ class FrameDirection(IntEnum):
 class FrameProcessor(ABC):
     """
     Base class for any element in the pipeline processing chain.
+
+    By default frames are chained inline: push_frame() awaits the next
+    processor's process_frame(). When an inbox is enabled (see enable_inbox),
+    the processor consumes frames from its own bounded queue in a dedicated
+    task and push_frame() only hands the frame off, so a slow processor no
+    longer stalls the ones before it until its inbox fills up.
     """
     def __init__(self, name: str | None = None):
         self.name = name or self.__class__.__name__
         self._next: FrameProcessor | None = None
         self._prev: FrameProcessor | None = None
 
+        # Optional per-processor inbox (task execution mode)
+        self._inbox: asyncio.PriorityQueue | None = None
+        self._inbox_space: asyncio.Semaphore | None = None
+        self._inbox_max_size = 0
+        self._inbox_task: asyncio.Task | None = None
+        self._inbox_counter = itertools.count()
+        self._inbox_stats = {
+            'enqueued': 0,
+            'processed': 0,
+            'blocked': 0,
+            'max_depth': 0
+        }
+
     def link(self, processor: 'FrameProcessor'):
         """Connect this processor to the next one."""
         self._next = processor
@@ -44,15 +66,110 @@ class FrameProcessor(ABC):
         """Send a frame to the next processor in the chain."""
         if direction == FrameDirection.DOWNSTREAM:
             if self._next:
-                await self._next.process_frame(frame, direction)
+                await self._next._receive(frame, direction)
             else:
                 logger.debug(f"[{self.name}] Dropped DOWNSTREAM frame (End of Chain): {frame}")
         elif direction == FrameDirection.UPSTREAM:
             if self._prev:
-                await self._prev.process_frame(frame, direction)
+                await self._prev._receive(frame, direction)
             else:
                 logger.debug(f"[{self.name}] Dropped UPSTREAM frame (Start of Chain): {frame}")
 
+    async def _receive(self, frame: Frame, direction: FrameDirection):
+        """Entry point used by neighbours: inline call or inbox hand-off."""
+        if self._inbox is None:
+            await self.process_frame(frame, direction)
+        else:
+            await self.enqueue_frame(frame, direction)
+
+    # --- Inbox (task execution mode) ---
+
+    def enable_inbox(self, max_size: int = 50):
+        """
+        Give this processor its own bounded inbox and consumer task.
+
+        Must be called from a running event loop. SystemFrames are always
+        accepted and jump ahead of data frames. Downstream data frames apply
+        backpressure: once the inbox holds max_size of them, the producer
+        waits for room instead of losing audio or text. Upstream frames never
+        wait (a hop blocked on its downstream neighbour could otherwise
+        deadlock with it).
+
+        Args:
+            max_size: Maximum number of downstream data frames held in the inbox.
+        """
+        if self._inbox is not None:
+            return
+
+        self._inbox = asyncio.PriorityQueue()
+        self._inbox_space = asyncio.Semaphore(max_size)
+        self._inbox_max_size = max_size
+        self._inbox_task = asyncio.create_task(self._inbox_loop())
+
+    async def disable_inbox(self):
+        """Stop the inbox consumer task and return to inline chaining."""
+        if self._inbox_task:
+            self._inbox_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._inbox_task
+            self._inbox_task = None
+        if self._inbox_space is not None:
+            # Wake producers still waiting for room (their frames are discarded)
+            for _ in range(self._inbox_max_size):
+                self._inbox_space.release()
+            self._inbox_space = None
+        self._inbox = None
+
+    async def enqueue_frame(self, frame: Frame, direction: FrameDirection):
+        """Hand a frame off to the inbox, waiting for room if it is full."""
+        inbox = self._inbox
+        is_system = isinstance(frame, SystemFrame)
+        bounded = direction == FrameDirection.DOWNSTREAM and not is_system
+
+        if bounded:
+            if self._inbox_space.locked():
+                self._inbox_stats['blocked'] += 1
+                logger.debug(
+                    f"[{self.name}] Inbox full ({self._inbox_max_size}). Waiting to enqueue: {frame.name}"
+                )
+            await self._inbox_space.acquire()
+            if inbox is not self._inbox:
+                return  # Inbox disabled while waiting (pipeline stopped)
+
+        priority = 1 if is_system else 2
+        inbox.put_nowait((priority, next(self._inbox_counter), frame, direction, bounded))
+        self._inbox_stats['enqueued'] += 1
+        depth = inbox.qsize()
+        if depth > self._inbox_stats['max_depth']:
+            self._inbox_stats['max_depth'] = depth
+
+    async def _inbox_loop(self):
+        """Consume the inbox, processing one frame at a time."""
+        while True:
+            try:
+                _, _, frame, direction, bounded = await self._inbox.get()
+                if bounded:
+                    self._inbox_space.release()
+                await self.process_frame(frame, direction)
+                self._inbox_stats['processed'] += 1
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"[{self.name}] Inbox loop error: {e}", exc_info=True)
+
+    def get_inbox_stats(self) -> dict[str, int]:
+        """
+        Get inbox statistics for this hop.
+
+        Returns:
+            Dictionary with depth, max_size, enqueued, processed, blocked (producer
+            waits on a full inbox), max_depth
+        """
+        stats = self._inbox_stats.copy()
+        stats['depth'] = self._inbox.qsize() if self._inbox is not None else 0
+        stats['max_size'] = self._inbox_max_size
+        return stats
+
     async def cleanup(self):  # noqa: B027 - Optional hook for subclasses
         """Release resources."""
         pass
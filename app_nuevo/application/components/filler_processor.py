@@ -0,0 +1,198 @@
+"""
+Filler Processor (latency masking).
+
+When the LLM is slow to start answering, the caller hears dead air. If no
+response text has arrived `filler_threshold_ms` after UserStoppedSpeakingFrame,
+this stage plays one short pre-rendered clip ("mm-hm", "déjame ver") in the
+agent's own voice.
+
+Gated by the profile flags `voice_filler_injection` (thinking fillers) and
+`voice_backchanneling` (short acknowledgements). Clips are rendered once per
+call through the TTS port (served by the TTS audio cache after the first call)
+and are never cut or overlapped: real TTS audio queues behind a clip that is
+already playing, and no clip starts once the response has begun.
+"""
+import asyncio
+import contextlib
+import itertools
+import logging
+from typing import Any
+
+from app_nuevo.domain.value_objects.frames import (
+    AudioFrame,
+    CancelFrame,
+    Frame,
+    TextFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from app_nuevo.application.common.frame_processor import FrameDirection, FrameProcessor
+from app_nuevo.application.components.tts_processor import TTSProcessor
+from app_nuevo.domain.ports import TTSPort
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.infrastructure.audio.framer import AudioFramer
+from app_nuevo.infrastructure.services.audio_manager import SILENCE_BYTES, frame_size_bytes
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_FILLER_THRESHOLD_MS = 700  # Gap (user stopped -> response text) before a clip plays
+FILLER_PHRASES = {
+    "es": ("Déjame ver.", "Mmm, un momento.", "A ver..."),
+    "en": ("Let me see.", "Hmm, one moment.", "Let's see..."),
+}
+BACKCHANNEL_PHRASES = {
+    "es": ("Ajá.", "Mm-hm.", "Claro."),
+    "en": ("Uh-huh.", "Mm-hm.", "Sure."),
+}
+
+
+def _profile(config: Any) -> Any:
+    if hasattr(config, 'get_profile'):
+        return config.get_profile(getattr(config, 'client_type', 'twilio'))
+    return config
+
+
+def filler_phrases(config: Any) -> tuple[str, ...]:
+    """Clip texts enabled for this agent config (empty when both flags are off)."""
+    profile = _profile(config)
+    language = (getattr(config, 'language', None) or 'es-MX').split('-')[0].lower()
+    phrases: tuple[str, ...] = ()
+    if getattr(profile, 'voice_filler_injection', False):
+        phrases += FILLER_PHRASES.get(language, FILLER_PHRASES["es"])
+    if getattr(profile, 'voice_backchanneling', False) or getattr(profile, 'enable_backchannel', False):
+        phrases += BACKCHANNEL_PHRASES.get(language, BACKCHANNEL_PHRASES["es"])
+    return phrases
+
+
+class FillerProcessor(FrameProcessor):
+    """
+    Plays a filler clip when the response is late. Sits between LLM and TTS.
+
+    Armed by UserStoppedSpeakingFrame; disarmed by the first response
+    TextFrame, UserStartedSpeakingFrame or CancelFrame. At most one clip per
+    turn. Clip AudioFrames carry metadata {'filler': True} so MetricsProcessor
+    can tell perceived latency from true TTFA.
+    """
+    def __init__(self, tts_port: TTSPort, config: Any):
+        super().__init__(name="FillerProcessor")
+        self.tts_port = tts_port
+        self.config = config
+        self.threshold_ms = getattr(config, 'filler_threshold_ms', None) or DEFAULT_FILLER_THRESHOLD_MS
+        self.phrases = filler_phrases(config)
+
+        self._audio_config = AudioConfig.from_legacy_mode(getattr(config, 'client_type', 'twilio'))
+        self._clips: list[bytes] = []
+        self._clip_order = itertools.count()
+        self._render_task: asyncio.Task | None = None
+        self._gap_task: asyncio.Task | None = None
+        self._playing = False
+        self._stats = {
+            'turns_armed': 0,
+            'played': 0,
+            'not_needed': 0,
+            'not_ready': 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.phrases)
+
+    async def start(self):
+        """Render the clip bank in the background (the call does not wait for it)."""
+        if self.enabled and self._render_task is None:
+            self._render_task = asyncio.create_task(self._render_clips())
+            logger.info(f"🫧 [Filler] Enabled ({len(self.phrases)} clips, threshold={self.threshold_ms}ms)")
+
+    async def process_frame(self, frame: Frame, direction: int):
+        if direction == FrameDirection.DOWNSTREAM and self.enabled:
+            if isinstance(frame, UserStoppedSpeakingFrame):
+                self._arm()
+            elif isinstance(frame, (UserStartedSpeakingFrame, CancelFrame)):
+                # Barge-in: the audio already queued is flushed downstream
+                self._disarm(stop_playback=True)
+            elif isinstance(frame, TextFrame) and frame.metadata.get('turn_status') != 'partial':
+                # Response started: yield to real TTS (a clip already playing finishes first)
+                self._disarm(stop_playback=False)
+
+        await self.push_frame(frame, direction)
+
+    def _arm(self):
+        self._disarm(stop_playback=False)
+        self._stats['turns_armed'] += 1
+        self._gap_task = asyncio.create_task(self._play_after_gap())
+
+    def _disarm(self, stop_playback: bool):
+        task = self._gap_task
+        if task and not task.done() and (stop_playback or not self._playing):
+            if not self._playing:
+                self._stats['not_needed'] += 1
+            task.cancel()
+        if stop_playback:
+            self._gap_task = None
+
+    async def _play_after_gap(self):
+        try:
+            await asyncio.sleep(self.threshold_ms / 1000.0)
+            if not self._clips:
+                self._stats['not_ready'] += 1
+                return
+
+            clip = self._clips[next(self._clip_order) % len(self._clips)]
+            logger.debug(f"🫧 [Filler] Response late (> {self.threshold_ms}ms): playing {len(clip)} byte clip")
+            self._playing = True
+            self._stats['played'] += 1
+            for block in self._blocks(clip):
+                await self.push_frame(AudioFrame(
+                    data=block,
+                    sample_rate=self._audio_config.sample_rate,
+                    channels=1,
+                    metadata={'filler': True}
+                ))
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._playing = False
+
+    def _blocks(self, clip: bytes) -> list[bytes]:
+        """Whole transport frames (same blocking as TTSProcessor output)."""
+        framer = AudioFramer(
+            frame_size=frame_size_bytes(self._audio_config),
+            silence_byte=SILENCE_BYTES.get(self._audio_config.encoding, 0x00)
+        )
+        blocks = framer.push(clip)
+        if tail := framer.flush():
+            blocks.append(tail)
+        return blocks
+
+    async def _render_clips(self):
+        for phrase in self.phrases:
+            request = TTSProcessor.build_request(self.config, phrase)
+            try:
+                audio = await self.tts_port.synthesize(request)
+            except Exception as e:
+                logger.warning(f"⚠️ [Filler] Could not render '{phrase}': {e}")
+                continue
+            if audio:
+                self._clips.append(audio)
+        logger.debug(f"🫧 [Filler] Clip bank ready: {len(self._clips)}/{len(self.phrases)}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get filler statistics for this call.
+
+        Returns:
+            Dictionary with turns_armed, played, not_needed, not_ready, clips
+        """
+        stats = self._stats.copy()
+        stats['clips'] = len(self._clips)
+        return stats
+
+    async def cleanup(self):
+        """Pipeline shutdown hook."""
+        for task in (self._render_task, self._gap_task):
+            if task and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        await super().cleanup()
@@ -34,12 +34,9 @@ class HoldAudioPlayer:
         self._task: asyncio.Task | None = None
         self._sound_interval = 2.0  # 2 seconds between pulses
 
-        # Pre-synthesize a short "tick" or "comfort pulse" (20ms)
-        # 8000Hz, PCMU (u-law) approximation or silence + tick
-        # Note: Proper PCMU synthesis requires a lookup table or math.
-        # For safety/simplicity, we generate 20ms of simple silence/low-noise.
-        # 0xFF is silence in u-law.
-        self._pulse_audio = b'\xff' * 160  # 20ms silence (keep line active)
+        # Pre-synthesize a short "comfort pulse" (20ms) once, in the call's
+        # transport codec (0xFF u-law, 0xD5 A-law, 0x00 PCM).
+        self._pulse_audio = bytes([audio_manager.silence_byte]) * audio_manager.frame_size  # keep line active
 
     async def start(self):
         """
@@ -1,7 +1,8 @@
 import asyncio
 import logging
-import re
+import time
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
 from app_nuevo.domain.value_objects.frames import CancelFrame, EndTaskFrame, Frame, TextFrame
@@ -13,6 +14,7 @@ from app_nuevo.domain.use_cases import ExecuteToolUseCase
 
 from app_nuevo.application.components.hold_audio import HoldAudioPlayer
 from app_nuevo.domain.services.prompt_builder import PromptBuilder
+from app_nuevo.domain.services.text_segmenter import TextSegmenter, ends_sentence
 
 logger = logging.getLogger(__name__)
 
@@ -160,10 +162,34 @@ class LLMProcessor(FrameProcessor):
 
         # Stream
         full_response_buffer = ""
-        sentence_buffer = ""
+        transcript_buffer = ""
         should_end_call = False
+        segmenter = self._create_segmenter()
+        segment_index = 0
+        first_token_ts: float | None = None
+
+        async def emit(segments: list[str]):
+            nonlocal segment_index, transcript_buffer
+            for segment in segments:
+                await self.push_frame(TextFrame(
+                    text=segment,
+                    trace_id=self.trace_id,
+                    metadata={'segment_index': segment_index, 'llm_first_token_ts': first_token_ts}
+                ))
+                segment_index += 1
+
+                # Transcript stays sentence-level even though TTS gets clauses
+                transcript_buffer += segment
+                if ends_sentence(transcript_buffer):
+                    self._report_transcript(transcript_buffer)
+                    transcript_buffer = ""
+
+        async for chunk in self._stream_with_deadline(self.llm_port.generate_stream(request), segmenter):
+            # Case 0: Segmenter deadline (no token within max latency)
+            if chunk is None:
+                await emit(segmenter.poll())
+                continue
 
-        async for chunk in self.llm_port.generate_stream(request):
             # Case A: Function Call
             if chunk.has_function_call:
                 logger.info(
@@ -197,6 +223,8 @@ class LLMProcessor(FrameProcessor):
             if chunk.has_text:
                 token_text = chunk.text
                 full_response_buffer += token_text
+                if first_token_ts is None:
+                    first_token_ts = time.time()
 
                 # [TRACING] Log Token Stream
                 # logger.debug(f"💭 [LLM_STREAM] Token: '{token_text}'")  # Commented out to reduce noise, enable for deep debug
@@ -207,23 +235,15 @@ class LLMProcessor(FrameProcessor):
                     should_end_call = True
                     token_text = token_text.replace("[END_CALL]", "") # Remove from speech
 
-                sentence_buffer += token_text
-
-                # Smart heuristic for sentence splitting (Punctuation + Space or End of Line)
-                # Adds logical pause for TTS
-                if len(sentence_buffer) > 10 and re.search(r'[.?!]\s+$', sentence_buffer):
-                    # Report Sentence
-                    if self.transcript_callback:
-                        asyncio.create_task(self.transcript_callback("assistant", sentence_buffer))
-
-                    await self.push_frame(TextFrame(text=sentence_buffer, trace_id=self.trace_id))
-                    sentence_buffer = ""
+                # Clause-level segmentation: emit as soon as a chunk is speakable
+                await emit(segmenter.push(token_text))
 
         # Flush remaining text
-        if sentence_buffer.strip():
-            if self.transcript_callback:
-                asyncio.create_task(self.transcript_callback("assistant", sentence_buffer))
-            await self.push_frame(TextFrame(text=sentence_buffer, trace_id=self.trace_id))
+        remaining = segmenter.flush()
+        if remaining:
+            await emit([remaining])
+        if transcript_buffer.strip():
+            self._report_transcript(transcript_buffer)
 
         # Update History
         if full_response_buffer.strip():
@@ -238,6 +258,46 @@ class LLMProcessor(FrameProcessor):
             # Send SystemFrame to trigger architecture shutdown flow
             await self.push_frame(EndTaskFrame(), FrameDirection.DOWNSTREAM)
 
+    def _create_segmenter(self) -> TextSegmenter:
+        max_latency_ms = getattr(self.config, 'tts_segment_max_latency_ms', 600)
+        return TextSegmenter(
+            min_chars=getattr(self.config, 'tts_segment_min_chars', 10),
+            clause_min_words=getattr(self.config, 'tts_segment_clause_words', 6),
+            max_latency_seconds=max_latency_ms / 1000.0 if max_latency_ms else None
+        )
+
+    @staticmethod
+    async def _stream_with_deadline(stream: AsyncIterator, segmenter: TextSegmenter) -> AsyncIterator:
+        """
+        Iterate an LLM stream, yielding None whenever the segmenter's max-latency
+        deadline passes before the next chunk arrives.
+
+        The pending __anext__ is never cancelled on timeout (that would close the
+        provider's generator); we simply keep waiting on the same task.
+        """
+        iterator = stream.__aiter__()
+        next_chunk: asyncio.Future | None = None
+        try:
+            while True:
+                next_chunk = asyncio.ensure_future(iterator.__anext__())
+                while True:
+                    done, _ = await asyncio.wait({next_chunk}, timeout=segmenter.time_until_deadline())
+                    if done:
+                        break
+                    yield None
+                try:
+                    chunk = next_chunk.result()
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            if next_chunk and not next_chunk.done():
+                next_chunk.cancel()
+
+    def _report_transcript(self, text: str):
+        if self.transcript_callback:
+            asyncio.create_task(self.transcript_callback("assistant", text))
+
     async def _execute_tool(self, function_call: LLMFunctionCall):
         """
         Execute tool via ExecuteToolUseCase.
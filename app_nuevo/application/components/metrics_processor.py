@@ -10,13 +10,32 @@ logger = logging.getLogger(__name__)
 class MetricsProcessor(FrameProcessor):
     """
     Tracks pipeline latency metrics.
-    Specifically measures "Time to First Audio" (TTFA) after User Stopped Speaking.
+    Specifically measures "Time to First Audio" (TTFA) after User Stopped Speaking,
+    and TTFA after the first LLM token (synthesis + segmentation cost only).
+
+    Perceived turn latency (first audio of ANY kind, filler clips included) is
+    tracked separately: with latency masking on it is shorter than TTFA, which
+    only counts the real response.
     """
     def __init__(self, config: Any):
         super().__init__(name="MetricsProcessor")
         self.config = config
         self.last_user_stop_time = 0.0
         self.turn_in_progress = False
+        self.perceived_pending = False
+        self._stats = {
+            'turns': 0,
+            'filler_turns': 0,
+            'ttfa_ms_last': None,
+            'ttfa_ms_avg': None,
+            'perceived_ms_last': None,
+            'perceived_ms_avg': None,
+            'ttfa_after_token_ms_last': None,
+            'ttfa_after_token_ms_avg': None,
+            '_ttfa_count': 0,
+            '_perceived_count': 0,
+            '_ttfa_after_token_count': 0
+        }
 
     async def process_frame(self, frame: Frame, direction: int):
         current_time = time.time()
@@ -25,14 +44,54 @@ class MetricsProcessor(FrameProcessor):
             if isinstance(frame, UserStoppedSpeakingFrame):
                 self.last_user_stop_time = current_time
                 self.turn_in_progress = True
+                self.perceived_pending = True
+
+            elif isinstance(frame, AudioFrame):
+                is_filler = frame.metadata.get('filler', False)
+                if self.perceived_pending:
+                    # First audio the caller hears (a filler clip counts)
+                    latency_ms = (current_time - self.last_user_stop_time) * 1000
+                    logger.info(f"⚡ [LATENCY] Perceived turn latency: {latency_ms:.0f}ms{' (filler)' if is_filler else ''}")
+                    self._record('perceived', latency_ms)
+                    if is_filler:
+                        self._stats['filler_turns'] += 1
+                    self.perceived_pending = False
+
+                if self.turn_in_progress and not is_filler:
+                    # First chunk of audio after user stopped -> TTFA
+                    latency_ms = (current_time - self.last_user_stop_time) * 1000
+                    logger.info(f"⚡ [LATENCY] TTFA (Turn Latency): {latency_ms:.0f}ms")
+                    self._record('ttfa', latency_ms)
+                    self._stats['turns'] += 1
+                    self.turn_in_progress = False # Reset for next turn
 
-            elif isinstance(frame, AudioFrame) and self.turn_in_progress:
-                # First chunk of audio after user stopped -> TTFA
-                latency_ms = (current_time - self.last_user_stop_time) * 1000
-                logger.info(f"⚡ [LATENCY] TTFA (Turn Latency): {latency_ms:.0f}ms")
-                self.turn_in_progress = False # Reset for next turn
+                # First audio of an LLM response carries the first-token timestamp
+                first_token_ts = frame.metadata.get('llm_first_token_ts')
+                if first_token_ts:
+                    latency_ms = (current_time - first_token_ts) * 1000
+                    logger.info(f"⚡ [LATENCY] TTFA after first LLM token: {latency_ms:.0f}ms")
+                    self._record('ttfa_after_token', latency_ms)
 
             # Pass through
             await self.push_frame(frame, direction)
         else:
             await self.push_frame(frame, direction)
+
+    def _record(self, metric: str, value_ms: float):
+        count_key = f'_{metric}_count'
+        avg_key = f'{metric}_ms_avg'
+        count = self._stats[count_key] + 1
+        avg = self._stats[avg_key] or 0.0
+        self._stats[count_key] = count
+        self._stats[f'{metric}_ms_last'] = round(value_ms, 1)
+        self._stats[avg_key] = round(avg + (value_ms - avg) / count, 1)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get latency statistics for this call.
+
+        Returns:
+            Dictionary with turns, filler_turns, ttfa_ms_last/avg,
+            perceived_ms_last/avg, ttfa_after_token_ms_last/avg
+        """
+        return {k: v for k, v in self._stats.items() if not k.startswith('_')}
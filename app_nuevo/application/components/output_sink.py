@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from typing import Any
 
@@ -16,8 +15,6 @@ class PipelineOutputSink(FrameProcessor):
     def __init__(self, orchestrator: Any):
         super().__init__(name="PipelineOutputSink")
         self.orchestrator = orchestrator
-        self._queue = asyncio.Queue()
-        self._worker_task = asyncio.create_task(self._worker())
 
     async def process_frame(self, frame: Frame, direction: int):
         if direction == FrameDirection.DOWNSTREAM:
@@ -26,21 +23,13 @@ class PipelineOutputSink(FrameProcessor):
                 if frame.metadata.get('source') == 'user_input':
                     return
 
-                # Queue audio for background sending (Non-blocking)
-                await self._queue.put(frame)
+                # Hand off to the playout queue directly (non-blocking put);
+                # TTS frames already arrive in transport-sized blocks
+                await self._send_audio(frame)
 
             elif isinstance(frame, UserStartedSpeakingFrame):
                  # Critical: Trigger Barge-in Logic
                  await self.orchestrator.interrupt_speaking()
-                 # Also clear our own sink queue
-                 while not self._queue.empty():
-                     try:
-                        self._queue.get_nowait()
-                        self._queue.task_done()
-                     except asyncio.QueueEmpty:
-                        break
-                     except Exception:
-                        pass
 
             elif isinstance(frame, ControlFrame):
                 # Other control frames
@@ -50,18 +39,6 @@ class PipelineOutputSink(FrameProcessor):
         else:
             await self.push_frame(frame, direction)
 
-    async def _worker(self):
-        """Background worker to consume audio frames with pacing."""
-        while True:
-            try:
-                frame = await self._queue.get()
-                await self._send_audio(frame)
-                self._queue.task_done()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Sink Worker Error: {e}")
-
     async def _send_audio(self, frame: AudioFrame):
         # Delegate to orchestrator's buffered sender
         try:
@@ -71,11 +48,6 @@ class PipelineOutputSink(FrameProcessor):
         except Exception as e:
             logger.error(f"Error in PipelineOutputSink delegation: {e}")
 
-    async def cleanup(self):
-        if self._worker_task:
-            self._worker_task.cancel()
-        await super().cleanup()
-
     def set_stream_id(self, stream_id: str):
         # Orchestrator handles stream ID context
         pass
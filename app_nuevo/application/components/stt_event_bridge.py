@@ -0,0 +1,182 @@
+"""
+STT Event Bridge.
+
+Recognizer callbacks run on SDK threads. Scheduling a coroutine per event
+(run_coroutine_threadsafe(push_frame(...))) costs a cross-thread hand-off per
+interim hypothesis and lets frames run concurrently with, and out of order
+against, the pipeline's own queue consumer.
+
+The bridge instead collects frames under a lock, wakes the loop at most once
+per batch, and delivers them IN ORDER from a single consumer task into the
+pipeline queue (PipelineService.queue_frame). Interim results are coalesced:
+at most one partial per `partial_interval_ms` is forwarded (always the latest);
+finals and control frames always go through, and a final supersedes any
+partial still waiting.
+"""
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app_nuevo.domain.value_objects.frames import Frame
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_PARTIAL_INTERVAL_MS = 100
+
+
+class STTEventBridge:
+    """
+    Thread-safe, ordered hand-off of recognizer frames into the event loop.
+
+    Usage:
+        bridge = STTEventBridge(loop, pipeline.queue_frame)
+        await bridge.start()
+        bridge.submit(TextFrame(text="hola", is_final=True))   # any thread
+        bridge.submit_partial(TextFrame(text="ho", is_final=False))
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        sink: Callable[[Frame], Awaitable[Any]],
+        partial_interval_ms: float = DEFAULT_PARTIAL_INTERVAL_MS
+    ):
+        """
+        Args:
+            loop: Event loop that owns the pipeline
+            sink: Coroutine function receiving frames in order (e.g. PipelineService.queue_frame)
+            partial_interval_ms: Minimum spacing of forwarded interim results
+        """
+        self.loop = loop
+        self.sink = sink
+        self.partial_interval = partial_interval_ms / 1000.0
+
+        # Shared with SDK threads (guarded by _lock)
+        self._lock = threading.Lock()
+        self._pending: deque[Frame] = deque()
+        self._partial: Frame | None = None
+        self._wake_requested = False
+        self._partial_timer_armed = False  # Trailing-edge flush scheduled: partials need no wake-up
+
+        # Loop-only state
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._last_partial_at = 0.0
+        self._stats = {
+            'frames': 0,
+            'partials_received': 0,
+            'partials_forwarded': 0,
+            'partials_superseded': 0,
+            'wakeups': 0
+        }
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+            self._partial_timer_armed = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    # --- Producer side (any thread) ---
+
+    def submit(self, frame: Frame) -> None:
+        """Forward a frame (final result, control frame); never dropped."""
+        with self._lock:
+            if self._partial is not None and getattr(frame, 'is_final', False):
+                # The final covers everything the waiting partial said
+                self._partial = None
+                self._stats['partials_superseded'] += 1
+            self._pending.append(frame)
+            wake = self._request_wake()
+        if wake:
+            self._wake_loop()
+
+    def submit_partial(self, frame: Frame) -> None:
+        """Offer an interim result; only the latest per interval is forwarded."""
+        with self._lock:
+            if self._partial is not None:
+                self._stats['partials_superseded'] += 1
+            self._partial = frame
+            self._stats['partials_received'] += 1
+            wake = not self._partial_timer_armed and self._request_wake()
+        if wake:
+            self._wake_loop()
+
+    def _request_wake(self) -> bool:
+        """Called under the lock: True if this producer must wake the loop."""
+        if self._wake_requested:
+            return False
+        self._wake_requested = True
+        return True
+
+    def _wake_loop(self) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass  # Loop closed (call teardown)
+
+    # --- Consumer side (event loop) ---
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            self._stats['wakeups'] += 1
+
+            for frame in self._take():
+                try:
+                    await self.sink(frame)
+                    self._stats['frames'] += 1
+                except Exception as e:
+                    logger.error(f"❌ [STT Bridge] Failed to deliver {frame.name}: {e}")
+
+    def _take(self) -> list[Frame]:
+        """Frames due now, in arrival order (a due partial is always the newest)."""
+        now = time.monotonic()
+        with self._lock:
+            self._wake_requested = False
+            frames = list(self._pending)
+            self._pending.clear()
+
+            if self._partial is not None:
+                wait = self._last_partial_at + self.partial_interval - now
+                if wait <= 0:
+                    frames.append(self._partial)
+                    self._partial = None
+                    self._last_partial_at = now
+                    self._stats['partials_forwarded'] += 1
+                elif self._timer is None:
+                    # Trailing edge: forward the latest partial when the window closes
+                    self._timer = self.loop.call_later(wait, self._on_timer)
+                    self._partial_timer_armed = True
+        return frames
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._partial_timer_armed = False
+        self._timer = None
+        self._wake.set()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get bridge statistics.
+
+        Returns:
+            Dictionary with frames, partials_received/forwarded/superseded, wakeups
+        """
+        return self._stats.copy()
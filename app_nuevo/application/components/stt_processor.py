@@ -1,15 +1,16 @@
 import asyncio
 import contextlib
-import json
 import logging
 from typing import Any
 
-from app_nuevo.domain.value_objects.frames import AudioFrame, CancelFrame, Frame, TextFrame
+from app_nuevo.domain.value_objects.frames import AudioFrame, CancelFrame, Frame, TextFrame, UpdateSettingsFrame
 from app_nuevo.application.common.frame_processor import FrameDirection, FrameProcessor
+from app_nuevo.application.components.stt_event_bridge import DEFAULT_PARTIAL_INTERVAL_MS, STTEventBridge
 from app_nuevo.domain.ports.stt_port import STTConfig
 # from app_nuevo.services.base import STTEvent, STTProvider, STTResultReason # LEGACY/INCORRECT -> Using ValueObjects
 from app_nuevo.domain.value_objects.stt_value_objects import STTEvent, STTResultReason
 from app_nuevo.domain.ports.stt_port import STTPort
+from app_nuevo.domain.services.stt_filters import STTFilters, normalize_text
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,11 @@ class STTProcessor(FrameProcessor):
     """
     Consumes AudioFrames, writes to Azure PushStream.
     Listens to Azure Events, produces TextFrames.
+
+    Recognizer events arrive on SDK threads and reach the pipeline through an
+    STTEventBridge (ordered, coalesced partials). By default the bridge pushes
+    downstream from this processor; the factory points it at
+    PipelineService.queue_frame so results enter the pipeline's own queue.
     """
     def __init__(self, provider: STTPort, config: Any, loop: asyncio.AbstractEventLoop, control_channel=None):
         super().__init__(name="STTProcessor")
@@ -26,6 +32,43 @@ class STTProcessor(FrameProcessor):
         self.control_channel = control_channel
         self.push_stream = None # Azure PushAudioInputStream
         self.recognizer = None
+        self._bridge = STTEventBridge(
+            loop,
+            self.push_frame,
+            partial_interval_ms=getattr(config, 'stt_partial_interval_ms', None) or DEFAULT_PARTIAL_INTERVAL_MS
+        )
+
+        # Transcript filters: compiled once per call, recompiled on UpdateSettingsFrame
+        self._filter_overrides: dict[str, Any] = {}
+        self._filters = self._compile_filters()
+        self._keyword_interrupted = False  # Interruption already fired for the current utterance
+
+    def _profile(self) -> Any:
+        client_type = getattr(self.config, 'client_type', 'twilio')
+        if hasattr(self.config, 'get_profile'):
+            return self.config.get_profile(client_type)
+        return self.config
+
+    def _compile_filters(self) -> STTFilters:
+        filters = STTFilters.from_config(self.config, self._profile(), self._filter_overrides)
+        logger.debug(
+            f"🔧 [STT] Filters compiled: {len(filters.blacklist)} blacklisted, "
+            f"{len(filters.interruptions)} interruption phrases, min_chars={filters.min_characters}"
+        )
+        return filters
+
+    def set_event_sink(self, sink):
+        """Route recognizer frames to `sink` (e.g. PipelineService.queue_frame)."""
+        self._bridge.sink = sink
+
+    def set_speech_active(self, active: bool):
+        """VAD speech state, for recognizers that detect stalls (STTWithFallback)."""
+        if self.recognizer and hasattr(self.recognizer, 'set_speech_active'):
+            self.recognizer.set_speech_active(active)
+
+    async def start(self):
+        """Start delivering recognizer events (buffered until now)."""
+        await self._bridge.start()
 
     async def initialize(self):
         """
@@ -89,6 +132,10 @@ class STTProcessor(FrameProcessor):
 
                 # Propagate audio to next processor (VAD)
                 await self.push_frame(frame, direction)
+            elif isinstance(frame, UpdateSettingsFrame):
+                self._filter_overrides.update(frame.settings)
+                self._filters = self._compile_filters()  # Atomic swap for the SDK thread
+                await self.push_frame(frame, direction)
             else:
                 # Pass through other frames
                 await self.push_frame(frame, direction)
@@ -96,10 +143,19 @@ class STTProcessor(FrameProcessor):
             await self.push_frame(frame, direction)
 
     async def cleanup(self):
+        await self._bridge.stop()
         if self.recognizer:
             # Non-blocking cleanup attempt
             with contextlib.suppress(Exception):
                 await self.loop.run_in_executor(None, self.recognizer.stop_continuous_recognition_async().get)
+            # Pooled recognizers are single-use: the provider destroys it and refills in the background
+            with contextlib.suppress(Exception):
+                await self.provider.release_recognizer(self.recognizer)
+            self.recognizer = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Event bridge statistics (frames, partial coalescing, wakeups)."""
+        return self._bridge.get_stats()
 
     # --- callbacks ---
 
@@ -110,91 +166,73 @@ class STTProcessor(FrameProcessor):
         """
         try:
             logger.debug(f"🔍 [STT_CALLBACK] Event Received: {evt.reason} | Equality Check: {evt.reason == STTResultReason.RECOGNIZED_SPEECH}")
-            
+            filters = self._filters  # Snapshot: settings updates swap the whole object
+
             # Robust check for Recognized Speech (handles potential Enum import mismatches)
             if evt.reason == STTResultReason.RECOGNIZED_SPEECH or str(evt.reason) == 'STTResultReason.RECOGNIZED_SPEECH':
                 text = evt.text
+                # Next utterance may barge in again
+                already_interrupted, self._keyword_interrupted = self._keyword_interrupted, False
                 if text:
                     # --- Filtering Logic ---
+                    normalized = normalize_text(text)
 
                     # 1. Blacklist (Hallucinations)
-                    blacklist_str = getattr(self.config, 'hallucination_blacklist', '') or ''
-                    blacklist = [x.strip() for x in blacklist_str.split(',') if x.strip()]
-                    if any(bad_phrase in text for bad_phrase in blacklist):
+                    if filters.blacklisted(normalized, normalized=True):
                         logger.warning(f"🔇 [STT] Ignored (Blacklist): {text}")
                         return
 
                     # 2. Min Characters (Interruption Threshold)
-                    logger.debug("🔍 [STT_CALLBACK] Checking Min Chars...")
-                    val = getattr(self.config, 'input_min_characters', 2)
-                    min_chars = val if val is not None else 2
-                    if len(text) < min_chars:
-                        logger.warning(f"🔇 [STT] Ignored (Too Short < {min_chars}): {text}")
+                    if filters.too_short(text):
+                        logger.warning(f"🔇 [STT] Ignored (Too Short < {filters.min_characters}): {text}")
                         return
 
-                    # 3. Interruption Phrases (Force Stop)
-                    logger.debug("🔍 [STT_CALLBACK] Checking Interruption Phrases...")
-                    # Use profile configuration for type-safe access
-                    client_type = getattr(self.config, 'client_type', 'twilio')
-                    if hasattr(self.config, 'get_profile'):
-                        profile = self.config.get_profile(client_type)
-                    else:
-                        profile = self.config
-
-                    phrases_json = getattr(profile, 'interruption_phrases', None)
-                    logger.debug(f"🔍 [STT_CALLBACK] Phrases: {phrases_json}")
-
-                    if phrases_json:
-                        text_lower = text.lower()
-                        try:
-                            if isinstance(phrases_json, str):
-                                phrases = json.loads(phrases_json)
-                            else:
-                                phrases = phrases_json
-
-                            if isinstance(phrases, list):
-                                for phrase in phrases:
-                                    if phrase.lower() in text_lower:
-                                        logger.info(f"⚡ [STT] Interruption Phrase Detected: '{phrase}' - FORCING STOP")
-
-                                        # Out-of-Band Signal (Priority)
-                                        if self.control_channel:
-                                            asyncio.run_coroutine_threadsafe(
-                                                self.control_channel.send_interrupt(text=f"Keyword: {phrase}"),
-                                                self.loop
-                                            )
-
-                                        # In-Band Signal (Fallback)
-                                        asyncio.run_coroutine_threadsafe(
-                                            self.push_frame(CancelFrame()),
-                                            self.loop
-                                        )
-                                        break
-                        except Exception as e:
-                            logger.warning(f"Failed to parse interruption_phrases: {e}")
+                    # 3. Interruption Phrases (Force Stop), unless a partial already fired it
+                    if not already_interrupted:
+                        self._check_interruption(normalized, filters)
 
                     logger.info(f"🎤 [STT] Recognized: {text}")
 
                     # [TRACING] Log STT Event
                     logger.debug(f"👂 [STT_EVENT] Text: '{text}' | Confidence: High | Trace: {getattr(self.config, 'stream_id', 'unknown')}")
 
-                    asyncio.run_coroutine_threadsafe(
-                        self.push_frame(TextFrame(text=text, is_final=True)),
-                        self.loop
-                    )
+                    self._bridge.submit(TextFrame(text=text, is_final=True))
 
             elif evt.reason == STTResultReason.RECOGNIZING_SPEECH or str(evt.reason) == 'STTResultReason.RECOGNIZING_SPEECH':
                 # [FEEDBACK] Handle Partial Results (Interim)
                 text = evt.text
                 if text and len(text.strip()) > 0:
+                     # Keyword barge-in on the interim hypothesis (once per utterance), same
+                     # Interruption Threshold as finals: a too-short partial never barges in
+                     if filters.interruptions and not self._keyword_interrupted and not filters.too_short(text):
+                         normalized = normalize_text(text)
+                         if not filters.blacklisted(normalized, normalized=True):
+                             self._keyword_interrupted = self._check_interruption(normalized, filters)
+
                      # logger.debug(f"📝 [STT_PARTIAL] '{text}'") # Optional: verbose
-                     asyncio.run_coroutine_threadsafe(
-                        self.push_frame(TextFrame(text=text, is_final=False)),
-                        self.loop
-                    )
+                     self._bridge.submit_partial(TextFrame(text=text, is_final=False))
 
             elif evt.reason == STTResultReason.CANCELED:
                 logger.warning(f"STT Canceled. Details: {evt.error_details}")
 
         except Exception as e:
             logger.error(f"❌ [STT] Critical Error in _on_stt_event: {e}", exc_info=True)
+
+    def _check_interruption(self, normalized: str, filters: STTFilters) -> bool:
+        """Force a barge-in if the (normalized) text contains an interruption phrase."""
+        phrase = filters.interruption(normalized, normalized=True)
+        if not phrase:
+            return False
+
+        logger.info(f"⚡ [STT] Interruption Phrase Detected: '{phrase}' - FORCING STOP")
+
+        # Out-of-Band Signal (Priority)
+        if self.control_channel:
+            asyncio.run_coroutine_threadsafe(
+                self.control_channel.send_interrupt(text=f"Keyword: {phrase}"),
+                self.loop
+            )
+
+        # In-Band Signal (Fallback)
+        self._bridge.submit(CancelFrame())
+        return True
@@ -1,20 +1,72 @@
 import asyncio
 import contextlib
 import logging
+from dataclasses import dataclass, field
 from typing import Any
 
 from app_nuevo.domain.value_objects.frames import AudioFrame, CancelFrame, Frame, TextFrame
 from app_nuevo.application.common.frame_processor import FrameDirection, FrameProcessor
-from app_nuevo.domain.ports import TTSPort, TTSRequest
+from app_nuevo.domain.ports import TTSPort
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.domain.value_objects.cancellation import CancellationToken
+from app_nuevo.domain.value_objects.tts_value_objects import TTSRequest
+from app_nuevo.infrastructure.audio.framer import DEFAULT_MAX_FRAMES_PER_BLOCK, AudioFramer
+from app_nuevo.infrastructure.services.audio_manager import SILENCE_BYTES, frame_size_bytes
 
 logger = logging.getLogger(__name__)
 
+# Constants
+DEFAULT_MAX_INFLIGHT = 2  # Segment being played + one synthesized ahead
+SYNTHESIS_MODE_STREAMING = "streaming"
+SYNTHESIS_MODE_THROUGHPUT = "throughput"
+DEFAULT_BATCH_WINDOW_MS = 800    # Throughput mode: max wait for the reply's next sentence
+DEFAULT_BATCH_MAX_CHARS = 1500   # Throughput mode: max text per provider request
+
+
+@dataclass
+class _Segment:
+    """One text chunk in synthesis. Audio chunks are buffered until it is its turn to play."""
+    text: str
+    trace_id: str
+    metadata: dict
+    chunks: asyncio.Queue = field(default_factory=asyncio.Queue)
+    task: asyncio.Task | None = None
+    cancel_token: CancellationToken = field(default_factory=CancellationToken)
+    cancelled: asyncio.Event = field(default_factory=asyncio.Event)
+    holds_slot: bool = True  # Releases the in-flight slot when played (last segment of a batch)
+
+    def cancel(self) -> None:
+        """Stop provider work (cooperatively) and skip playback."""
+        self.cancel_token.cancel()
+        self.cancelled.set()
+        self.chunks.put_nowait(None)  # Wake the emitter if it waits for audio
+
 
 class TTSProcessor(FrameProcessor):
     """
     Consumes TextFrames, calls TTS Port (Hexagonal), produces AudioFrames.
     Supports cancellation via CancelFrame.
     Implements true streaming for low latency.
+
+    Up to `tts_max_inflight` segments synthesize concurrently (segment N+1
+    renders while N is still streaming out); audio is always emitted in
+    segment order.
+
+    Provider audio is re-blocked into whole 20ms transport frames (at most
+    `tts_frames_per_block` per AudioFrame) before it leaves the processor,
+    so downstream stages never re-chunk.
+
+    Throughput mode (profile `tts_synthesis_mode="throughput"`, e.g. outbound
+    campaigns): consecutive texts of the same reply (a text with segment_index
+    0 starts a new one; trace_id is per call) arriving within
+    `tts_batch_window_ms` of each other are synthesized as ONE provider request
+    and sliced back into per-sentence segments. Fewer round-trips and
+    concurrent provider connections per call, at the cost of first-audio
+    latency.
+
+    On CancelFrame (barge-in) the worker and emitter keep running: pending
+    texts are dropped and in-flight segments are cancelled through their
+    CancellationToken, which the adapter turns into a provider-side stop.
     """
     def __init__(self, tts_port: TTSPort, config: Any):
         super().__init__(name="TTSProcessor")
@@ -24,9 +76,26 @@ class TTSProcessor(FrameProcessor):
         # Backpressure configuration
         self.backpressure_threshold = getattr(config, 'tts_backpressure_threshold', 3)
 
-        # Concurrency: Internal Queue for serial synthesis
+        # Concurrency: Internal Queue of texts -> ordered segments in synthesis
+        self.max_inflight = max(getattr(config, 'tts_max_inflight', DEFAULT_MAX_INFLIGHT) or 1, 1)
         self._tts_queue: asyncio.Queue = asyncio.Queue()
+        self._segments: asyncio.Queue = asyncio.Queue()
+        self._inflight = asyncio.Semaphore(self.max_inflight)
         self._worker_task: asyncio.Task | None = None
+        self._emitter_task: asyncio.Task | None = None
+        self._playing_segment: _Segment | None = None
+        self._active_segments: list[_Segment] = []  # Dispatched, not yet fully played
+        self._generation = 0  # Bumped on cancel; queued texts from older generations are dropped
+        self._held_item: tuple | None = None  # Dequeued while batching but belongs to the next batch
+
+        # Throughput mode batching
+        self.batch_window_ms = getattr(config, 'tts_batch_window_ms', DEFAULT_BATCH_WINDOW_MS)
+        self.batch_max_chars = getattr(config, 'tts_batch_max_chars', DEFAULT_BATCH_MAX_CHARS)
+
+        # Output framing (created on first use: client_type is known by then)
+        self.frames_per_block = max(getattr(config, 'tts_frames_per_block', DEFAULT_MAX_FRAMES_PER_BLOCK) or 1, 1)
+        self._framer: AudioFramer | None = None
+        self._sample_rate = 8000
 
         # Flags
         self._is_running = False
@@ -35,8 +104,12 @@ class TTSProcessor(FrameProcessor):
         """Start the TTS processing worker."""
         if not self._is_running:
             self._is_running = True
-            self._worker_task = asyncio.create_task(self._worker())
-            logger.info("🔊 [TTS] Worker started")
+            self._start_tasks()
+            logger.info(f"🔊 [TTS] Worker started (max_inflight={self.max_inflight})")
+
+    def _start_tasks(self):
+        self._worker_task = asyncio.create_task(self._worker())
+        self._emitter_task = asyncio.create_task(self._emitter())
 
     async def process_frame(self, frame: Frame, direction: int):
         # [DEBUG] Robust Type Identification
@@ -59,7 +132,7 @@ class TTSProcessor(FrameProcessor):
                 trace_id = getattr(frame, 'trace_id', '')
 
                 logger.debug(f"📥 [TTS] Queuing TextFrame: '{text[:30]}...'")
-                await self._tts_queue.put((text, trace_id))
+                await self._tts_queue.put((self._generation, text, trace_id, frame.metadata))
 
             elif isinstance(frame, CancelFrame) or frame_type == "CancelFrame":
                 logger.info("🛑 [TTS] Received CancelFrame. Clearing queue.")
@@ -71,35 +144,200 @@ class TTSProcessor(FrameProcessor):
             await self.push_frame(frame, direction)
 
     async def _worker(self):
-        """Sequential TTS Worker Loop."""
+        """Dispatch Loop: starts synthesis of queued texts, at most max_inflight at a time."""
         while self._is_running:
             try:
-                text, trace_id = await self._tts_queue.get()
-
-                # --- Response Pacing (Profile Config) ---
-                client_type = getattr(self.config, 'client_type', 'twilio')
-                if hasattr(self.config, 'get_profile'):
-                    profile = self.config.get_profile(client_type)
+                item = await self._next_item()
+                generation, text, trace_id, metadata = item
+
+                await self._inflight.acquire()
+                batch = [item]
+                if self._synthesis_mode() == SYNTHESIS_MODE_THROUGHPUT:
+                    batch += await self._collect_batch(generation, len(text))
+
+                if generation != self._generation:
+                    # Cancelled while waiting for a synthesis slot (or for the batch)
+                    self._inflight.release()
+                    continue
+
+                if len(batch) == 1:
+                    segment = _Segment(text=text, trace_id=trace_id, metadata=metadata)
+                    segment.task = asyncio.create_task(self._synthesize_segment(segment))
+                    segments = [segment]
                 else:
-                    profile = self.config
+                    # One provider request, one cancel token, one slot (released by the last segment)
+                    cancel_token = CancellationToken()
+                    segments = [
+                        _Segment(text=text, trace_id=trace_id, metadata=metadata,
+                                 cancel_token=cancel_token, holds_slot=False)
+                        for _, text, trace_id, metadata in batch
+                    ]
+                    segments[-1].holds_slot = True
+                    task = asyncio.create_task(self._synthesize_batch(segments))
+                    for segment in segments:
+                        segment.task = task
+
+                for segment in segments:
+                    self._active_segments.append(segment)
+                    await self._segments.put(segment)
 
-                delay = profile.response_delay_seconds or 0.0
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"TTS Worker Error: {e}")
 
-                if delay > 0:
-                    logger.debug(f"⏳ [TTS] Pacing: Waiting {delay}s...")
-                    await asyncio.sleep(delay)
-                # ----------------------------------------
+    async def _next_item(self) -> tuple:
+        if self._held_item is not None:
+            item, self._held_item = self._held_item, None
+            return item
+        item = await self._tts_queue.get()
+        self._tts_queue.task_done()
+        return item
+
+    async def _collect_batch(self, generation: int, chars: int) -> list[tuple]:
+        """
+        Further texts of the same reply, each arriving within the batch window
+        of the previous one. A text of another reply is held for the next batch.
+        """
+        batch = []
+        window = self.batch_window_ms / 1000.0
+        while chars < self.batch_max_chars:
+            try:
+                item = await asyncio.wait_for(self._next_item(), window)
+            except asyncio.TimeoutError:
+                break
+            starts_reply = item[3].get('segment_index', 0) == 0
+            if item[0] != generation or starts_reply or chars + len(item[1]) > self.batch_max_chars:
+                self._held_item = item
+                break
+            batch.append(item)
+            chars += len(item[1])
+        return batch
 
-                await self._synthesize(text, trace_id)
-                self._tts_queue.task_done()
+    def _synthesis_mode(self) -> str:
+        return getattr(self._profile(), 'tts_synthesis_mode', None) or SYNTHESIS_MODE_STREAMING
+
+    async def _emitter(self):
+        """Ordered Output Loop: streams each segment's audio in arrival order."""
+        while self._is_running:
+            try:
+                segment = await self._segments.get()
+                self._playing_segment = segment
+                try:
+                    # --- Response Pacing (Profile Config) ---
+                    # Applied once per response (first segment), not per clause
+                    if segment.metadata.get('segment_index', 0) == 0:
+                        delay = self._response_delay()
+                        if delay > 0:
+                            logger.debug(f"⏳ [TTS] Pacing: Waiting {delay}s...")
+                            with contextlib.suppress(asyncio.TimeoutError):
+                                await asyncio.wait_for(segment.cancelled.wait(), delay)
+                    # ----------------------------------------
+
+                    if not segment.cancelled.is_set():
+                        await self._emit_segment(segment)
+                finally:
+                    self._playing_segment = None
+                    self._active_segments.remove(segment)
+                    if segment.holds_slot:
+                        self._inflight.release()
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"TTS Worker Error: {e}")
+                logger.error(f"TTS Emitter Error: {e}")
+
+    def _profile(self) -> Any:
+        client_type = getattr(self.config, 'client_type', 'twilio')
+        if hasattr(self.config, 'get_profile'):
+            return self.config.get_profile(client_type)
+        return self.config
+
+    def _response_delay(self) -> float:
+        return getattr(self._profile(), 'response_delay_seconds', 0.0) or 0.0
+
+    def _get_framer(self) -> AudioFramer:
+        if self._framer is None:
+            audio_config = AudioConfig.from_legacy_mode(getattr(self.config, 'client_type', 'twilio'))
+            self._sample_rate = audio_config.sample_rate
+            self._framer = AudioFramer(
+                frame_size=frame_size_bytes(audio_config),
+                silence_byte=SILENCE_BYTES.get(audio_config.encoding, 0x00),
+                max_frames_per_block=self.frames_per_block
+            )
+        return self._framer
+
+    async def _emit_segment(self, segment: _Segment):
+        framer = self._get_framer()
+        first_token_ts = segment.metadata.get('llm_first_token_ts')
+        first = True
+
+        while (audio_chunk := await segment.chunks.get()) is not None:
+            if segment.cancelled.is_set():
+                framer.reset()
+                return
+            for block in framer.push(audio_chunk):
+                metadata = {'llm_first_token_ts': first_token_ts} if first and first_token_ts else {}
+                first = False
+                await self._push_audio(block, metadata)
+
+        # Sub-frame tail: carried into the next segment when one is queued
+        # (continuous speech), padded with silence at the end of the response
+        if self._segments.empty() and (tail := framer.flush()):
+            await self._push_audio(tail, {})
+
+    async def _push_audio(self, data: bytes, metadata: dict):
+        await self.push_frame(
+            AudioFrame(data=data, sample_rate=self._sample_rate, channels=1, metadata=metadata)
+        )
+        # [TRACING] Log TTS Audio Chunk
+        logger.debug(f"🔊 [TTS_CHUNK] Sent {len(data)} bytes")
+
+    async def _synthesize_segment(self, segment: _Segment):
+        try:
+            await self._synthesize(segment.text, segment.trace_id, segment.chunks.put_nowait, segment.cancel_token)
+        except asyncio.CancelledError:
+            logger.debug(f"🛑 [TTS] trace={segment.trace_id} Synthesis stopped")
+        finally:
+            segment.chunks.put_nowait(None)  # End of segment
+
+    async def _synthesize_batch(self, segments: list[_Segment]):
+        """Throughput mode: one provider request for all segments, audio routed back per segment."""
+        cancel_token = segments[0].cancel_token
+        trace_id = segments[0].trace_id
+        requests = []
+        for segment in segments:
+            request = self.build_request(self.config, segment.text, trace_id=trace_id)
+            request.cancel_token = cancel_token
+            requests.append(request)
+
+        logger.info(f"🗣️ [TTS] trace={trace_id} Synthesizing batch of {len(segments)} segments")
+        current = 0
+        try:
+            async with contextlib.aclosing(self.tts_port.synthesize_batch_stream(requests)) as stream:
+                async for index, audio_chunk in stream:
+                    if cancel_token.cancelled:
+                        break
+                    # Earlier segments are complete: let the emitter move on
+                    while current < index:
+                        segments[current].chunks.put_nowait(None)
+                        current += 1
+                    if audio_chunk:
+                        segments[index].chunks.put_nowait(audio_chunk)
+            logger.debug(f"🗣️ [TTS] trace={trace_id} Batch synthesis complete")
+        except asyncio.CancelledError:
+            logger.debug(f"🛑 [TTS] trace={trace_id} Batch synthesis stopped")
+        except Exception as e:
+            logger.error(f"TTS Error: {e}", exc_info=True)
+        finally:
+            for segment in segments[current:]:
+                segment.chunks.put_nowait(None)  # End of segment
 
     async def _clear_queue(self):
-        """Flush pending texts and restart worker logic if needed."""
+        """Drop pending texts and cancel in-flight segments; worker and emitter keep running."""
+        self._generation += 1
+        self._held_item = None
+
         # Empty the queue
         while not self._tts_queue.empty():
             try:
@@ -108,19 +346,36 @@ class TTSProcessor(FrameProcessor):
             except asyncio.QueueEmpty:
                 break
 
-        # Note: We rely on the Port implementation to handle cancellation of active properties
-        # For true cancellation, we might need a flag or restart the worker
-        # Restarting worker is the safest way to kill active synthesis
-        if self._worker_task and not self._worker_task.done():
-            self._worker_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._worker_task
-
-            # Restart
-            if self._is_running:
-                self._worker_task = asyncio.create_task(self._worker())
-
-    async def _synthesize(self, text: str, trace_id: str):
+        # Playing segment + those synthesized ahead. The emitter still dequeues
+        # them (skipping playback), which keeps the in-flight slots balanced.
+        self._cancel_segments()
+        if self._framer:
+            self._framer.reset()
+
+    def _cancel_segments(self):
+        for segment in self._active_segments:
+            segment.cancel()
+
+    async def _cancel_tasks(self):
+        self._cancel_segments()
+        for task in (self._worker_task, self._emitter_task):
+            if task and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._worker_task = None
+        self._emitter_task = None
+        self._playing_segment = None
+
+        # Segments were cancelled cooperatively; make sure none outlives the processor
+        for segment in self._active_segments:
+            if segment.task and not segment.task.done():
+                segment.task.cancel()
+        self._active_segments.clear()
+        self._segments = asyncio.Queue()
+        self._inflight = asyncio.Semaphore(self.max_inflight)
+
+    async def _synthesize(self, text: str, trace_id: str, on_audio, cancel_token: CancellationToken | None = None):
         if not text:
             return
 
@@ -138,39 +393,23 @@ class TTSProcessor(FrameProcessor):
             if backpressure_detected:
                 logger.warning(f"⚠️ [TTS] Backpressure detected: queue={queue_depth}")
 
-            # Determine correct sample rate
-            client_type = getattr(self.config, 'client_type', 'twilio')
-            sr = 16000 if client_type == 'browser' else 8000
-
             # Request
-            request = TTSRequest(
-                text=text,
-                voice_id=getattr(self.config, 'voice_name', 'en-US-JennyNeural'),
-                language=getattr(self.config, 'language', 'es-MX'),
-                speed=getattr(self.config, 'voice_speed', 1.0),
-                pitch=getattr(self.config, 'voice_pitch', 0.0),
-                volume=getattr(self.config, 'voice_volume', 100.0),
-                style=getattr(self.config, 'voice_style', None),
-                backpressure_detected=backpressure_detected,
-                metadata={
-                    "trace_id": trace_id,
-                    "client_type": client_type  # Pass client type for Adapter to select format
-                }
+            request = self.build_request(
+                self.config,
+                text,
+                trace_id=trace_id,
+                backpressure_detected=backpressure_detected
             )
+            request.cancel_token = cancel_token
 
-            # True Streaming: Emit processing audio chunks as they arrive
+            # True Streaming: Hand audio chunks to the emitter as they arrive
             # This reduces TTFB (Time To First Byte) significantly
-
-            async for audio_chunk in self.tts_port.synthesize_stream(request):
-                # We can batch small chunks if needed, or send raw
-                # Sending immediately for best latency
-                if audio_chunk:
-                   await self.push_frame(
-                       AudioFrame(data=audio_chunk, sample_rate=sr, channels=1)
-                   )
-                   # [TRACING] Log TTS Audio Chunk
-                   logger.debug(f"🔊 [TTS_CHUNK] Sent {len(audio_chunk)} bytes")
-
+            async with contextlib.aclosing(self.tts_port.synthesize_stream(request)) as stream:
+                async for audio_chunk in stream:
+                    if cancel_token and cancel_token.cancelled:
+                        break  # Adapter without cooperative cancellation: stop consuming
+                    if audio_chunk:
+                        on_audio(audio_chunk)
 
             # Note: We don't log "Received X bytes" total anymore since we stream
             logger.debug(f"🗣️ [TTS] trace={trace_id} Synthesis complete")
@@ -178,12 +417,42 @@ class TTSProcessor(FrameProcessor):
         except Exception as e:
             logger.error(f"TTS Error: {e}", exc_info=True)
 
+    @staticmethod
+    def build_request(
+        config: Any,
+        text: str,
+        trace_id: str | None = None,
+        client_type: str | None = None,
+        backpressure_detected: bool = False
+    ) -> TTSRequest:
+        """
+        TTSRequest for an agent config.
+
+        Shared with the startup greeting warm-up so pre-rendered audio is keyed
+        exactly like the audio requested during the call.
+        """
+        return TTSRequest(
+            text=text,
+            voice_id=getattr(config, 'voice_name', 'en-US-JennyNeural'),
+            language=getattr(config, 'language', 'es-MX'),
+            speed=getattr(config, 'voice_speed', 1.0),
+            pitch=getattr(config, 'voice_pitch', 0.0),
+            volume=getattr(config, 'voice_volume', 100.0),
+            style=getattr(config, 'voice_style', None),
+            backpressure_detected=backpressure_detected,
+            metadata={
+                "trace_id": trace_id,
+                # Pass client type for Adapter to select format
+                "client_type": client_type or getattr(config, 'client_type', 'twilio')
+            }
+        )
+
     async def stop(self):
         """Stops the TTS processor and cleans up tasks."""
         self._is_running = False
-        if self._worker_task:
-            self._worker_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._worker_task
-            self._worker_task = None
-        await super().stop()
+        await self._cancel_tasks()
+
+    async def cleanup(self):
+        """Pipeline shutdown hook."""
+        await self.stop()
+        await super().cleanup()
@@ -7,8 +7,9 @@ import numpy as np
 
 from app_nuevo.domain.value_objects.frames import AudioFrame, Frame, UserStartedSpeakingFrame, UserStoppedSpeakingFrame
 from app_nuevo.application.common.frame_processor import FrameDirection, FrameProcessor
-# Legacy import for Silero Model (Infrastructure to be migrated later)
-from app_nuevo.infrastructure.ml.vad_model import SileroOnnxModel
+from app_nuevo.infrastructure.audio.ring_buffer import AudioRingBuffer
+# Shared Silero engine (one ONNX session, batched across calls)
+from app_nuevo.infrastructure.ml.vad_engine import get_vad_engine
 from app_nuevo.domain.use_cases import DetectTurnEndUseCase
 
 logger = logging.getLogger(__name__)
@@ -25,10 +26,11 @@ class VADProcessor(FrameProcessor):
         self.control_channel = control_channel
 
         # VAD State
-        self.vad_model = None
-        self.buffer = bytearray()
+        self.vad_engine = None
+        self.vad_stream = None
         self.speaking = False
         self.silence_frames = 0
+        self._speech_listener = None  # Called with True/False on speech start/stop
         self.speech_frames = 0
 
         # State: Confirmation Window (False Positive Prevention)
@@ -66,6 +68,12 @@ class VADProcessor(FrameProcessor):
         # Calculate Chunk Duration (Silero requirement)
         # 512 samples @ 16k = 32ms. 256 samples @ 8k = 32ms.
         self.chunk_duration_ms = 32
+        self.required_samples = 512 if self.target_sr == 16000 else 256
+        self.chunk_size = self.required_samples * 2
+
+        # Audio accumulation: circular buffer + reusable float32 window
+        self.buffer = AudioRingBuffer(capacity=self.chunk_size * 8)
+        self._window = np.empty(self.required_samples, dtype=np.float32)
 
         # Confirmation window
         self.confirmation_window_ms = getattr(self.config, 'vad_confirmation_window_ms', 200)
@@ -75,7 +83,7 @@ class VADProcessor(FrameProcessor):
         self._init_model()
 
     def _init_model(self):
-        """Locate and load Silero ONNX model."""
+        """Locate Silero ONNX model and register a stream on the shared engine."""
         try:
             # Try standard relative path first
             model_path = Path("app-nuevo/assets/models/vad/silero_vad.onnx")
@@ -86,7 +94,8 @@ class VADProcessor(FrameProcessor):
                   model_path = Path.cwd() / "app-nuevo" / "assets" / "models" / "vad" / "silero_vad.onnx"
 
             if model_path.exists():
-                self.vad_model = SileroOnnxModel(str(model_path))
+                self.vad_engine = get_vad_engine(str(model_path))
+                self.vad_stream = self.vad_engine.create_stream(self.target_sr)
             else:
                  logger.warning(f"⚠️ Silero ONNX model not found at {model_path}. VAD disabled.")
 
@@ -104,26 +113,19 @@ class VADProcessor(FrameProcessor):
             await self.push_frame(frame, direction)
 
     async def _process_audio(self, frame: AudioFrame):
-        if not self.vad_model:
+        if not self.vad_stream:
             return
 
         # 1. Add to buffer
-        self.buffer.extend(frame.data)
+        self.buffer.write(frame.data)
 
         # 2. Process in correct chunk sizes (Silero Requirement)
-        required_samples = 512 if self.target_sr == 16000 else 256
-        chunk_size = required_samples * 2
-
-        while len(self.buffer) >= chunk_size:
-            chunk_bytes = self.buffer[:chunk_size]
-            self.buffer = self.buffer[chunk_size:]
-
-            # Convert bytes to float32 numpy array
-            audio_int16 = np.frombuffer(chunk_bytes, dtype=np.int16)
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        while self.buffer.readable >= self.chunk_size:
+            # Convert PCM16 into the reusable float32 window (in place)
+            audio_float32 = self.buffer.read_pcm16_float32(self._window)
 
             try:
-                confidence = self.vad_model(audio_float32, self.target_sr)
+                confidence = await self.vad_engine.infer(self.vad_stream, audio_float32)
             except Exception as e:
                 logger.error(f"VAD Inference Error: {e}")
                 confidence = 0.0
@@ -171,8 +173,20 @@ class VADProcessor(FrameProcessor):
                     if self.detect_turn_end.should_end_turn(silence_ms):
                         self.speaking = False
                         logger.info(f"🤫 [VAD] User STOP speaking (Silence: {silence_ms}ms)")
+                        self._notify_speech(False)
                         await self.push_frame(UserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM)
 
+    def set_speech_listener(self, listener):
+        """Report speech start/stop to `listener(active)` (e.g. STTProcessor.set_speech_active)."""
+        self._speech_listener = listener
+
+    def _notify_speech(self, active: bool):
+        if self._speech_listener:
+            try:
+                self._speech_listener(active)
+            except Exception as e:
+                logger.error(f"VAD speech listener error: {e}")
+
     async def _trigger_start_speaking(self, confidence: float, immediate: bool, elapsed: float = 0):
         """Helper to emit start speaking events."""
         self.speaking = True
@@ -180,6 +194,7 @@ class VADProcessor(FrameProcessor):
 
         msg_type = "Immediate" if immediate else f"Confirmed ({int(elapsed)}ms)"
         logger.info(f"🗣️ [VAD] User START speaking [{msg_type}] (Conf: {confidence:.2f})")
+        self._notify_speech(True)
 
         await self.push_frame(UserStartedSpeakingFrame(), FrameDirection.DOWNSTREAM)
 
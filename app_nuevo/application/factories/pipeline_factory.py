@@ -13,7 +13,7 @@ from app_nuevo.infrastructure.services.crm_service import CRMService
 from app_nuevo.application.components.hold_audio import HoldAudioPlayer
 
 # New Services
-from app_nuevo.application.services.pipeline_service import PipelineService, FrameProcessor
+from app_nuevo.application.services.pipeline_service import EXECUTION_MODE_INLINE, PipelineService, FrameProcessor
 from app_nuevo.application.common.frame_processor import FrameDirection
 
 # Ports (New)
@@ -25,6 +25,7 @@ from app_nuevo.domain.use_cases import DetectTurnEndUseCase, ExecuteToolUseCase
 
 # Processors (Application Components)
 from app_nuevo.application.components.context_aggregator import ContextAggregator
+from app_nuevo.application.components.filler_processor import FillerProcessor
 from app_nuevo.application.components.llm_processor import LLMProcessor
 from app_nuevo.application.components.metrics_processor import MetricsProcessor
 from app_nuevo.application.components.transcript_reporter import TranscriptReporter
@@ -98,6 +99,7 @@ class PipelineFactory:
             detect_turn_end=detect_turn_end,
             control_channel=control_channel
         )
+        vad.set_speech_listener(stt.set_speech_active)  # STT failover: stall = speech without results
 
         # 3. Context Aggregator
         agg = ContextAggregator(
@@ -131,17 +133,36 @@ class PipelineFactory:
             transcript_callback=transcript_callback # [FEEDBACK] Direct Reporting
         )
 
-        # 5. TTS Processor
+        # 5. Filler Processor (latency masking, only when the profile enables it)
+        filler = FillerProcessor(tts_port, config)
+
+        # 6. TTS Processor
         tts = TTSProcessor(tts_port, config)
 
-        # 6. Metrics Processor
+        # 7. Metrics Processor
         metrics = MetricsProcessor(config)
 
-        # 7. Output Sink
+        # 8. Output Sink
         output_sink = PipelineOutputSink(orchestrator_ref)
 
         # Assemble Pipeline
         processors = [stt, vad, agg, llm, tts, metrics, output_sink]
-        logger.info(f"🏭 [Factory] Pipeline assembled with {len(processors)} processors")
+        if filler.enabled:
+            processors.insert(processors.index(tts), filler)
+        # Profile setting (AgentConfig.pipeline_execution_mode[_phone|_telnyx])
+        execution_mode = getattr(config, 'pipeline_execution_mode', None) or EXECUTION_MODE_INLINE
+        hop_queue_size = getattr(config, 'pipeline_hop_queue_size', None) or 50
+        logger.info(
+            f"🏭 [Factory] Pipeline assembled with {len(processors)} processors "
+            f"(mode: {execution_mode})"
+        )
+
+        pipeline = PipelineService(
+            processors,
+            execution_mode=execution_mode,
+            hop_queue_size=hop_queue_size
+        )
 
-        return PipelineService(processors)
+        # Recognizer results enter through the pipeline queue (ordered with everything else)
+        stt.set_event_sink(pipeline.queue_frame)
+        return pipeline
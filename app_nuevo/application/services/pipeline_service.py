@@ -9,6 +9,10 @@ from app_nuevo.application.common.frame_processor import FrameDirection, FramePr
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Execution modes
+EXECUTION_MODE_INLINE = "inline"  # push_frame awaits the whole downstream chain
+EXECUTION_MODE_TASK = "task"      # each processor owns a bounded inbox + task
+
 class PipelineSource(FrameProcessor):
     """
     Entry point of the pipeline.
@@ -51,15 +55,26 @@ class PipelineService(FrameProcessor):
     - Backpressure Management: Monitors queue size to prevent OOM.
     - Priority Queue: Ensures SystemFrames bypass traffic congestion.
     - Dropped Frame Tracking: Monitors system health under load.
+    - Execution Modes: 'inline' chains processors by awaiting each hop;
+      'task' gives every processor its own bounded inbox, so a slow stage
+      (LLM/TTS) only holds back its producers once its inbox is full.
     """
 
-    def __init__(self, processors: list[FrameProcessor] | None = None, max_queue_size: int = 100):
+    def __init__(
+        self,
+        processors: list[FrameProcessor] | None = None,
+        max_queue_size: int = 100,
+        execution_mode: str = EXECUTION_MODE_INLINE,
+        hop_queue_size: int = 50
+    ):
         """
         Initialize pipeline.
 
         Args:
             processors: List of frame processors
             max_queue_size: Maximum queue size (default 100)
+            execution_mode: 'inline' (default) or 'task'
+            hop_queue_size: Inbox size per processor in 'task' mode (default 50)
         """
         super().__init__(name="Pipeline")
         self._source = PipelineSource(self._handle_upstream)
@@ -82,6 +97,12 @@ class PipelineService(FrameProcessor):
         self._backpressure_warning_sent = False
         self._dropped_frames_count = 0
 
+        # Execution mode
+        if execution_mode not in (EXECUTION_MODE_INLINE, EXECUTION_MODE_TASK):
+            raise ValueError(f"Unknown pipeline execution mode: {execution_mode}")
+        self.execution_mode = execution_mode
+        self.hop_queue_size = hop_queue_size
+
     def _link_processors(self):
         prev = self._processors[0]
         for curr in self._processors[1:]:
@@ -98,7 +119,13 @@ class PipelineService(FrameProcessor):
         # ✅ Start all processors (initializes background workers like TTS)
         for processor in self._processors:
             await processor.start()
-        
+
+        # Task mode: every hop after the source consumes its own inbox
+        if self.execution_mode == EXECUTION_MODE_TASK:
+            for processor in self._processors[1:]:
+                processor.enable_inbox(self.hop_queue_size)
+            logger.info(f"Pipeline running in task mode (hop queue size: {self.hop_queue_size})")
+
         self._task = asyncio.create_task(self._process_queue())
         logger.info("Pipeline started.")
 
@@ -111,6 +138,7 @@ class PipelineService(FrameProcessor):
                 await self._task
 
         for p in self._processors:
+            await p.disable_inbox()
             await p.cleanup()
         logger.info("Pipeline stopped.")
 
@@ -207,6 +235,25 @@ class PipelineService(FrameProcessor):
                 # Prevent tight loop in case of persistent error
                 await asyncio.sleep(0.1)
 
+    def get_queue_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get queue depth statistics for the ingress queue and every hop.
+
+        Returns:
+            Dictionary keyed by processor name ('Pipeline' for the ingress queue).
+            Hop entries are only populated in 'task' mode.
+        """
+        stats = {
+            self.name: {
+                'depth': self._queue.qsize(),
+                'max_size': self.max_queue_size,
+                'dropped': self._dropped_frames_count
+            }
+        }
+        for processor in self._processors[1:]:
+            stats[processor.name] = processor.get_inbox_stats()
+        return stats
+
     # --- FrameProcessor Interface Override ---
 
     async def process_frame(self, frame: Frame, direction: int):
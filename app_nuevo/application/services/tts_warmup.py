@@ -0,0 +1,59 @@
+"""
+TTS Warm-up Service.
+
+Pre-renders each profile's greeting (and filler clips, when enabled) into the
+TTS cache at startup, so the first words of a call are served from cache
+instead of waiting on synthesis.
+"""
+import logging
+
+from app_nuevo.application.components.filler_processor import filler_phrases
+from app_nuevo.application.components.tts_processor import TTSProcessor
+from app_nuevo.domain.ports import ConfigRepositoryPort, TTSPort
+
+logger = logging.getLogger(__name__)
+
+# Constants
+WARMUP_PROFILES = ("browser", "twilio", "telnyx")
+
+
+async def prerender_greetings(
+    tts_port: TTSPort,
+    config_repo: ConfigRepositoryPort,
+    profiles: tuple[str, ...] = WARMUP_PROFILES
+) -> int:
+    """
+    Render the speak-first greeting and the filler clips of every profile
+    into the TTS cache.
+
+    No-op when the TTS port has no cache (no `prerender` method).
+
+    Returns:
+        Number of utterances rendered (already cached ones excluded).
+    """
+    if not hasattr(tts_port, 'prerender'):
+        return 0
+
+    rendered = 0
+    for profile in profiles:
+        try:
+            config = await config_repo.get_config(profile=profile)
+        except Exception as e:
+            logger.warning(f"⚠️ [TTS Warmup] No config for profile '{profile}': {e}")
+            continue
+
+        texts = list(filler_phrases(config))
+        greeting = getattr(config, 'first_message', None)
+        mode = getattr(config, 'first_message_mode', None) or 'speak-first'
+        if greeting and mode == 'speak-first':
+            texts.insert(0, greeting)
+
+        for text in texts:
+            request = TTSProcessor.build_request(config, text, client_type=profile)
+            try:
+                if not await tts_port.prerender(request):
+                    rendered += 1
+            except Exception as e:
+                logger.warning(f"⚠️ [TTS Warmup] '{text[:30]}' for '{profile}' failed: {e}")
+
+    return rendered
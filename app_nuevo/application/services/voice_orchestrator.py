@@ -18,6 +18,8 @@ from typing import Any
 from app_nuevo.application.services.pipeline_service import PipelineService
 from app_nuevo.application.factories.pipeline_factory import PipelineFactory
 from app_nuevo.infrastructure.services.audio_manager import AudioManager
+from app_nuevo.infrastructure.audio.mixer import DEFAULT_AMBIENCE_GAIN
+from app_nuevo.infrastructure.audio.codecs import AudioDecoder
 from app_nuevo.domain.value_objects.frames import AudioFrame, TextFrame
 from app_nuevo.domain.value_objects.voice_config import VoiceConfig  # Assuming migrated or compatible
 # FIXME: ConversationFSM and ConversationState don't exist in domain layer
@@ -93,8 +95,7 @@ class VoiceOrchestratorService:
         self.config = None
         self.conversation_history = []
 
-        # Managers
-        self.audio_manager = AudioManager(transport, client_type)
+        # Managers (AudioManager is created below, once the AudioConfig is known)
         self.crm_service: CRMService | None = None
 
         # Pipeline
@@ -112,6 +113,11 @@ class VoiceOrchestratorService:
         # [Refactor] Inject AudioConfig based on client_type (Ports & Adapters)
         # Use helper to map legacy string to Domain Object
         audio_config = AudioConfig.from_legacy_mode(self.client_type)
+        self.audio_config = audio_config
+        self.audio_manager = AudioManager(transport, client_type, audio_config)
+
+        # Ingress decoder: transport codec -> PCM16 once, shared by VAD/STT/metrics
+        self.audio_decoder = AudioDecoder(audio_config)
 
         # Inject into STT Port (if it accepts it)
         if hasattr(self.stt, 'audio_config'):
@@ -149,6 +155,7 @@ class VoiceOrchestratorService:
         self.start_time = time.time()
         self.last_interaction_time = time.time()
         self.monitor_task: asyncio.Task | None = None
+        self._warm_up_task: asyncio.Task | None = None
         self.active: bool = False
 
         # Decode initial context if present
@@ -179,6 +186,13 @@ class VoiceOrchestratorService:
             await self.stop()
             return
 
+        # Pre-connect TTS for this call's voice while CRM/DB/pipeline set up
+        if self.tts:
+            voice_id = getattr(self.config, 'voice_name', None)
+            if voice_id:
+                self._warm_up_task = asyncio.create_task(self.tts.warm_up(voice_id, self.audio_config))
+                self._warm_up_task.add_done_callback(self._log_warm_up_failure)
+
         # STEP 2: Initialize CRM Service
         try:
             if self.config.crm_enabled:
@@ -264,11 +278,22 @@ class VoiceOrchestratorService:
 
         logger.info("🚀 All subsystems running")
 
+    @staticmethod
+    def _log_warm_up_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            logger.warning(f"⚠️ TTS warm-up failed, first reply connects inline: {task.exception()}")
+
     async def stop(self) -> None:
         """Stop orchestrator and cleanup resources."""
         logger.info("Stopping orchestrator service...")
         self.active = False
 
+        # Cancel TTS pre-connect (still running if the call ended during setup)
+        if self._warm_up_task and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._warm_up_task
+
         # Cancel monitor task
         if self.monitor_task:
             self.monitor_task.cancel()
@@ -368,16 +393,32 @@ class VoiceOrchestratorService:
         Process incoming audio from WebSocket.
 
         Args:
-            payload: Base64 encoded audio data
+            payload: Base64 encoded audio data (transport codec)
         """
         if not self.pipeline:
             return
 
         try:
-            # Decode audio
             audio_bytes = base64.b64decode(payload)
-            if not audio_bytes:
-                return
+        except Exception as e:
+            logger.error(f"Error decoding audio payload: {e}")
+            return
+
+        await self.process_audio_bytes(audio_bytes)
+
+    async def process_audio_bytes(self, audio_bytes: bytes) -> None:
+        """
+        Process incoming raw audio (binary WebSocket frames or decoded Base64).
+
+        Args:
+            audio_bytes: Audio data in the transport codec
+        """
+        if not self.pipeline or not audio_bytes:
+            return
+
+        try:
+            # Decode audio (transport codec -> PCM16)
+            audio_bytes = self.audio_decoder.decode(bytes(audio_bytes))
 
             # Push to pipeline
             sample_rate = 16000 if self.client_type == "browser" else 8000
@@ -543,16 +584,17 @@ class VoiceOrchestratorService:
         apply_client_overlay(self.config, self.client_type)
 
         # Load background audio
-        self._load_background_audio()
+        await self._load_background_audio()
 
-    def _load_background_audio(self) -> None:
+    async def _load_background_audio(self) -> None:
         """Load background audio if configured."""
         bg_audio_enabled = getattr(self.config, 'bg_audio_enabled', False)
         if not bg_audio_enabled:
             return
 
         bg_path = getattr(self.config, 'bg_audio_path', 'assets/silence.wav')
-        self.audio_manager.load_background_audio(bg_path)
+        bg_gain = getattr(self.config, 'bg_audio_gain', DEFAULT_AMBIENCE_GAIN)
+        await self.audio_manager.load_background_audio(bg_path, gain=bg_gain)
 
     async def _build_pipeline(self) -> None:
         """Build processing pipeline using Factory."""
@@ -26,9 +26,27 @@ class ConfigDTO:
     silence_timeout_ms: int | None = None
     enable_denoising: bool | None = None
     enable_backchannel: bool | None = None
+    voice_filler_injection: bool | None = None
+    voice_backchanneling: bool | None = None
     max_duration: int | None = None
+    pipeline_execution_mode: str | None = None
+    pipeline_hop_queue_size: int | None = None
+    tts_synthesis_mode: str | None = None
+    bg_audio_gain: float | None = None
     silence_timeout_ms_phone: int | None = None
     silence_timeout_ms_telnyx: int | None = None
+    pipeline_execution_mode_phone: str | None = None
+    pipeline_execution_mode_telnyx: str | None = None
+    pipeline_hop_queue_size_phone: int | None = None
+    pipeline_hop_queue_size_telnyx: int | None = None
+    tts_synthesis_mode_phone: str | None = None
+    tts_synthesis_mode_telnyx: str | None = None
+    bg_audio_gain_phone: float | None = None
+    bg_audio_gain_telnyx: float | None = None
+    voice_filler_injection_phone: bool | None = None
+    voice_filler_injection_telnyx: bool | None = None
+    voice_backchanneling_phone: bool | None = None
+    voice_backchanneling_telnyx: bool | None = None
 
 class ConfigRepositoryPort(ABC):
     """
@@ -8,7 +8,11 @@ from typing import Any, Protocol
 
 class STTException(Exception):
     """Base exception for STT errors."""
-    pass
+    def __init__(self, message: str, retryable: bool = False, provider: str = "unknown", original_error: Exception | None = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.provider = provider
+        self.original_error = original_error
 
 @dataclass
 class STTConfig:
@@ -58,6 +62,13 @@ class STTPort(ABC):
         """
         pass
 
+    async def release_recognizer(self, recognizer: STTRecognizer) -> None:
+        """
+        Hand back a recognizer from create_recognizer() after the call
+        stopped it. Default: nothing to release.
+        """
+        return None
+
     @abstractmethod
     async def transcribe_audio(self, audio_bytes: bytes, language: str = "es") -> str:
         """
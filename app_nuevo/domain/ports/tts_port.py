@@ -1,13 +1,19 @@
 """
 Port (Interface) for Text-to-Speech (TTS) providers.
 """
+import contextlib
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any, List, Optional
 from dataclasses import dataclass
 
 class TTSException(Exception):
     """Base exception for TTS errors."""
-    pass
+    def __init__(self, message: str, retryable: bool = False, provider: str = "unknown", original_error: Exception | None = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.provider = provider
+        self.original_error = original_error
 
 @dataclass
 class TTSRequest:
@@ -49,6 +55,36 @@ class TTSPort(ABC):
         """
         pass
 
+    async def synthesize_stream(self, request: TTSRequest | Any) -> AsyncIterator[bytes]:
+        """
+        Synthesize text to audio, yielding chunks as they are produced.
+
+        Default implementation for non-streaming providers: yields the
+        complete utterance once.
+        """
+        yield await self.synthesize(request)
+
+    async def synthesize_batch_stream(self, requests: List[TTSRequest | Any]) -> AsyncIterator[tuple[int, bytes]]:
+        """
+        Synthesize consecutive utterances of one voice as a single provider
+        request (throughput mode), yielding `(index into requests, chunk)` in
+        order.
+
+        Default implementation: one synthesize_stream per request.
+        """
+        for index, request in enumerate(requests):
+            async with contextlib.aclosing(self.synthesize_stream(request)) as stream:
+                async for chunk in stream:
+                    yield index, chunk
+
+    async def warm_up(self, voice_id: str, audio_config: Any | None = None) -> None:
+        """
+        Prepare provider resources (connections) for a voice before first use.
+
+        Default implementation: nothing to prepare.
+        """
+        return None
+
     @abstractmethod
     async def synthesize_ssml(self, ssml: str) -> bytes:
         """
@@ -2,5 +2,7 @@
 Domain Services - Business Logic Layer
 """
 from .prompt_builder import PromptBuilder
+from .stt_filters import STTFilters
+from .text_segmenter import TextSegmenter
 
-__all__ = ['PromptBuilder']
+__all__ = ['PromptBuilder', 'STTFilters', 'TextSegmenter']
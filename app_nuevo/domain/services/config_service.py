@@ -6,6 +6,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Settings stored per profile as <name> (browser/default), <name>_phone, <name>_telnyx
+PROFILE_SUFFIXES = {"twilio": "_phone", "telnyx": "_telnyx"}
+PROFILE_OVERLAY_FIELDS = (
+    "pipeline_execution_mode",
+    "pipeline_hop_queue_size",
+    "tts_synthesis_mode",
+    "bg_audio_gain",
+    "voice_filler_injection",
+    "voice_backchanneling",
+)
+
 def apply_client_overlay(config, client_type: str):
     """
     Apply client-specific configuration overlays to the config object.
@@ -15,6 +26,17 @@ def apply_client_overlay(config, client_type: str):
         config: AgentConfig model instance (ORM or Pydantic)
         client_type: "browser", "twilio", or "telnyx"
     """
+    # Profile columns replace the default value when set
+    suffix = PROFILE_SUFFIXES.get(client_type)
+    if suffix:
+        for name in PROFILE_OVERLAY_FIELDS:
+            value = getattr(config, name + suffix, None)
+            if value is not None:
+                try:
+                    setattr(config, name, value)
+                except AttributeError:
+                    pass
+
     # Logic: High Fidelity vs Standard Telephony behaviors
     # "browser" implies High Fidelity / Low Latency
     if client_type == "browser":
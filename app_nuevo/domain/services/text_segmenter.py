@@ -0,0 +1,130 @@
+"""
+Domain Service: Streaming Text Segmentation.
+Splits a token stream into speakable chunks for TTS as early as prosody allows.
+"""
+import re
+import time
+from collections.abc import Callable
+
+# Sentence end: terminal punctuation (optionally closed by quotes/brackets) followed by whitespace.
+# Requiring whitespace keeps decimals ("3.5") and abbreviations mid-token intact.
+_SENTENCE_END = re.compile(r'[.?!…]+["\'»)\]]*\s')
+_CLAUSE_END = re.compile(r'[,;:]\s')
+_SENTENCE_TAIL = re.compile(r'[.?!…]+["\'»)\]]*\s*$')
+
+# Tail kept when re-scanning, so punctuation split from its trailing space across tokens still matches
+_RESCAN_TAIL = 4
+
+
+def ends_sentence(text: str) -> bool:
+    """True if the text ends on sentence punctuation."""
+    return bool(_SENTENCE_TAIL.search(text))
+
+
+class TextSegmenter:
+    """
+    Incremental clause-level segmenter for streamed LLM output.
+
+    Emits a chunk when:
+    1. A sentence ends ('.', '?', '!' + whitespace) and the chunk has >= min_chars.
+    2. A clause ends (',', ';', ':' + whitespace) and the chunk has >= clause_min_words words.
+    3. Text has been buffered for max_latency_seconds (poll()), cut at the last word boundary.
+       If there is no boundary yet (one long token), the deadline waits for more text.
+
+    Only text added since the last scan is searched, so cost per token is
+    independent of how long the current sentence has grown.
+    """
+
+    def __init__(
+        self,
+        min_chars: int = 10,
+        clause_min_words: int = 6,
+        max_latency_seconds: float | None = 0.6,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.min_chars = min_chars
+        self.clause_min_words = clause_min_words
+        self.max_latency_seconds = max_latency_seconds
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        self._buffer = ""
+        self._scan_from = 0
+        self._started_at: float | None = None
+        self._awaiting_text = False  # Deadline passed with nothing to cut
+
+    @property
+    def pending(self) -> str:
+        return self._buffer
+
+    def push(self, text: str) -> list[str]:
+        """
+        Add streamed text.
+
+        Returns:
+            Chunks ready for synthesis (possibly empty).
+        """
+        if not text:
+            return []
+        if self._started_at is None and text.strip():
+            self._started_at = self._clock()
+        self._buffer += text
+        self._awaiting_text = False
+
+        chunks = []
+        while (end := self._find_boundary()) is not None:
+            chunks.append(self._cut(end))
+        return chunks
+
+    def time_until_deadline(self) -> float | None:
+        """Seconds until poll() would force a chunk, or None if nothing is pending."""
+        if self.max_latency_seconds is None or self._started_at is None or self._awaiting_text:
+            return None
+        return max(self._started_at + self.max_latency_seconds - self._clock(), 0.0)
+
+    def poll(self) -> list[str]:
+        """Emit buffered complete words if the max-latency deadline has passed."""
+        remaining = self.time_until_deadline()
+        if remaining is None or remaining > 0:
+            return []
+
+        end = max(self._buffer.rfind(" "), self._buffer.rfind("\n")) + 1
+        if end <= 0 or not self._buffer[:end].strip():
+            # No word boundary: stays overdue, but disarmed until push() adds text
+            self._awaiting_text = True
+            return []
+        return [self._cut(end)]
+
+    def flush(self) -> str | None:
+        """Emit whatever is left (end of stream)."""
+        text = self._buffer
+        self.reset()
+        return text if text.strip() else None
+
+    def _find_boundary(self) -> int | None:
+        start = self._scan_from
+        for match in _SENTENCE_END.finditer(self._buffer, start):
+            if len(self._buffer[:match.end()].strip()) >= self.min_chars:
+                sentence_end = match.end()
+                break
+        else:
+            sentence_end = None
+
+        for match in _CLAUSE_END.finditer(self._buffer, start):
+            if sentence_end is not None and match.end() >= sentence_end:
+                break
+            if len(self._buffer[:match.end()].split()) >= self.clause_min_words:
+                return match.end()
+
+        if sentence_end is None:
+            self._scan_from = max(len(self._buffer) - _RESCAN_TAIL, 0)
+        return sentence_end
+
+    def _cut(self, end: int) -> str:
+        chunk = self._buffer[:end]
+        self._buffer = self._buffer[end:].lstrip()
+        self._scan_from = 0
+        self._started_at = self._clock() if self._buffer.strip() else None
+        self._awaiting_text = False
+        return chunk
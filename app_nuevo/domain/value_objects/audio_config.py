@@ -32,13 +32,33 @@ class AudioConfig:
             bits_per_sample=8
         )
 
+    @staticmethod
+    def telephony_alaw() -> "AudioConfig":
+        """Configuration for A-law Telephony (8kHz PCMA, e.g. Telnyx)."""
+        return AudioConfig(
+            sample_rate=8000,
+            encoding="alaw",
+            channels=1,
+            bits_per_sample=8
+        )
 
+    def as_pcm16(self) -> "AudioConfig":
+        """Same rate/channels as linear PCM16 (format after ingress decoding)."""
+        return AudioConfig(
+            sample_rate=self.sample_rate,
+            encoding="pcm",
+            channels=self.channels,
+            bits_per_sample=16
+        )
 
     @staticmethod
     def from_legacy_mode(mode: str) -> "AudioConfig":
         """Helper to convert legacy string modes."""
         if mode == "browser":
             return AudioConfig.high_quality()
+        elif mode == "telnyx":
+            # Telnyx streams are negotiated as PCMA (stream_bidirectional_codec)
+            return AudioConfig.telephony_alaw()
         else:
-            # Default to Telephony for any other mode (inc. twilio/telnyx)
+            # Default to Telephony for any other mode (inc. twilio)
             return AudioConfig.telephony()
@@ -0,0 +1,59 @@
+"""Value Object for cooperative cancellation of in-flight provider work."""
+import threading
+from collections.abc import Callable
+
+
+class CancellationToken:
+    """
+    Signals that a request's result is no longer wanted.
+
+    Thread-safe: cancel() may be called from the event loop while the work runs
+    in an SDK or executor thread. Callbacks run exactly once, on the thread
+    that cancels (or immediately if the token is already cancelled).
+
+    Usage:
+        token = CancellationToken()
+        unregister = token.add_callback(synthesizer.stop_speaking_async)
+        ...
+        token.cancel()   # -> stop_speaking_async() runs
+    """
+
+    __slots__ = ('_cancelled', '_callbacks', '_lock')
+
+    def __init__(self):
+        self._cancelled = False
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel and run registered callbacks (idempotent)."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run callback on cancellation.
+
+        Returns:
+            Function that unregisters the callback (call it when the work ends).
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
@@ -1,40 +1,75 @@
+import itertools
 import time
 import uuid
-from dataclasses import asdict, dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only metadata for frames created without explicit metadata.
+# Avoids one dict allocation per frame on the audio hot path.
+EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(kw_only=True)
+# Cheap process-unique identifiers: random per-process prefix + monotonic counter.
+_ID_PREFIX = uuid.uuid4().hex[:12]
+_id_counter = itertools.count(1)
+
+
+def _next_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+def _empty_metadata() -> Mapping[str, Any]:
+    return EMPTY_METADATA
+
+
+@dataclass(kw_only=True, slots=True)
 class Frame:
     """
     Base class for all frames in the pipeline.
 
+    Frames are slotted and allocation-light: id and span_id are generated
+    lazily on first access, trace_id falls back to a counter-based ID, and
+    frames without metadata share the read-only EMPTY_METADATA mapping.
+
     Attributes:
-        id (str): Unique identifier for the frame instance.
+        id (str): Unique identifier for the frame instance (lazy).
         name (str): Class name of the frame.
         timestamp (float): Creation time (Unix timestamp).
         trace_id (str): Distributed tracing ID (Conversational turn ID).
-        span_id (str): Span ID for this specific frame processing unit.
-        metadata (Dict[str, Any]): Arbitrary metadata.
+        span_id (str): Span ID for this specific frame processing unit (lazy).
+        metadata (Mapping[str, Any]): Arbitrary metadata (read-only when defaulted).
     """
-    id: str = field(init=False)
-    name: str = field(init=False)
     timestamp: float = field(default_factory=time.time)
 
     # Distributed Tracing Support
     trace_id: str = field(default="")
-    span_id: str = field(init=False)
 
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
 
-    def __post_init__(self):
-        self.id = str(uuid.uuid4())
-        self.span_id = str(uuid.uuid4())
-        self.name = self.__class__.__name__
+    _id: str | None = field(default=None, init=False, repr=False, compare=False)
+    _span_id: str | None = field(default=None, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
         # Generate trace_id if not provided
         if not self.trace_id:
-            self.trace_id = str(uuid.uuid4())
+            self.trace_id = _next_id()
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = _next_id()
+        return self._id
+
+    @property
+    def span_id(self) -> str:
+        if self._span_id is None:
+            self._span_id = _next_id()
+        return self._span_id
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
 
     def to_dict(self, include_binary: bool = False) -> dict[str, Any]:
         """
@@ -43,73 +78,82 @@ class Frame:
         Args:
             include_binary: If False, truncates/omits large binary fields for logging/JSON safety.
         """
-        data = asdict(self)
+        data: dict[str, Any] = {
+            "id": self.id,
+            "name": self.name,
+            "span_id": self.span_id,
+        }
+        for f in fields(self):
+            if f.name.startswith("_"):
+                continue
+            data[f.name] = getattr(self, f.name)
+        data["metadata"] = dict(self.metadata)
 
         # Helper to clean non-serializable data
-        if not include_binary and 'data' in data and isinstance(data['data'], bytes):
+        if not include_binary and isinstance(data.get('data'), bytes):
             data['data'] = f"<bytes len={len(data['data'])}>"
 
         return data
 
     def __str__(self):
-        return f"<{self.name} id={self.id[:8]}>"
+        return f"<{self.name} id={self.id}>"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SystemFrame(Frame):
     """Frames that have high priority (Level 1) and control the pipeline flow."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DataFrame(Frame):
     """Frames that carry content (audio, text, etc.) with normal priority (Level 2)."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ControlFrame(Frame):
     """Frames that modify the behavior of processors with normal priority (Level 2)."""
     pass
 
 # --- System Frames (High Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StartFrame(SystemFrame):
     """Signal to start processing or a new interaction."""
-    metadata: dict[str, Any] = field(default_factory=dict)
+    pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EndFrame(SystemFrame):
     """Signal to end processing or interaction."""
     reason: str = "normal"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CancelFrame(SystemFrame):
     """Signal to cancel current operation immediately."""
     reason: str = "cancelled"
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EndTaskFrame(SystemFrame):
     """Signal to end a specific task/tool execution."""
     task_id: str = ""
     result: dict[str, Any] = field(default_factory=dict)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ErrorFrame(SystemFrame):
     """Signal that an error has occurred."""
     error: str
     fatal: bool = False
     context: dict[str, Any] = field(default_factory=dict)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserStartedSpeakingFrame(SystemFrame):
     """Signal detected by VAD that user has started speaking."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserStoppedSpeakingFrame(SystemFrame):
     """Signal detected by VAD that user has stopped speaking."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BackpressureFrame(SystemFrame):
     """
     Backpressure signal emitted when pipeline queue is full or approaching capacity.
@@ -128,34 +172,34 @@ class BackpressureFrame(SystemFrame):
 
 # --- Data Frames (Normal Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AudioFrame(DataFrame):
     """Frame containing raw audio data."""
     data: bytes
     sample_rate: int
     channels: int = 1
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TextFrame(DataFrame):
     """Frame containing text data (transcript or response)."""
     text: str
     is_final: bool = True
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ImageFrame(DataFrame):
     """Frame containing image data."""
     data: bytes
     format: str
     size: tuple[int, int]
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RMSFrame(DataFrame):
     """Frame containing Root Mean Square audio levels (for visualization)."""
     rms: float
 
 # --- Control Frames (Normal Priority) ---
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UpdateSettingsFrame(ControlFrame):
     """Frame to update processor settings dynamically."""
     settings: dict[str, Any]
@@ -3,6 +3,8 @@ TTS Domain Value Objects.
 """
 from dataclasses import dataclass
 
+from app_nuevo.domain.value_objects.cancellation import CancellationToken
+
 @dataclass
 class VoiceMetadata:
     """Metadata de una voz disponible."""
@@ -34,6 +36,9 @@ class TTSRequest:
     # Metadata
     metadata: dict = None
 
+    # Cooperative cancellation (barge-in): adapters stop provider work when cancelled
+    cancel_token: CancellationToken | None = None
+
     def __post_init__(self):
         """Initialize default dicts if None."""
         if self.provider_options is None:
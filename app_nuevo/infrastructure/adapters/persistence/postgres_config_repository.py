@@ -107,10 +107,31 @@ class PostgresConfigRepository(ConfigRepositoryPort):
             # Advanced
             enable_denoising=model.enable_denoising,
             enable_backchannel=model.enable_backchannel,
+            voice_filler_injection=model.voice_filler_injection or False,
+            voice_backchanneling=model.voice_backchanneling or False,
             max_duration=model.max_duration,
+            # Pipeline
+            pipeline_execution_mode=model.pipeline_execution_mode or "inline",
+            pipeline_hop_queue_size=model.pipeline_hop_queue_size or 50,
+            # TTS
+            tts_synthesis_mode=model.tts_synthesis_mode or "streaming",
+            # Background audio (0.0 is a valid gain)
+            bg_audio_gain=model.bg_audio_gain if model.bg_audio_gain is not None else 0.3,
             # Provider overlays
             silence_timeout_ms_phone=model.silence_timeout_ms_phone,
             silence_timeout_ms_telnyx=model.silence_timeout_ms_telnyx,
+            pipeline_execution_mode_phone=model.pipeline_execution_mode_phone,
+            pipeline_execution_mode_telnyx=model.pipeline_execution_mode_telnyx,
+            pipeline_hop_queue_size_phone=model.pipeline_hop_queue_size_phone,
+            pipeline_hop_queue_size_telnyx=model.pipeline_hop_queue_size_telnyx,
+            tts_synthesis_mode_phone=model.tts_synthesis_mode_phone,
+            tts_synthesis_mode_telnyx=model.tts_synthesis_mode_telnyx,
+            bg_audio_gain_phone=model.bg_audio_gain_phone,
+            bg_audio_gain_telnyx=model.bg_audio_gain_telnyx,
+            voice_filler_injection_phone=model.voice_filler_injection_phone,
+            voice_filler_injection_telnyx=model.voice_filler_injection_telnyx,
+            voice_backchanneling_phone=model.voice_backchanneling_phone,
+            voice_backchanneling_telnyx=model.voice_backchanneling_telnyx,
         )
 
     def _apply_dto_to_model(self, dto: ConfigDTO, model: AgentConfig):
@@ -132,4 +153,22 @@ class PostgresConfigRepository(ConfigRepositoryPort):
         model.silence_timeout_ms = dto.silence_timeout_ms
         model.enable_denoising = dto.enable_denoising
         model.enable_backchannel = dto.enable_backchannel
+        model.voice_filler_injection = dto.voice_filler_injection
+        model.voice_backchanneling = dto.voice_backchanneling
         model.max_duration = dto.max_duration
+        model.pipeline_execution_mode = dto.pipeline_execution_mode
+        model.pipeline_hop_queue_size = dto.pipeline_hop_queue_size
+        model.pipeline_execution_mode_phone = dto.pipeline_execution_mode_phone
+        model.pipeline_execution_mode_telnyx = dto.pipeline_execution_mode_telnyx
+        model.pipeline_hop_queue_size_phone = dto.pipeline_hop_queue_size_phone
+        model.pipeline_hop_queue_size_telnyx = dto.pipeline_hop_queue_size_telnyx
+        model.tts_synthesis_mode = dto.tts_synthesis_mode
+        model.tts_synthesis_mode_phone = dto.tts_synthesis_mode_phone
+        model.tts_synthesis_mode_telnyx = dto.tts_synthesis_mode_telnyx
+        model.bg_audio_gain = dto.bg_audio_gain
+        model.bg_audio_gain_phone = dto.bg_audio_gain_phone
+        model.bg_audio_gain_telnyx = dto.bg_audio_gain_telnyx
+        model.voice_filler_injection_phone = dto.voice_filler_injection_phone
+        model.voice_filler_injection_telnyx = dto.voice_filler_injection_telnyx
+        model.voice_backchanneling_phone = dto.voice_backchanneling_phone
+        model.voice_backchanneling_telnyx = dto.voice_backchanneling_telnyx
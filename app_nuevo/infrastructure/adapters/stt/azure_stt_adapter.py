@@ -17,6 +17,7 @@ from app_nuevo.infrastructure.config.settings import settings
 from app_nuevo.infrastructure.observability.decorators import track_latency
 from app_nuevo.domain.value_objects.stt_value_objects import STTConfig, STTEvent, STTResultReason
 from app_nuevo.domain.ports.stt_port import STTException, STTPort, STTRecognizer
+from app_nuevo.infrastructure.adapters.stt.recognizer_pool import RecognizerPool
 
 
 logger = logging.getLogger(__name__)
@@ -24,9 +25,10 @@ logger = logging.getLogger(__name__)
 
 class AzureRecognizerWrapper:
     """Wrapper para eventos de Azure SDK."""
-    def __init__(self, recognizer, push_stream):
+    def __init__(self, recognizer, push_stream, connection=None):
         self._recognizer = recognizer
         self._push_stream = push_stream
+        self._connection = connection  # Pre-opened service connection (kept alive with the recognizer)
         self._callback = None
 
         # Wire events
@@ -98,6 +100,18 @@ class AzureRecognizerWrapper:
         # Only log on errors, not every packet (production noise reduction)
         self._push_stream.write(data)
 
+    def close(self):
+        """Release the service connection and the push stream (blocking)."""
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception as e:
+                logger.debug(f"[AzureSTT] Error closing connection: {e}")
+        try:
+            self._push_stream.close()
+        except Exception as e:
+            logger.debug(f"[AzureSTT] Error closing push stream: {e}")
+
 
 class AzureSTTRecognizerAdapter(STTRecognizer):
     """
@@ -140,6 +154,15 @@ class AzureSTTRecognizerAdapter(STTRecognizer):
         """Escribe datos de audio al stream."""
         self._azure_recognizer.write(audio_data)
 
+    @property
+    def native_recognizer(self):
+        """Underlying speechsdk.SpeechRecognizer."""
+        return self._azure_recognizer._recognizer
+
+    def close(self):
+        """Libera conexión y push stream (bloqueante)."""
+        self._azure_recognizer.close()
+
 
 from app_nuevo.domain.value_objects.audio_config import AudioConfig
 
@@ -177,11 +200,80 @@ class AzureSTTAdapter(STTPort):
              logger.warning("⚠️ [AzureSTT] No audio config provided, defaulting to Telephony")
              self.audio_config = AudioConfig.telephony()
 
-        self.speech_config = speechsdk.SpeechConfig(
-            subscription=self.api_key,
-            region=self.region
+        # Pre-connected recognizers per (language, format, settings); sized by call rate
+        self._pool = RecognizerPool(factory=self._build_recognizer, closer=self._close_recognizer)
+
+    def _recognizer_key(self, config: STTConfig) -> tuple:
+        """Pool key: everything baked into a recognizer at construction."""
+        # Determine Audio Config dynamically from STTConfig (per call)
+        # This fixes the bug where global adapter init (Twilio default) overrode Browser calls
+        local_audio_config = self.audio_config # Fallback
+
+        if hasattr(config, 'audio_mode') and config.audio_mode:
+            if config.audio_mode == 'browser':
+                local_audio_config = AudioConfig.high_quality()
+                logger.info("🎤 [AzureSTT] Configured for Browser (16kHz PCM)")
+            elif config.audio_mode == 'twilio':
+                local_audio_config = AudioConfig.telephony()
+                logger.info("📞 [AzureSTT] Configured for Twilio (8kHz Mulaw)")
+
+        # Formato: the pipeline decodes G.711 at ingress, so the push stream
+        # always receives PCM16 at the transport sample rate.
+        pcm_config = local_audio_config.as_pcm16()
+        return (
+            config.language,
+            pcm_config.sample_rate,
+            pcm_config.bits_per_sample,
+            pcm_config.channels,
+            config.initial_silence_ms,
+            config.segmentation_silence_ms
         )
 
+    def _build_recognizer(self, key: tuple) -> "AzureSTTRecognizerAdapter":
+        """
+        New recognizer with its service connection pre-opened (blocking).
+
+        Uses its own SpeechConfig: pool refills run in executor threads
+        concurrently with call-time builds.
+        """
+        language, sample_rate, bits_per_sample, channels, initial_silence_ms, segmentation_silence_ms = key
+        speech_config = speechsdk.SpeechConfig(subscription=self.api_key, region=self.region)
+        speech_config.speech_recognition_language = language
+
+        # Apply Timeouts
+        speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs, str(initial_silence_ms))
+        speech_config.set_property(speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, str(segmentation_silence_ms))
+
+        format = speechsdk.audio.AudioStreamFormat(
+            samples_per_second=sample_rate,
+            bits_per_sample=bits_per_sample,
+            channels=channels
+        )
+        push_stream = speechsdk.audio.PushAudioInputStream(stream_format=format)
+        audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
+
+        azure_native_recognizer = speechsdk.SpeechRecognizer(
+            speech_config=speech_config,
+            audio_config=audio_config
+        )
+
+        connection = None
+        try:
+            # Open the service WebSocket now instead of at start_continuous_recognition
+            connection = speechsdk.Connection.from_recognizer(azure_native_recognizer)
+            connection.open(True)
+        except Exception as e:
+            logger.warning(f"⚠️ [AzureSTT] Pre-open failed for {language}: {e}")
+
+        wrapper = AzureRecognizerWrapper(azure_native_recognizer, push_stream, connection)
+
+        # Wrap in our hexagonal adapter
+        return AzureSTTRecognizerAdapter(wrapper)
+
+    @staticmethod
+    def _close_recognizer(recognizer: "AzureSTTRecognizerAdapter") -> None:
+        recognizer.close()
+
     @circuit(failure_threshold=3, recovery_timeout=60, expected_exception=STTException)
     def create_recognizer(
         self,
@@ -191,40 +283,17 @@ class AzureSTTAdapter(STTPort):
     ) -> STTRecognizer:
         """
         Crea recognizer configurado según STTConfig.
+
+        Served pre-connected from the pool when one is ready (checked out on
+        the event loop); built inline otherwise.
         """
         try:
-            self.speech_config.speech_recognition_language = config.language
-
-            # Apply Timeouts
-            self.speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs, str(config.initial_silence_ms))
-            self.speech_config.set_property(speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, str(config.segmentation_silence_ms))
-
-            # Determine Audio Config dynamically from STTConfig (per call)
-            # This fixes the bug where global adapter init (Twilio default) overrode Browser calls
-            local_audio_config = self.audio_config # Fallback
-            
-            if hasattr(config, 'audio_mode') and config.audio_mode:
-                if config.audio_mode == 'browser':
-                    local_audio_config = AudioConfig.high_quality()
-                    logger.info("🎤 [AzureSTT] Configured for Browser (16kHz PCM)")
-                elif config.audio_mode == 'twilio':
-                    local_audio_config = AudioConfig.telephony()
-                    logger.info("📞 [AzureSTT] Configured for Twilio (8kHz Mulaw)")
-            
-            # Formato
-            format = speechsdk.audio.AudioStreamFormat(
-                samples_per_second=local_audio_config.sample_rate,
-                bits_per_sample=local_audio_config.bits_per_sample, 
-                channels=local_audio_config.channels
-            )
-
-            push_stream = speechsdk.audio.PushAudioInputStream(stream_format=format)
-            audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
+            key = self._recognizer_key(config)
 
-            azure_native_recognizer = speechsdk.SpeechRecognizer(
-                speech_config=self.speech_config,
-                audio_config=audio_config
-            )
+            # Legacy barge-in callbacks are per call: never attach them to a pooled recognizer
+            recognizer = None if on_interruption_callback else self._pool.checkout(key)
+            if recognizer is None:
+                recognizer = self._build_recognizer(key)
 
             # Barge-in Logic (Legacy Support)
             if on_interruption_callback and event_loop:
@@ -235,12 +304,9 @@ class AzureSTTAdapter(STTPort):
                              event_loop.call_soon_threadsafe(
                                 lambda: asyncio.create_task(on_interruption_callback(text))
                             )
-                azure_native_recognizer.recognizing.connect(recognizing_cb)
+                recognizer.native_recognizer.recognizing.connect(recognizing_cb)
 
-            wrapper = AzureRecognizerWrapper(azure_native_recognizer, push_stream)
-
-            # Wrap in our hexagonal adapter
-            return AzureSTTRecognizerAdapter(wrapper)
+            return recognizer
 
         except Exception as e:
             logger.error(f"Azure STT recognizer creation failed: {e}")
@@ -248,6 +314,15 @@ class AzureSTTAdapter(STTPort):
                 raise STTException("Azure STT authentication failed", retryable=False, provider="azure", original_error=e) from e
             raise STTException(f"Could not create recognizer: {e!s}", retryable=True, provider="azure", original_error=e) from e
 
+    async def release_recognizer(self, recognizer: STTRecognizer) -> None:
+        """Destroy a call's recognizer (single-use; the pool builds fresh ones)."""
+        if isinstance(recognizer, AzureSTTRecognizerAdapter):
+            await asyncio.get_running_loop().run_in_executor(None, recognizer.close)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Recognizer pool statistics (hits, misses, hit_ratio, idle, targets, ...)."""
+        return self._pool.get_stats()
+
     # @track_latency("azure_stt") # TODO: Migrate Observability
     async def transcribe_audio(self, audio_bytes: bytes, language: str = "es") -> str:
         """
@@ -281,5 +356,5 @@ class AzureSTTAdapter(STTPort):
             ) from e
 
     async def close(self):
-        """Limpia."""
-        pass
+        """Cierra los recognizers inactivos del pool."""
+        await self._pool.close()
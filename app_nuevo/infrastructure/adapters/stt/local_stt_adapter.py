@@ -0,0 +1,214 @@
+"""
+Local STT Adapter - CPU-only offline recognizer implementing STTPort.
+
+Streams call audio to the shared local STT worker pool (Vosk/Kaldi models on
+disk) and emits the same partial/final events as AzureSTTAdapter. No network
+round trip: latency depends only on local CPU, which makes it a stable
+fallback inside STTWithFallback and allows fully offline load tests.
+"""
+import asyncio
+import io
+import logging
+import threading
+import wave
+from collections.abc import Callable
+from typing import Any
+
+from app_nuevo.infrastructure.config.settings import settings
+from app_nuevo.infrastructure.ml.local_stt_engine import (
+    EVENT_CLOSED,
+    EVENT_ERROR,
+    EVENT_FINAL,
+    EVENT_PARTIAL,
+    LocalSTTWorkerPool,
+    VoskEngine,
+    get_local_stt_pool,
+)
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.domain.value_objects.stt_value_objects import STTConfig, STTEvent, STTResultReason
+from app_nuevo.domain.ports.stt_port import STTException, STTPort, STTRecognizer
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_CHUNK_MS = 100  # Audio sent to the worker per message (20ms frames are coalesced)
+STOP_TIMEOUT_SECONDS = 5.0
+DEFAULT_TRANSCRIBE_SAMPLE_RATE = 16000  # Headerless audio given to transcribe_audio()
+
+
+class _Completed:
+    """Already-resolved future for the legacy `*_async().get()` interface."""
+
+    def __init__(self, wait: Callable[[], Any] | None = None):
+        self._wait = wait
+
+    def get(self):
+        return self._wait() if self._wait else None
+
+
+class LocalSTTRecognizer(STTRecognizer):
+    """
+    One call's stream on the shared worker pool.
+
+    Callbacks run on the pool's dispatcher thread (as Azure callbacks run on
+    SDK threads).
+    """
+
+    def __init__(self, pool: LocalSTTWorkerPool, language: str, sample_rate: int, chunk_ms: int = DEFAULT_CHUNK_MS):
+        self.pool = pool
+        self.language = language
+        self.sample_rate = sample_rate
+        self.error: str | None = None
+
+        self._callback: Callable[[STTEvent], None] | None = None
+        self._chunk_bytes = sample_rate * 2 * chunk_ms // 1000
+        self._buffer = bytearray()
+        self._buffer_lock = threading.Lock()
+        self._stream_id: int | None = None
+        self._closed = threading.Event()
+
+    def subscribe(self, callback: Callable[[STTEvent], None]):
+        self._callback = callback
+
+    async def start_continuous_recognition(self):
+        self._open()
+
+    def start_continuous_recognition_async(self):
+        """Legacy support for STTProcessor (`.get()` in an executor)."""
+        self._open()
+        return _Completed()
+
+    async def stop_continuous_recognition(self):
+        await asyncio.to_thread(self._close)
+
+    def stop_continuous_recognition_async(self):
+        """Legacy support for STTProcessor (`.get()` in an executor)."""
+        return _Completed(self._close)
+
+    def write(self, audio_data: bytes):
+        """PCM16 mono at `sample_rate`; forwarded to the worker in chunk_ms blocks."""
+        with self._buffer_lock:
+            self._buffer += audio_data
+            if self._stream_id is None or len(self._buffer) < self._chunk_bytes:
+                return
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+        self.pool.write(self._stream_id, chunk)
+
+    def _open(self):
+        if self._stream_id is not None:
+            return
+        self._stream_id = self.pool.open_stream(self.language, self.sample_rate, self._on_result)
+        logger.info(f"🧠 [LocalSTT] Stream {self._stream_id} started ({self.language}, {self.sample_rate} Hz)")
+
+    def _close(self):
+        """Flush buffered audio, then wait for the last final (blocking)."""
+        if self._stream_id is None or self._closed.is_set():
+            return
+        with self._buffer_lock:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+        if chunk:
+            self.pool.write(self._stream_id, chunk)
+        self.pool.close_stream(self._stream_id)
+        if not self._closed.wait(STOP_TIMEOUT_SECONDS):
+            logger.warning(f"⚠️ [LocalSTT] Stream {self._stream_id} did not close within {STOP_TIMEOUT_SECONDS}s")
+
+    def _on_result(self, kind: str, text: str, value: Any):
+        if kind == EVENT_CLOSED:
+            self._closed.set()
+            return
+        if kind == EVENT_ERROR:
+            self.error = text
+            self._closed.set()
+            event = STTEvent(reason=STTResultReason.CANCELED, text="", error_details=text)
+        elif kind == EVENT_FINAL:
+            logger.info(f"👂 [LOCAL_STT] FINAL: '{text}' (Duration: {value / 10_000_000:.2f}s)")
+            event = STTEvent(reason=STTResultReason.RECOGNIZED_SPEECH, text=text, duration=value)
+        elif kind == EVENT_PARTIAL:
+            event = STTEvent(reason=STTResultReason.RECOGNIZING_SPEECH, text=text, duration=value)
+        else:
+            return
+
+        if self._callback:
+            self._callback(event)
+
+
+class LocalSTTAdapter(STTPort):
+    """
+    Offline STT adapter (CPU workers shared by all calls).
+    Implements STTPort.
+    """
+
+    def __init__(self, config: Any | None = None, model_dir: str | None = None, workers: int | None = None):
+        """
+        Args:
+            config: Settings-like object (LOCAL_STT_MODEL_DIR, LOCAL_STT_WORKERS) or None
+            model_dir: Directory with one model folder per language (overrides config)
+            workers: Worker processes, 0 = one per core (overrides config)
+        """
+        self.model_dir = model_dir or getattr(config, 'LOCAL_STT_MODEL_DIR', None) or settings.LOCAL_STT_MODEL_DIR
+        self.workers = workers if workers is not None else getattr(config, 'LOCAL_STT_WORKERS', settings.LOCAL_STT_WORKERS)
+        self.engine = VoskEngine(self.model_dir)
+
+    @property
+    def pool(self) -> LocalSTTWorkerPool:
+        return get_local_stt_pool(self.engine, self.workers)
+
+    def available(self, language: str) -> bool:
+        """True if a model for the language is installed."""
+        return self.engine.available(language)
+
+    def create_recognizer(
+        self,
+        config: STTConfig,
+        on_interruption_callback: Callable | None = None,
+        event_loop: Any | None = None
+    ) -> STTRecognizer:
+        if not self.available(config.language):
+            raise STTException(
+                f"No local STT model for '{config.language}' in {self.model_dir}",
+                retryable=False,
+                provider="local"
+            )
+        # The pipeline decodes G.711 at ingress: the recognizer receives PCM16
+        sample_rate = AudioConfig.from_legacy_mode(getattr(config, 'audio_mode', None) or 'twilio').sample_rate
+        return LocalSTTRecognizer(self.pool, config.language, sample_rate)
+
+    async def transcribe_audio(self, audio_bytes: bytes, language: str = "es") -> str:
+        """
+        Transcribe a complete clip (WAV PCM16 mono, or headerless PCM16 @ 16kHz).
+        """
+        if not self.available(language):
+            raise STTException(f"No local STT model for '{language}'", retryable=False, provider="local")
+
+        try:
+            sample_rate, pcm = self._read_pcm16(audio_bytes)
+        except (wave.Error, ValueError) as e:
+            raise STTException(f"Unsupported audio: {e!s}", retryable=False, provider="local", original_error=e) from e
+
+        finals: list[str] = []
+        recognizer = LocalSTTRecognizer(self.pool, language, sample_rate)
+        recognizer.subscribe(
+            lambda evt: finals.append(evt.text) if evt.reason == STTResultReason.RECOGNIZED_SPEECH else None
+        )
+        await recognizer.start_continuous_recognition()
+        recognizer.write(pcm)
+        await recognizer.stop_continuous_recognition()
+
+        if recognizer.error:
+            raise STTException(f"Local transcription failed: {recognizer.error}", retryable=True, provider="local")
+        return " ".join(finals)
+
+    @staticmethod
+    def _read_pcm16(audio_bytes: bytes) -> tuple[int, bytes]:
+        if audio_bytes[:4] != b"RIFF":
+            return DEFAULT_TRANSCRIBE_SAMPLE_RATE, audio_bytes
+        with wave.open(io.BytesIO(audio_bytes)) as wav:
+            if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+                raise ValueError("expected 16-bit mono WAV")
+            return wav.getframerate(), wav.readframes(wav.getnframes())
+
+    async def close(self):
+        """The worker pool is process-wide (stopped at app shutdown)."""
+        pass
@@ -0,0 +1,277 @@
+"""
+STT Recognizer Pool.
+
+Keeps pre-built, pre-connected streaming recognizers keyed by (language,
+audio format, recognizer settings), so answering a call does not pay the
+recognizer construction and service handshake on its critical path.
+
+Recognizers are single-use: a call checks one out at start and destroys it
+at cleanup (it carries that call's stream state). The pool refills in the
+background and sizes each key from its recent call arrival rate: enough idle
+recognizers to cover the calls expected while replacements are being built.
+"""
+import asyncio
+import bisect
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_MAX_IDLE = 16                # Idle recognizers across all keys
+DEFAULT_MAX_IDLE_PER_KEY = 8
+DEFAULT_MAX_IDLE_SECONDS = 120.0     # Pre-opened connections go stale: rebuilt after this
+DEFAULT_RATE_WINDOW_SECONDS = 60.0   # Arrival rate measured over this window
+BURST_WINDOW_SECONDS = 10.0          # ...and over this one, so the pool grows quickly in a burst
+DEFAULT_KEY_TTL_SECONDS = 600.0      # Keys without calls for this long are not kept warm
+REFILL_LEAD_SECONDS = 1.0            # Scheduling slack added to the measured build time
+BURST_FACTOR = 2.0                   # Headroom over the expected arrivals
+MAINTENANCE_INTERVAL_SECONDS = 5.0
+MAX_CONCURRENT_BUILDS = 4
+
+
+@dataclass(slots=True)
+class PooledRecognizer:
+    key: Hashable
+    recognizer: Any
+    created_at: float
+
+
+class RecognizerPool:
+    """
+    Adaptive pool of pre-warmed recognizers.
+
+    Usage:
+        pool = RecognizerPool(factory=build_recognizer, closer=close_recognizer)
+        recognizer = pool.checkout(key)          # None on a miss: build inline
+        ...
+        await pool.close()
+
+    Loop-only: checkout() and the refill task run on the event loop; the
+    blocking factory/closer run in the default executor.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Hashable], Any],
+        closer: Callable[[Any], None],
+        max_idle: int = DEFAULT_MAX_IDLE,
+        max_idle_per_key: int = DEFAULT_MAX_IDLE_PER_KEY,
+        max_idle_seconds: float = DEFAULT_MAX_IDLE_SECONDS,
+        rate_window_seconds: float = DEFAULT_RATE_WINDOW_SECONDS
+    ):
+        """
+        Args:
+            factory: Builds and pre-connects a recognizer for a key (blocking)
+            closer: Releases a recognizer that is never handed out (blocking)
+            max_idle: Idle recognizers kept across all keys
+            max_idle_per_key: Upper bound of the adaptive per-key size
+            max_idle_seconds: Idle recognizers older than this are rebuilt
+            rate_window_seconds: Window of the arrival rate estimate
+        """
+        self._factory = factory
+        self._closer = closer
+        self.max_idle = max_idle
+        self.max_idle_per_key = max_idle_per_key
+        self.max_idle_seconds = max_idle_seconds
+        self.rate_window_seconds = rate_window_seconds
+
+        self._idle: dict[Hashable, deque[PooledRecognizer]] = {}
+        self._arrivals: dict[Hashable, deque[float]] = {}
+        self._last_seen: dict[Hashable, float] = {}
+        self._building: dict[Hashable, int] = {}
+        self._builds: set[asyncio.Task] = set()
+        self._build_slots: asyncio.Semaphore | None = None
+        self._build_seconds = 0.5  # EWMA of factory latency (seeded)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'created': 0,
+            'expired': 0,
+            'trimmed': 0,
+            'build_failures': 0
+        }
+
+    # --- Call path ---
+
+    def checkout(self, key: Hashable) -> Any | None:
+        """
+        Take a warm recognizer for this key, or None (miss: caller builds one).
+        Every checkout counts as a call arrival for the key's pool size.
+        """
+        now = time.monotonic()
+        self._arrivals.setdefault(key, deque()).append(now)
+        self._last_seen[key] = now
+        self._ensure_running()
+
+        entries = self._idle.get(key)
+        recognizer = None
+        while entries:
+            entry = entries.popleft()
+            if now - entry.created_at < self.max_idle_seconds:
+                recognizer = entry.recognizer
+                break
+            self._stats['expired'] += 1
+            self._discard(entry)
+
+        self._stats['hits' if recognizer is not None else 'misses'] += 1
+        if self._wake:
+            self._wake.set()
+        return recognizer
+
+    def target_size(self, key: Hashable) -> int:
+        """
+        Idle recognizers wanted for a key: the calls expected to arrive while a
+        replacement is being built (rate x build time), with burst headroom.
+        """
+        now = time.monotonic()
+        arrivals = self._arrivals.get(key)
+        if arrivals is None:
+            return 0
+        while arrivals and now - arrivals[0] > self.rate_window_seconds:
+            arrivals.popleft()
+        if not arrivals:
+            # Quiet key: keep one warm until the key expires
+            return 1 if now - self._last_seen.get(key, 0.0) < DEFAULT_KEY_TTL_SECONDS else 0
+
+        # Grow on the short window, shrink on the long one
+        recent = len(arrivals) - bisect.bisect_left(arrivals, now - BURST_WINDOW_SECONDS)
+        rate = max(len(arrivals) / self.rate_window_seconds, recent / BURST_WINDOW_SECONDS)
+        expected = rate * (self._build_seconds + REFILL_LEAD_SECONDS) * BURST_FACTOR
+        return min(self.max_idle_per_key, max(1, math.ceil(expected)))
+
+    # --- Background refill ---
+
+    def _ensure_running(self) -> None:
+        if self._closed:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop (sync caller): pool stays cold
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._build_slots = asyncio.Semaphore(MAX_CONCURRENT_BUILDS)
+            self._task = loop.create_task(self._maintain())
+
+    async def _maintain(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), MAINTENANCE_INTERVAL_SECONDS)
+            self._wake.clear()
+            try:
+                self._rebalance()
+            except Exception as e:
+                logger.warning(f"⚠️ [STT Pool] Refill failed: {e}")
+
+    def _rebalance(self) -> None:
+        now = time.monotonic()
+        for key in list(self._arrivals):
+            entries = self._idle.setdefault(key, deque())
+
+            # Expire stale connections
+            while entries and now - entries[0].created_at >= self.max_idle_seconds:
+                self._stats['expired'] += 1
+                self._discard(entries.popleft())
+
+            target = self.target_size(key)
+
+            # Shrink when the rate dropped
+            while len(entries) > target:
+                self._stats['trimmed'] += 1
+                self._discard(entries.popleft())
+
+            if target == 0 and not self._building.get(key):
+                self._arrivals.pop(key, None)
+                self._idle.pop(key, None)
+                self._last_seen.pop(key, None)
+                continue
+
+            missing = target - len(entries) - self._building.get(key, 0)
+            room = self.max_idle - self.idle_count - sum(self._building.values())
+            for _ in range(max(0, min(missing, room))):
+                # Counted now so the next rebalance doesn't build the same deficit again
+                self._building[key] = self._building.get(key, 0) + 1
+                task = self._loop.create_task(self._build(key))
+                self._builds.add(task)
+                task.add_done_callback(self._builds.discard)
+
+    async def _build(self, key: Hashable) -> None:
+        try:
+            async with self._build_slots:
+                started = time.monotonic()
+                recognizer = await self._loop.run_in_executor(None, self._factory, key)
+                elapsed = time.monotonic() - started
+        except Exception as e:
+            self._stats['build_failures'] += 1
+            logger.warning(f"⚠️ [STT Pool] Could not pre-build recognizer for {key}: {e}")
+            return
+        finally:
+            self._building[key] -= 1
+
+        self._build_seconds = 0.8 * self._build_seconds + 0.2 * elapsed
+        self._stats['created'] += 1
+        entry = PooledRecognizer(key=key, recognizer=recognizer, created_at=time.monotonic())
+        if self._closed or key not in self._arrivals:
+            self._discard(entry)
+            return
+        self._idle.setdefault(key, deque()).append(entry)
+        logger.debug(f"🔌 [STT Pool] Pre-built recognizer for {key} in {elapsed * 1000:.0f}ms")
+
+    def _discard(self, entry: PooledRecognizer) -> None:
+        """Close in the background (the closer may block on the network)."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            with contextlib.suppress(Exception):
+                self._closer(entry.recognizer)
+            return
+        future = loop.run_in_executor(None, self._closer, entry.recognizer)
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())  # Errors are not actionable
+
+    # --- Lifecycle ---
+
+    @property
+    def idle_count(self) -> int:
+        return sum(len(entries) for entries in self._idle.values())
+
+    async def close(self) -> None:
+        """Stop refilling and close all idle recognizers."""
+        self._closed = True
+        if self._task and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        for task in list(self._builds):
+            task.cancel()  # Executor work finishes; its result is discarded
+        for entries in self._idle.values():
+            while entries:
+                self._discard(entries.popleft())
+        self._idle.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, created, expired, trimmed,
+            build_failures, idle, build_ms and per-key target sizes
+        """
+        stats = self._stats.copy()
+        stats['idle'] = self.idle_count
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else None
+        stats['build_ms'] = round(self._build_seconds * 1000, 1)
+        stats['targets'] = {str(key): self.target_size(key) for key in self._arrivals}
+        return stats
@@ -1,22 +1,274 @@
 """
 STT With Fallback Adapter.
+
+Streaming failover: the recognizer returned by create_recognizer() keeps the
+last seconds of call audio in a ring buffer. When the active provider cancels
+(e.g. Azure `_on_canceled`) or stalls (no events for `stall_timeout` seconds
+while VAD reports speech), the next fallback recognizer is started and the
+audio since the last final result is replayed into it, so the utterance in
+progress is not lost and the call does not go deaf.
 """
+import asyncio
+import contextlib
 import logging
+import time
 from collections.abc import Callable
 from typing import Any
 
 from app_nuevo.domain.ports.stt_port import STTPort, STTRecognizer, STTConfig, STTException
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.domain.value_objects.stt_value_objects import STTEvent, STTResultReason
+from app_nuevo.infrastructure.audio.ring_buffer import AudioRingBuffer
+from app_nuevo.infrastructure.observability.latency_histogram import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
+# Constants
+DEFAULT_REPLAY_SECONDS = 10.0  # Audio kept for replay (longest utterance recovered whole)
+DEFAULT_STALL_TIMEOUT_SECONDS = 3.0  # No recognizer events while VAD reports speech
+FAILOVER_CANCEL = "cancel"
+FAILOVER_STALL = "stall"
+
+
+class FailoverRecognizer(STTRecognizer):
+    """
+    Recognizer that survives its provider.
+
+    Events from a replaced recognizer are dropped; CANCELED is only forwarded
+    when no fallback is left. Audio writes, speech activity and the failover
+    itself run on the event loop; provider events arrive on SDK threads.
+    """
+
+    def __init__(
+        self,
+        owner: "STTWithFallback",
+        config: STTConfig,
+        primary: STTRecognizer,
+        loop: asyncio.AbstractEventLoop | None = None,
+        primary_provider: STTPort | None = None
+    ):
+        self.owner = owner
+        self.config = config
+        self.loop = loop
+
+        sample_rate = AudioConfig.from_legacy_mode(getattr(config, 'audio_mode', None) or 'twilio').sample_rate
+        self._bytes_per_second = sample_rate * 2  # PCM16 mono
+        self._replay_bytes = int(owner.replay_seconds * sample_rate) * 2
+        self._ring = AudioRingBuffer(capacity=self._replay_bytes + sample_rate // 5)
+        self._bytes_written = 0
+        self._final_at_bytes = 0  # Audio up to here is covered by a final result
+
+        self._callback: Callable[[STTEvent], None] | None = None
+        self._active = primary
+        self._active_provider = primary_provider or owner.primary
+        self._generation = 0
+        self._next_fallback = 0
+        self._failover_task: asyncio.Task | None = None
+        self._stopped = False
+
+        # Stall detection (monotonic seconds)
+        self._last_event_at = time.monotonic()
+        self._speech_since: float | None = None
+
+        # Time to recover: failure detected -> first event from the replacement
+        self._failed_at: float | None = None
+
+        self._subscribe(primary, 0)
+
+    # --- STTRecognizer ---
+
+    def subscribe(self, callback: Callable[[STTEvent], None]):
+        self._callback = callback
+
+    async def start_continuous_recognition(self):
+        self._bind_loop()
+        await self._active.start_continuous_recognition()
+
+    def start_continuous_recognition_async(self):
+        """Legacy support for STTProcessor (`.get()` in an executor)."""
+        self._bind_loop()
+        return self._active.start_continuous_recognition_async()
+
+    async def stop_continuous_recognition(self):
+        self._stopped = True
+        await self._active.stop_continuous_recognition()
+
+    def stop_continuous_recognition_async(self):
+        """Legacy support for STTProcessor (`.get()` in an executor)."""
+        self._stopped = True
+        if self._failover_task and not self._failover_task.done():
+            self._failover_task.cancel()
+        return self._active.stop_continuous_recognition_async()
+
+    def write(self, audio_data: bytes):
+        self._ring.write(audio_data)
+        if self._ring.readable > self._replay_bytes:
+            self._ring.consume(self._ring.readable - self._replay_bytes)
+        self._bytes_written += len(audio_data)
+
+        if self._failover_task is not None:
+            return  # Buffered; replayed into the replacement once it is up
+
+        self._active.write(audio_data)
+
+        if self._speech_since is not None:
+            silent_for = time.monotonic() - max(self._last_event_at, self._speech_since)
+            if silent_for >= self.owner.stall_timeout:
+                self._request_failover(FAILOVER_STALL, f"No recognition events for {silent_for:.1f}s during speech")
+
+    def set_speech_active(self, active: bool):
+        """VAD speech state (drives stall detection)."""
+        self._speech_since = time.monotonic() if active else None
+
+    # --- Events (SDK threads) ---
+
+    def _subscribe(self, recognizer: STTRecognizer, generation: int):
+        recognizer.subscribe(lambda evt: self._on_event(generation, evt))
+
+    def _on_event(self, generation: int, evt: STTEvent):
+        if generation != self._generation:
+            return  # Replaced recognizer
+        self._last_event_at = time.monotonic()
+
+        if evt.reason == STTResultReason.CANCELED:
+            if self._stopped:
+                return
+            if self._has_fallback():
+                self._call_soon(self._request_failover, FAILOVER_CANCEL, evt.error_details or "canceled")
+                return
+            logger.error("❌ [STTFallback] Recognizer canceled and no fallback left")
+        else:
+            if self._failed_at is not None:
+                self.owner._record_recovery(time.monotonic() - self._failed_at)
+                self._failed_at = None
+            if evt.reason == STTResultReason.RECOGNIZED_SPEECH:
+                self._final_at_bytes = self._bytes_written
+
+        if self._callback:
+            self._callback(evt)
+
+    # --- Failover (event loop) ---
+
+    def _bind_loop(self):
+        if self.loop is None:
+            with contextlib.suppress(RuntimeError):
+                self.loop = asyncio.get_running_loop()
+
+    def _call_soon(self, fn: Callable, *args):
+        if self.loop is None:
+            logger.error("❌ [STTFallback] No event loop bound, cannot fail over")
+            return
+        with contextlib.suppress(RuntimeError):  # Loop closed (call teardown)
+            self.loop.call_soon_threadsafe(fn, *args)
+
+    def _has_fallback(self) -> bool:
+        return self._next_fallback < len(self.owner.fallbacks)
+
+    def _request_failover(self, reason: str, details: str):
+        if self._stopped or self._failover_task is not None or not self._has_fallback():
+            return
+        logger.warning(f"⚠️ [STTFallback] Active recognizer lost ({reason}): {details}")
+        self.owner._stats[f'failovers_{reason}'] += 1
+        self._failed_at = time.monotonic()
+        self._failover_task = asyncio.ensure_future(self._failover(), loop=self.loop)
+
+    async def _failover(self):
+        failed, failed_provider = self._active, self._active_provider
+        try:
+            while self._has_fallback() and not self._stopped:
+                provider = self.owner.fallbacks[self._next_fallback]
+                self._next_fallback += 1
+                try:
+                    recognizer = provider.create_recognizer(self.config)
+                    generation = self._generation + 1
+                    self._subscribe(recognizer, generation)
+                    await asyncio.get_running_loop().run_in_executor(None, recognizer.start_continuous_recognition_async().get)
+                except Exception as e:
+                    logger.error(f"❌ [STTFallback] Fallback {type(provider).__name__} failed to start: {e}")
+                    self.owner._stats['failover_errors'] += 1
+                    continue
+
+                if self._stopped:
+                    await self._stop_quietly(recognizer, provider)
+                    return
+
+                # Switch and replay atomically w.r.t. write() (same loop, no await)
+                replay = self._replay_audio()
+                switch_ms = (time.monotonic() - self._failed_at) * 1000
+                self._active = recognizer
+                self._active_provider = provider
+                self._generation = generation
+                self._failover_task = None
+                self._last_event_at = time.monotonic()
+                if replay:
+                    recognizer.write(replay)
+
+                self.owner._stats['failovers'] += 1
+                self.owner._stats['replayed_seconds'] += len(replay) / self._bytes_per_second
+                logger.info(
+                    f"✅ [STTFallback] Switched to {type(provider).__name__} in "
+                    f"{switch_ms:.0f}ms, replayed {len(replay)} bytes"
+                )
+                return
+
+            logger.error("❌ [STTFallback] All fallback recognizers failed, STT unavailable")
+            self._failed_at = None
+            if self._callback:
+                self._callback(STTEvent(
+                    reason=STTResultReason.CANCELED, text="", error_details="All STT recognizers failed"
+                ))
+        finally:
+            self._failover_task = None
+            await self._stop_quietly(failed, failed_provider)
+
+    def _replay_audio(self) -> bytes:
+        """Audio not yet covered by a final result (at most replay_seconds)."""
+        pending = min(self._ring.readable, self._bytes_written - self._final_at_bytes)
+        pending -= pending % 2
+        if pending <= 0:
+            return b""
+        return self._ring.peek_tail(pending)  # Stays buffered for a further failover
+
+    async def _stop_quietly(self, recognizer: STTRecognizer, provider: STTPort):
+        with contextlib.suppress(Exception):
+            await asyncio.get_running_loop().run_in_executor(None, recognizer.stop_continuous_recognition_async().get)
+        with contextlib.suppress(Exception):
+            await provider.release_recognizer(recognizer)
+
+
 class STTWithFallback(STTPort):
     """
     Wrapper for STT Port with Fallback logic.
     """
 
-    def __init__(self, primary: STTPort, fallbacks: list[STTPort]):
+    def __init__(
+        self,
+        primary: STTPort,
+        fallbacks: list[STTPort],
+        replay_seconds: float = DEFAULT_REPLAY_SECONDS,
+        stall_timeout: float = DEFAULT_STALL_TIMEOUT_SECONDS
+    ):
+        """
+        Args:
+            primary: Primary STT adapter (e.g., AzureSTTAdapter)
+            fallbacks: Adapters tried in order when the active one fails
+            replay_seconds: Recent audio kept per call for replay
+            stall_timeout: Seconds without events during speech that count as a failure
+        """
         self.primary = primary
         self.fallbacks = fallbacks
+        self.replay_seconds = replay_seconds
+        self.stall_timeout = stall_timeout
+
+        self._time_to_recover = LatencyHistogram()
+        self._stats = {
+            'recognizers': 0,
+            'failovers': 0,
+            'failovers_cancel': 0,
+            'failovers_stall': 0,
+            'failover_errors': 0,
+            'replayed_seconds': 0.0
+        }
 
     def create_recognizer(
         self,
@@ -24,11 +276,28 @@ class STTWithFallback(STTPort):
         on_interruption_callback: Callable | None = None,
         event_loop: Any | None = None
     ) -> STTRecognizer:
-        # For streaming, fallback is complex. 
-        # Usually we just return primary recognizer. 
-        # Ideally, we would return a wrapper that handles disconnects.
-        # Check if legacy stt_with_fallback implemented logic.
-        return self.primary.create_recognizer(config, on_interruption_callback, event_loop)
+        self._stats['recognizers'] += 1
+        providers = [self.primary, *self.fallbacks]
+        for index, provider in enumerate(providers):
+            try:
+                recognizer = provider.create_recognizer(config, on_interruption_callback, event_loop)
+            except Exception as e:
+                if index == len(providers) - 1:
+                    raise
+                logger.warning(f"Primary STT failed: {e}. Trying fallbacks...")
+                continue
+
+            wrapper = FailoverRecognizer(self, config, recognizer, event_loop, primary_provider=provider)
+            wrapper._next_fallback = index  # Providers before this one already failed
+            return wrapper
+
+    async def release_recognizer(self, recognizer: STTRecognizer) -> None:
+        """Hand the active recognizer back to the provider that built it."""
+        if isinstance(recognizer, FailoverRecognizer):
+            await recognizer._active_provider.release_recognizer(recognizer._active)
+
+    def _record_recovery(self, seconds: float):
+        self._time_to_recover.record(seconds * 1000)
 
     async def transcribe_audio(self, audio_bytes: bytes, language: str = "es") -> str:
         try:
@@ -38,16 +307,30 @@ class STTWithFallback(STTPort):
                 raise
 
             logger.warning(f"Primary STT failed: {e}. Trying fallbacks...")
-            
+
             for fb in self.fallbacks:
                 try:
                     return await fb.transcribe_audio(audio_bytes, language)
                 except Exception as ex:
                     logger.warning(f"Fallback STT failed: {ex}")
                     continue
-            
+
             raise
-    
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get failover statistics.
+
+        Returns:
+            Dictionary with recognizers, failovers (by cause), failover_errors,
+            replayed_seconds and the time_to_recover histogram (failure
+            detected -> first event from the replacement recognizer)
+        """
+        stats = self._stats.copy()
+        stats['replayed_seconds'] = round(stats['replayed_seconds'], 2)
+        stats['time_to_recover'] = self._time_to_recover.snapshot()
+        return stats
+
     async def close(self):
         await self.primary.close()
         for fb in self.fallbacks:
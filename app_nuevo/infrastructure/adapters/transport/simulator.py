@@ -2,11 +2,18 @@
 Simulator Transport Adapter.
 
 Adapts FastAPI WebSocket to AudioTransport Port.
+
+Audio can travel in two ways:
+- JSON (default): {"type": "audio", "data": "<base64>"} text messages.
+- Binary (negotiated on "start"): raw PCM16 in binary WebSocket messages,
+  prefixed by a fixed 4-byte header (see pack_audio_frame).
+Control events always stay on the JSON protocol.
 """
 import base64
 import contextlib
 import json
 import logging
+import struct
 from typing import Any
 
 from fastapi import WebSocket
@@ -16,6 +23,33 @@ from app_nuevo.domain.ports import AudioTransport
 
 logger = logging.getLogger(__name__)
 
+# Binary frame header: version (u8), frame type (u8), sequence (u16, little-endian).
+# 4 bytes keeps the PCM16 payload 2-byte aligned for Int16Array views in the browser.
+BINARY_HEADER = struct.Struct("<BBH")
+BINARY_PROTOCOL_VERSION = 1
+BINARY_FRAME_AUDIO = 1
+
+
+def pack_audio_frame(audio_data: bytes, sequence: int) -> bytes:
+    """Prefix raw PCM with the binary audio header."""
+    return BINARY_HEADER.pack(BINARY_PROTOCOL_VERSION, BINARY_FRAME_AUDIO, sequence & 0xFFFF) + audio_data
+
+
+def unpack_audio_frame(message: bytes) -> tuple[int, memoryview] | None:
+    """
+    Parse a binary audio frame.
+
+    Returns:
+        (sequence, payload view), or None if the message is not a valid audio frame.
+    """
+    if len(message) < BINARY_HEADER.size:
+        return None
+    version, frame_type, sequence = BINARY_HEADER.unpack_from(message)
+    if version != BINARY_PROTOCOL_VERSION or frame_type != BINARY_FRAME_AUDIO:
+        return None
+    return sequence, memoryview(message)[BINARY_HEADER.size:]
+
+
 class SimulatorTransport(AudioTransport):
     """
     Adapter for the Browser Simulator using FastAPI WebSocket.
@@ -24,19 +58,46 @@ class SimulatorTransport(AudioTransport):
         self.websocket = websocket
         self.stream_id: str | None = None
 
+        # Negotiated per connection (see enable_binary_audio)
+        self.binary_audio = False
+        self._sequence = 0
+        self._stats = {
+            'audio_messages_sent': 0,
+            'audio_bytes_sent': 0,      # Bytes on the wire (after framing/encoding)
+            'audio_payload_bytes': 0    # Raw PCM bytes
+        }
+
+    def enable_binary_audio(self) -> None:
+        """Switch outbound audio to binary WebSocket frames."""
+        self.binary_audio = True
+        logger.info("🔌 [SimulatorTransport] Binary audio mode enabled")
+
     async def send_audio(self, audio_data: bytes, sample_rate: int = 8000) -> None:
         """
         Send audio chunk to browser simulator.
-        Browser expects Base64 encoded audio in {"type": "audio", "data": "b64..."} JSON.
+        Binary mode: header + raw PCM via send_bytes.
+        JSON mode: Base64 encoded audio in {"type": "audio", "data": "b64..."} JSON.
         """
         try:
-            b64 = base64.b64encode(audio_data).decode("utf-8")
-            # Log level debug to avoid spam
-            # logger.debug(f"📤 [TRANS] Sending Audio: {len(b64)} chars")
-            await self.websocket.send_text(json.dumps({
-                "type": "audio", 
-                "data": b64
-            }))
+            if self.binary_audio:
+                message = pack_audio_frame(audio_data, self._sequence)
+                self._sequence = (self._sequence + 1) & 0xFFFF
+                await self.websocket.send_bytes(message)
+                wire_bytes = len(message)
+            else:
+                b64 = base64.b64encode(audio_data).decode("utf-8")
+                # Log level debug to avoid spam
+                # logger.debug(f"📤 [TRANS] Sending Audio: {len(b64)} chars")
+                message = json.dumps({
+                    "type": "audio",
+                    "data": b64
+                })
+                await self.websocket.send_text(message)
+                wire_bytes = len(message)
+
+            self._stats['audio_messages_sent'] += 1
+            self._stats['audio_bytes_sent'] += wire_bytes
+            self._stats['audio_payload_bytes'] += len(audio_data)
         except Exception as e:
             logger.error(f"SimulatorTransport Send Error: {e}")
             # Don't raise, transport errors shouldn't crash pipeline logic if possible
@@ -51,6 +112,15 @@ class SimulatorTransport(AudioTransport):
         """Set the stream ID (if needed for correlating logs/events)."""
         self.stream_id = stream_id
 
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get outbound audio statistics.
+
+        Returns:
+            Dictionary with audio_messages_sent, audio_bytes_sent, audio_payload_bytes
+        """
+        return self._stats.copy()
+
     async def close(self) -> None:
         """Close connection (if managed here)."""
         # Usually managed by the route handler
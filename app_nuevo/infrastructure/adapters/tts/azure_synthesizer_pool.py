@@ -0,0 +1,222 @@
+"""
+Azure SpeechSynthesizer Pool.
+
+Keeps warm SpeechSynthesizer instances keyed by (voice, output format), each
+with its service WebSocket pre-opened, so an utterance does not pay the TLS +
+handshake cost on its first sentence.
+
+Synthesizers are checked out for exactly one utterance and returned afterwards;
+two concurrent utterances never share an instance. Idle instances are evicted
+least-recently-used once the pool exceeds its capacity.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+import azure.cognitiveservices.speech as speechsdk
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_POOL_MAX_IDLE = 8          # Idle synthesizers kept across all keys
+DEFAULT_POOL_MAX_IDLE_PER_KEY = 2  # Idle synthesizers kept per (voice, format)
+
+
+@dataclass(slots=True)
+class PooledSynthesizer:
+    """A synthesizer checked out of the pool (hand back via release())."""
+    key: Hashable
+    synthesizer: Any
+    connection: Any | None = None
+    uses: int = field(default=0)
+
+
+class SynthesizerPool:
+    """
+    Bounded LRU pool of pre-connected synthesizers.
+
+    Usage:
+        pool = SynthesizerPool(factory=lambda voice, fmt: SpeechSynthesizer(...))
+        entry = pool.acquire(voice, fmt)
+        try:
+            entry.synthesizer.speak_ssml_async(ssml)
+        finally:
+            pool.release(entry, reusable=True)
+
+    Thread-safe: acquire/release may run on the loop or in executor threads.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, Any], Any],
+        max_idle: int = DEFAULT_POOL_MAX_IDLE,
+        max_idle_per_key: int = DEFAULT_POOL_MAX_IDLE_PER_KEY
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            factory: Builds a new synthesizer for (voice_name, output_format)
+            max_idle: Idle synthesizers kept across all keys (LRU beyond this)
+            max_idle_per_key: Idle synthesizers kept for a single key
+        """
+        self._factory = factory
+        self.max_idle = max_idle
+        self.max_idle_per_key = max_idle_per_key
+
+        # key -> idle entries; dict order = key recency (last = most recent)
+        self._idle: OrderedDict[Hashable, list[PooledSynthesizer]] = OrderedDict()
+        self._idle_count = 0
+        self._lock = threading.Lock()
+
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'created': 0,
+            'evicted': 0,
+            'discarded': 0,
+            'preopen_failures': 0,
+            'in_use': 0
+        }
+
+    def acquire(self, voice_name: str, output_format: Any) -> PooledSynthesizer:
+        """
+        Check out a synthesizer for one utterance.
+
+        Returns a warm idle instance when available (hit); otherwise builds and
+        pre-connects a new one (miss). Blocking on a miss: call from an executor.
+        """
+        key = (voice_name, output_format)
+        with self._lock:
+            entries = self._idle.get(key)
+            if entries:
+                entry = entries.pop()
+                self._idle_count -= 1
+                if entries:
+                    self._idle.move_to_end(key)
+                else:
+                    del self._idle[key]
+                self._stats['hits'] += 1
+                self._stats['in_use'] += 1
+                entry.uses += 1
+                return entry
+            self._stats['misses'] += 1
+
+        entry = self._create(key, voice_name, output_format)
+        with self._lock:
+            self._stats['in_use'] += 1
+        entry.uses += 1
+        return entry
+
+    def release(self, entry: PooledSynthesizer, reusable: bool = True) -> None:
+        """
+        Return a synthesizer after its utterance.
+
+        Args:
+            entry: Entry obtained from acquire()
+            reusable: False if the utterance failed or was stopped mid-stream;
+                the instance is closed instead of going back to the pool.
+        """
+        evicted: list[PooledSynthesizer] = []
+        with self._lock:
+            self._stats['in_use'] -= 1
+            if not reusable:
+                self._stats['discarded'] += 1
+                evicted.append(entry)
+            else:
+                entries = self._idle.setdefault(entry.key, [])
+                self._idle.move_to_end(entry.key)
+                if len(entries) >= self.max_idle_per_key:
+                    evicted.append(entry)
+                    self._stats['evicted'] += 1
+                else:
+                    entries.append(entry)
+                    self._idle_count += 1
+                    evicted.extend(self._evict_lru())
+
+        for stale in evicted:
+            self._close(stale)
+
+    def prewarm(self, voice_name: str, output_format: Any, count: int = 1) -> int:
+        """
+        Ensure at least `count` idle, pre-connected synthesizers exist for a key.
+        Blocking: call from an executor.
+
+        Returns:
+            Number of synthesizers created.
+        """
+        key = (voice_name, output_format)
+        with self._lock:
+            missing = count - len(self._idle.get(key, ()))
+        created = 0
+        for _ in range(max(missing, 0)):
+            entry = self._create(key, voice_name, output_format)
+            with self._lock:
+                self._stats['in_use'] += 1
+            self.release(entry)
+            created += 1
+        return created
+
+    def clear(self) -> None:
+        """Close all idle synthesizers."""
+        with self._lock:
+            entries = [entry for bucket in self._idle.values() for entry in bucket]
+            self._idle.clear()
+            self._idle_count = 0
+        for entry in entries:
+            self._close(entry)
+
+    def _evict_lru(self) -> list[PooledSynthesizer]:
+        """Drop idle entries from the least-recently-used keys (lock held)."""
+        evicted = []
+        while self._idle_count > self.max_idle and self._idle:
+            key, entries = next(iter(self._idle.items()))
+            evicted.append(entries.pop(0))
+            self._idle_count -= 1
+            self._stats['evicted'] += 1
+            if not entries:
+                del self._idle[key]
+        return evicted
+
+    def _create(self, key: Hashable, voice_name: str, output_format: Any) -> PooledSynthesizer:
+        synthesizer = self._factory(voice_name, output_format)
+        connection = None
+        try:
+            # Open the service WebSocket now instead of on the first speak call
+            connection = speechsdk.Connection.from_speech_synthesizer(synthesizer)
+            connection.open(True)
+        except Exception as e:
+            with self._lock:
+                self._stats['preopen_failures'] += 1
+            logger.warning(f"⚠️ [TTS Pool] Pre-open failed for {voice_name}: {e}")
+
+        with self._lock:
+            self._stats['created'] += 1
+        logger.debug(f"🔌 [TTS Pool] New synthesizer for {voice_name} ({output_format})")
+        return PooledSynthesizer(key=key, synthesizer=synthesizer, connection=connection)
+
+    @staticmethod
+    def _close(entry: PooledSynthesizer) -> None:
+        if entry.connection is not None:
+            try:
+                entry.connection.close()
+            except Exception as e:
+                logger.debug(f"[TTS Pool] Error closing connection: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, created, evicted,
+            discarded, preopen_failures, in_use, idle
+        """
+        with self._lock:
+            stats = self._stats.copy()
+            stats['idle'] = self._idle_count
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else None
+        return stats
@@ -5,33 +5,98 @@ Wrappea la lógica de síntesis de voz de Azure Speech SDK.
 """
 
 import asyncio
+import contextlib
 import logging
-import time
+import threading
+from collections import deque
 from collections.abc import AsyncIterator
 from typing import Any, List
+from xml.sax.saxutils import escape, quoteattr
 
 import azure.cognitiveservices.speech as speechsdk
 from circuitbreaker import circuit
 
 from app_nuevo.infrastructure.config.settings import settings
 from app_nuevo.infrastructure.observability.decorators import track_streaming_latency
+from app_nuevo.domain.value_objects.cancellation import CancellationToken
 from app_nuevo.domain.value_objects.tts_value_objects import TTSRequest, VoiceMetadata
 from app_nuevo.domain.ports.tts_port import TTSException, TTSPort
 # from app_nuevo.observability import get_metrics_collector # TODO: Migrate Observability
 from app_nuevo.infrastructure.adapters.tts.azure_voice_styles import get_voice_styles_spanish, translate_style_list
+from app_nuevo.infrastructure.adapters.tts.azure_synthesizer_pool import SynthesizerPool
+from app_nuevo.infrastructure.services.voice_catalog import VoiceCatalog
 
 logger = logging.getLogger(__name__)
 
 
-# --- Cache for Dynamic Data ---
-_VOICE_CACHE: list[dict] = []
-_STYLE_CACHE: dict[str, list[str]] = {}
-_LAST_CACHE_UPDATE: float = 0
-CACHE_TTL = 3600  # 1 hour
+# --- Streaming ---
+STREAM_QUEUE_MAX_CHUNKS = 32      # Bounded SDK-thread -> loop bridge (backpressure)
+STREAM_PUT_TIMEOUT_SECONDS = 5.0  # Consumer stalled this long -> abort synthesis
+_STREAM_END = object()
+_STREAM_CANCELLED = object()
+TICKS_PER_SECOND = 10_000_000     # SDK offsets are in 100ns ticks
+
+# --- SSML ---
+SSML_TEMPLATE_CACHE_SIZE = 256    # Compiled (voice, style, prosody) templates kept per adapter
+
+DEFAULT_VOICE = "es-MX-DaliaNeural"
 
 
 from app_nuevo.domain.value_objects.audio_config import AudioConfig
 
+
+def fetch_azure_voices(api_key: str, region: str) -> list[dict]:
+    """
+    Voice list from the Azure API (blocking).
+
+    Returns:
+        Catalog entries: id, name, gender, locale and styles (translated to Spanish).
+    """
+    logger.info("☁️ [Azure TTS] Fetching fresh voice list from Azure API...")
+    speech_config = speechsdk.SpeechConfig(subscription=api_key, region=region)
+    synth = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+    result = synth.get_voices_async().get()
+    if result.reason != speechsdk.ResultReason.VoicesListRetrieved:
+        raise TTSException(f"Failed to list voices: {result.error_details}", retryable=True, provider="azure")
+
+    return [
+        {
+            "id": v.name,              # e.g., "es-MX-DaliaNeural"
+            "name": v.local_name,      # e.g., "Dalia"
+            "gender": v.gender.name,   # e.g., "Female"
+            "locale": v.locale,        # e.g., "es-MX"
+            # DYNAMIC: Use styles from API, but translate them to Spanish
+            "styles": translate_style_list(v.style_list) if v.style_list else []
+        }
+        for v in result.voices
+    ]
+
+
+# Dashboard voice list while the catalog is empty (no snapshot, Azure unreachable)
+FALLBACK_VOICES = [
+    {"id": "es-MX-DaliaNeural", "name": "Dalia (Femenino)", "gender": "female", "locale": "es-MX", "styles": []},
+    {"id": "es-MX-JorgeNeural", "name": "Jorge (Masculino)", "gender": "male", "locale": "es-MX", "styles": []},
+    {"id": "en-US-JennyNeural", "name": "Jenny (Female)", "gender": "female", "locale": "en-US", "styles": []},
+]
+
+_voice_catalog: VoiceCatalog | None = None
+
+
+def get_voice_catalog() -> VoiceCatalog:
+    """Get or create the process-wide Azure voice catalog (Singleton, shared with the dashboard)."""
+    global _voice_catalog  # noqa: PLW0603 - Singleton: one catalog and refresher per process
+    if _voice_catalog is None:
+        _voice_catalog = VoiceCatalog(
+            fetcher=lambda: asyncio.to_thread(
+                fetch_azure_voices, settings.AZURE_SPEECH_KEY, settings.AZURE_SPEECH_REGION
+            ),
+            snapshot_path=settings.VOICE_CATALOG_SNAPSHOT or None,
+            ttl_seconds=settings.VOICE_CATALOG_TTL_SECONDS,
+            fallback_voices=FALLBACK_VOICES
+        )
+    return _voice_catalog
+
+
 class AzureTTSAdapter(TTSPort):
     """
     Adaptador para Azure TTS que implementa TTSPort.
@@ -55,167 +120,402 @@ class AzureTTSAdapter(TTSPort):
             # logger.warning(f"⚠️ [AzureTTS] Using legacy audio_mode: {legacy_mode}")
             self.audio_config = AudioConfig.from_legacy_mode(legacy_mode)
 
+        # Shared config: read-only. Per-voice/format configs live in the pool.
         self.speech_config = speechsdk.SpeechConfig(
             subscription=self.api_key,
             region=self.region
         )
-        self._synthesizer: speechsdk.SpeechSynthesizer | None = None
-
-    def _create_synthesizer(self, voice_name: str | None = None):
-        """Creates standard SpeechSynthesizer."""
-        if voice_name:
-            self.speech_config.speech_synthesis_voice_name = voice_name
-
-        # Determine Output Format based on AudioConfig
-        if self.audio_config.encoding == "pcm":
-             # 16kHz PCM (Browser)
-             self.speech_config.set_speech_synthesis_output_format(speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm)
-        elif self.audio_config.encoding == "alaw":
-             self.speech_config.set_speech_synthesis_output_format(speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoALaw)
-        else:
-             # Default fallback mulaw 8khz
-             self.speech_config.set_speech_synthesis_output_format(speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoMULaw)
+        self._pool = SynthesizerPool(factory=self._create_synthesizer)
+        self._ssml_templates: dict[tuple, tuple[str, str]] = {}
+        self.voice_catalog = get_voice_catalog()
+
+    def _resolve_audio_config(self, request: TTSRequest) -> AudioConfig:
+        """Output format for this request (per-call client_type wins over the shared default)."""
+        client_type = (request.metadata or {}).get("client_type")
+        if client_type:
+            return AudioConfig.from_legacy_mode(client_type)
+        return self.audio_config
+
+    @staticmethod
+    def _output_format(audio_config: AudioConfig):
+        if audio_config.encoding == "pcm":
+            # 16kHz PCM (Browser)
+            return speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm
+        if audio_config.encoding == "alaw":
+            return speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoALaw
+        # Default fallback mulaw 8khz
+        return speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoMULaw
+
+    def _create_synthesizer(self, voice_name: str, output_format):
+        """
+        New synthesizer for the pool.
 
-        audio_config = speechsdk.audio.AudioConfig(filename="/dev/null")
+        Uses its own SpeechConfig (the shared one is never mutated) and no audio
+        output device: audio comes back through `synthesizing` events or
+        `result.audio_data`.
+        """
+        speech_config = speechsdk.SpeechConfig(subscription=self.api_key, region=self.region)
+        speech_config.speech_synthesis_voice_name = voice_name
+        speech_config.set_speech_synthesis_output_format(output_format)
+        return speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+
+    async def warm_up(self, voice_id: str, audio_config: AudioConfig | None = None) -> None:
+        """Pre-connect a synthesizer for this voice/format before the call speaks."""
+        output_format = self._output_format(audio_config or self.audio_config)
+        loop = asyncio.get_running_loop()
+        try:
+            created = await loop.run_in_executor(None, self._pool.prewarm, voice_id, output_format)
+            if created:
+                logger.debug(f"🔥 [Azure TTS] Pre-warmed synthesizer for {voice_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ [Azure TTS] Warm-up failed for {voice_id}: {e}")
 
-        return speechsdk.SpeechSynthesizer(
-            speech_config=self.speech_config,
-            audio_config=audio_config
-        )
+    def get_stats(self) -> dict[str, Any]:
+        """Synthesizer pool statistics (hits, misses, hit_ratio, idle, ...)."""
+        return self._pool.get_stats()
 
-    async def _ensure_voices_loaded(self):
+    @circuit(failure_threshold=3, recovery_timeout=60, expected_exception=TTSException)
+    async def synthesize(self, request: TTSRequest) -> bytes:
+        """Sintetiza texto usando parámetros del request."""
+        try:
+            ssml = self._build_ssml(request)
+            output_format = self._output_format(self._resolve_audio_config(request))
+        except Exception as e:
+             raise TTSException(f"Synthesis failed: {e}", retryable=True, provider="azure", original_error=e) from e
+        return await self._synthesize_pooled(ssml, request.voice_id, output_format, request.cancel_token)
+
+    @track_streaming_latency("azure_tts_stream")
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        """
+        Streaming synthesis: yields audio chunks as Azure produces them.
+
+        Closing or cancelling the generator, or cancelling
+        request.cancel_token, stops the synthesis on the service.
+        """
+        try:
+            output_format = self._output_format(self._resolve_audio_config(request))
+            ssml = self._build_ssml(request)
+        except Exception as e:
+            raise TTSException(f"Synthesis failed: {e}", retryable=True, provider="azure", original_error=e) from e
+
+        async with contextlib.aclosing(
+            self._stream_ssml(ssml, request.voice_id, output_format, request.cancel_token)
+        ) as stream:
+            async for chunk in stream:
+                yield chunk
+
+    async def synthesize_batch_stream(self, requests: list[TTSRequest]) -> AsyncIterator[tuple[int, bytes]]:
         """
-        Fetches voices from Azure if cache is empty or expired.
+        Throughput mode: all requests in ONE SSML document (one round-trip,
+        one synthesizer connection), audio sliced back per request.
+
+        A `<bookmark>` precedes every request after the first; its
+        audio_offset marks where that request's audio starts. Voice, prosody
+        and output format are taken from the first request.
         """
-        global _VOICE_CACHE, _STYLE_CACHE, _LAST_CACHE_UPDATE
-        
-        current_time = time.time()
-        if _VOICE_CACHE and (current_time - _LAST_CACHE_UPDATE < CACHE_TTL):
+        if not requests:
             return
+        first = requests[0]
+        try:
+            audio_config = self._resolve_audio_config(first)
+            output_format = self._output_format(audio_config)
+            body = "".join(
+                (f'<bookmark mark="{index}"/>' if index else "") + escape(request.text)
+                for index, request in enumerate(requests)
+            )
+            ssml = self._build_ssml(first, body=body)
+        except Exception as e:
+            raise TTSException(f"Synthesis failed: {e}", retryable=True, provider="azure", original_error=e) from e
+
+        sample_bytes = max(audio_config.bits_per_sample // 8, 1) * audio_config.channels
+        bytes_per_tick = audio_config.sample_rate * sample_bytes / TICKS_PER_SECOND
+        boundaries: deque[tuple[int, int]] = deque()  # (request index, byte offset where it starts)
+        index = 0
+        position = 0
+
+        async with contextlib.aclosing(
+            self._stream_ssml(ssml, first.voice_id, output_format, first.cancel_token, bookmarks=True)
+        ) as stream:
+            async for item in stream:
+                if isinstance(item, tuple):
+                    mark, audio_offset = item
+                    offset = int(audio_offset * bytes_per_tick)
+                    boundaries.append((int(mark), offset - offset % sample_bytes))
+                    continue
+
+                # Split the chunk at every boundary it crosses (a late bookmark
+                # whose offset is already behind us switches immediately)
+                chunk = item
+                while boundaries and boundaries[0][1] < position + len(chunk):
+                    next_index, boundary = boundaries.popleft()
+                    cut = max(boundary - position, 0)
+                    if cut:
+                        yield index, chunk[:cut]
+                        chunk = chunk[cut:]
+                        position += cut
+                    index = next_index
+                if chunk:
+                    yield index, chunk
+                    position += len(chunk)
+
+    async def _stream_ssml(
+        self,
+        ssml: str,
+        voice_name: str,
+        output_format,
+        cancel_token: CancellationToken | None = None,
+        bookmarks: bool = False
+    ) -> AsyncIterator[bytes | tuple[str, int]]:
+        """
+        Stream one SSML document on a pooled synthesizer.
 
-        logger.info("☁️ [Azure TTS] Fetching fresh voice list from Azure API...")
-        
+        SDK callbacks run on SDK threads; each chunk is handed to the loop
+        through a bounded asyncio.Queue (the callback blocks while it is full,
+        giving backpressure). With bookmarks=True, `(mark, audio_offset)`
+        tuples are interleaved with the audio chunks.
+        """
         loop = asyncio.get_running_loop()
-        
-        def _fetch_blocking():
-            # Use a temporary synthesizer for fetching voices (no voice_name needed)
-            # IMPORTANT: Authentication must be valid here
-            synth = speechsdk.SpeechSynthesizer(speech_config=self.speech_config, audio_config=None)
-            result = synth.get_voices_async().get()
-            
-            if result.reason == speechsdk.ResultReason.VoicesListRetrieved:
-                return result.voices
-            else:
-                logger.error(f"❌ [Azure TTS] Failed to list voices: {result.error_details}")
-                return []
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_MAX_CHUNKS)
+        stopped = threading.Event()
+
+        def _deliver(item):
+            """SDK thread -> loop (blocking put for backpressure)."""
+            if stopped.is_set():
+                return
+            try:
+                put = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            except RuntimeError:
+                stopped.set()  # Loop closed: consumer gone
+                return
+            try:
+                put.result(STREAM_PUT_TIMEOUT_SECONDS)
+            except Exception:
+                # Consumer stalled: drop the rest, stop rendering and make
+                # sure it still receives a terminal item instead of waiting forever
+                stopped.set()
+                put.cancel()
+                with contextlib.suppress(Exception):
+                    synthesizer.stop_speaking_async()
+                with contextlib.suppress(RuntimeError):
+                    loop.call_soon_threadsafe(_fail_stalled)
+
+        def _fail_stalled():
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(TTSException(
+                f"Synthesis aborted: consumer stalled for {STREAM_PUT_TIMEOUT_SECONDS}s",
+                retryable=True,
+                provider="azure"
+            ))
 
-        try:
-            voices = await loop.run_in_executor(None, _fetch_blocking)
-            
-            new_voice_cache = []
-            new_style_cache = {}
-
-            for v in voices:
-                # Extract metadata
-                voice_entry = {
-                    "id": v.name,              # e.g., "es-MX-DaliaNeural"
-                    "name": v.local_name,      # e.g., "Dalia"
-                    "gender": v.gender.name,   # e.g., "Female"
-                    "locale": v.locale         # e.g., "es-MX"
-                }
-                new_voice_cache.append(voice_entry)
-                
-                if v.style_list:
-                    # DYNAMIC: Use styles from API, but translate them to Spanish
-                    spanish_styles = translate_style_list(v.style_list)
-                    new_style_cache[v.name] = spanish_styles
-                else:
-                    new_style_cache[v.name] = []
-
-            # Atomic update
-            _VOICE_CACHE = new_voice_cache
-            _STYLE_CACHE = new_style_cache
-            _LAST_CACHE_UPDATE = current_time
-            logger.info(f"✅ [Azure TTS] Cached {len(_VOICE_CACHE)} voices and styles.")
+        def _on_synthesizing(evt):
+            audio = evt.result.audio_data
+            if audio:
+                _deliver(audio)
 
-        except Exception as e:
-            logger.error(f"❌ [Azure TTS] Error fetching voices: {e}")
-            # Fallback not implemented to force real connectivity check as requested by user
-            # If API fails, lists will be empty.
+        def _on_bookmark(evt):
+            _deliver((evt.text, evt.audio_offset))
+
+        def _on_completed(evt):
+            _deliver(_STREAM_END)
+
+        def _on_canceled(evt):
+            details = evt.result.cancellation_details
+            _deliver(TTSException(
+                f"Synthesis canceled: {details.reason}. Error details: {details.error_details}",
+                retryable=True,
+                provider="azure"
+            ))
+
+        def _wake_cancelled():
+            # Full queue: the consumer is not waiting and checks the token per chunk
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(_STREAM_CANCELLED)
 
-    @circuit(failure_threshold=3, recovery_timeout=60, expected_exception=TTSException)
-    async def synthesize(self, request: TTSRequest) -> bytes:
-        """Sintetiza texto usando parámetros del request."""
         try:
-            if not self._synthesizer:
-                self._synthesizer = self._create_synthesizer(request.voice_id)
-            ssml = self._build_ssml(request)
-            return await self.synthesize_ssml(ssml)
+            # Warm instance (hit) is instant; a miss builds + connects off the loop
+            entry = await loop.run_in_executor(None, self._pool.acquire, voice_name, output_format)
         except Exception as e:
-             raise TTSException(f"Synthesis failed: {e}", retryable=True, provider="azure") from e
+            raise TTSException(f"Synthesis failed: {e}", retryable=True, provider="azure", original_error=e) from e
+
+        synthesizer = entry.synthesizer
+        synthesizer.synthesizing.connect(_on_synthesizing)
+        synthesizer.synthesis_completed.connect(_on_completed)
+        synthesizer.synthesis_canceled.connect(_on_canceled)
+        if bookmarks:
+            synthesizer.bookmark_reached.connect(_on_bookmark)
+
+        unregister = None
+        finished = False
+        failed = False
+        try:
+            if cancel_token:
+                unregister = cancel_token.add_callback(lambda: loop.call_soon_threadsafe(_wake_cancelled))
+                if cancel_token.cancelled:
+                    raise asyncio.CancelledError("TTS request cancelled")
+
+            synthesizer.speak_ssml_async(ssml)  # Non-blocking: results arrive via events
+
+            while True:
+                item = await queue.get()
+                if item is _STREAM_CANCELLED or (cancel_token and cancel_token.cancelled):
+                    raise asyncio.CancelledError("TTS request cancelled")
+                if item is _STREAM_END:
+                    finished = True
+                    return
+                if isinstance(item, Exception):
+                    finished = failed = True
+                    raise item
+                yield item
+
+        finally:
+            if unregister:
+                unregister()
+            stopped.set()
+            # Unblock a callback waiting on a full queue
+            while not queue.empty():
+                queue.get_nowait()
+
+            if not finished:
+                # Cancelled / closed early: stop rendering on the service side (frees the connection now)
+                logger.debug("🛑 [Azure TTS] Stopping in-flight synthesis")
+                with contextlib.suppress(Exception):
+                    synthesizer.stop_speaking_async()
+
+            synthesizer.synthesizing.disconnect_all()
+            synthesizer.synthesis_completed.disconnect_all()
+            synthesizer.synthesis_canceled.disconnect_all()
+            if bookmarks:
+                synthesizer.bookmark_reached.disconnect_all()
+
+            # A stopped or failed synthesizer may still emit late events: don't reuse it
+            self._pool.release(entry, reusable=finished and not failed)
 
     async def synthesize_ssml(self, ssml: str) -> bytes:
-        """Sintetiza directamente desde SSML."""
-        if not self._synthesizer:
-             # Default fallback if simple synthesize called without context
-             self._synthesizer = self._create_synthesizer("es-MX-DaliaNeural")
+        """Sintetiza directamente desde SSML (la voz la define el propio SSML)."""
+        return await self._synthesize_pooled(ssml, DEFAULT_VOICE, self._output_format(self.audio_config))
+
+    async def _synthesize_pooled(
+        self,
+        ssml: str,
+        voice_name: str,
+        output_format,
+        cancel_token: CancellationToken | None = None
+    ) -> bytes:
+        """
+        Blocking synthesis of a full utterance on a pooled synthesizer.
 
+        Cancelling the token (or the awaiting task) calls stop_speaking_async(),
+        so the executor thread returns right away instead of rendering audio
+        nobody will play.
+        """
         loop = asyncio.get_running_loop()
+        lock = threading.Lock()
+        stop = threading.Event()
+        active: dict[str, Any] = {}
+
+        def _stop():
+            with lock:
+                stop.set()
+                synthesizer = active.get('synthesizer')
+            if synthesizer is not None:
+                with contextlib.suppress(Exception):
+                    synthesizer.stop_speaking_async()
 
         def _blocking_synthesis():
-            result = self._synthesizer.speak_ssml_async(ssml).get()
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                return result.audio_data
-            if result.reason == speechsdk.ResultReason.Canceled:
-                cancellation_details = result.cancellation_details
-                raise Exception(f"Synthesis canceled: {cancellation_details.reason}. Error details: {cancellation_details.error_details}")
-            return None
-
+            entry = self._pool.acquire(voice_name, output_format)
+            reusable = False
+            try:
+                with lock:
+                    if stop.is_set():
+                        reusable = True  # Never spoke: safe to reuse
+                        return None
+                    active['synthesizer'] = entry.synthesizer
+                    future = entry.synthesizer.speak_ssml_async(ssml)
+
+                result = future.get()
+                if stop.is_set():
+                    return None
+                if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+                    reusable = True
+                    return result.audio_data
+                if result.reason == speechsdk.ResultReason.Canceled:
+                    cancellation_details = result.cancellation_details
+                    raise Exception(f"Synthesis canceled: {cancellation_details.reason}. Error details: {cancellation_details.error_details}")
+                return None
+            finally:
+                self._pool.release(entry, reusable=reusable)
+
+        unregister = cancel_token.add_callback(_stop) if cancel_token else None
         try:
             audio_data = await loop.run_in_executor(None, _blocking_synthesis)
+            if stop.is_set():
+                raise asyncio.CancelledError("TTS request cancelled")
             if not audio_data:
                 raise Exception("No audio data returned")
             return audio_data
+        except asyncio.CancelledError:
+            _stop()
+            raise
         except Exception as e:
              logger.error(f"SSML Synthesis error: {e}")
              raise TTSException(f"Azure SSML Error: {e}", retryable=True, provider="azure") from e
+        finally:
+            if unregister:
+                unregister()
 
     async def get_available_voices(self, language: str | None = None) -> list[VoiceMetadata]:
-        await self._ensure_voices_loaded()
-        
-        voices = []
-        for v in _VOICE_CACHE:
-            if language and v.get("locale") != language:
-                continue
-            voices.append(VoiceMetadata(
-                id=v["id"],
-                name=v["name"],
-                gender=v["gender"],
-                locale=v["locale"]
-            ))
-        return voices
+        """Voices from the shared catalog (never waits on Azure once it has data)."""
+        return [
+            VoiceMetadata(id=v["id"], name=v["name"], gender=v["gender"], locale=v["locale"])
+            for v in await self.voice_catalog.get_voices(language)
+        ]
 
-    async def get_voice_styles(self, voice_id: str) -> list[str]:
-        await self._ensure_voices_loaded()
-        return _STYLE_CACHE.get(voice_id, [])
+    async def get_voice_styles(self, voice_id: str) -> list[dict[str, str]]:
+        return await self.voice_catalog.get_styles(voice_id)
 
     async def close(self):
-        """Limpia."""
-        pass
+        """Cierra los sintetizadores inactivos del pool."""
+        self._pool.clear()
+
+    def _build_ssml(self, request: TTSRequest, body: str | None = None) -> str:
+        """
+        Construye SSML: plantilla precompilada + texto escapado.
+
+        body: contenido SSML ya escapado que reemplaza a request.text (batch con bookmarks).
+        """
+        prefix, suffix = self._ssml_template(request)
+        return prefix + (escape(request.text) if body is None else body) + suffix
 
-    def _build_ssml(self, request: TTSRequest) -> str:
-        """Construye SSML."""
-        style_tag = ""
+    def _ssml_template(self, request: TTSRequest) -> tuple[str, str]:
+        """
+        (prefix, suffix) around the text for this voice profile.
+
+        Compiled once per (language, voice, style, rate, pitch, volume) and
+        cached on the adapter; every sentence afterwards is one lookup plus
+        escaping its own text.
+        """
+        pitch_val = request.provider_options.get('pitch_hz', request.pitch)
+        key = (request.language, request.voice_id, request.style, request.speed, pitch_val, request.volume)
+        template = self._ssml_templates.get(key)
+        if template is not None:
+            return template
+
+        style_open = style_close = ""
         if request.style and request.style.lower() != "default":
-            style_tag = f'<mstts:express-as style="{request.style}">'
+            style_open = f'<mstts:express-as style={quoteattr(request.style)}>'
             style_close = '</mstts:express-as>'
-        else:
-            style_close = ""
 
-        rate = f"{request.speed}"
-        pitch_val = request.provider_options.get('pitch_hz', request.pitch)
         pitch = f"{pitch_val:+.0f}Hz" if pitch_val != 0 else "0Hz"
-        volume = f"{request.volume}"
+        prefix = (
+            '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
+            f'xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang={quoteattr(str(request.language))}>'
+            f'<voice name={quoteattr(request.voice_id)}>{style_open}'
+            f'<prosody rate={quoteattr(str(request.speed))} pitch="{pitch}" volume={quoteattr(str(request.volume))}>'
+        )
+        suffix = f'</prosody>{style_close}</voice></speak>'
 
-        ssml = f"""<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="{request.language}"><voice name="{request.voice_id}">{style_tag}<prosody rate="{rate}" pitch="{pitch}" volume="{volume}">{request.text}</prosody>{style_close}</voice></speak>"""
-        return ssml
+        if len(self._ssml_templates) >= SSML_TEMPLATE_CACHE_SIZE:
+            self._ssml_templates.pop(next(iter(self._ssml_templates)))
+        template = self._ssml_templates[key] = (prefix, suffix)
+        return template
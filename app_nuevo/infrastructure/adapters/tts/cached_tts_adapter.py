@@ -0,0 +1,415 @@
+"""
+Cached TTS - Content-addressed audio cache (TTSPort decorator).
+
+Greetings, fillers and closing phrases are synthesized again and again with
+identical parameters. This adapter keys each utterance by a hash of everything
+that affects the rendered audio (text, voice, style, speed, pitch, volume,
+output format) and stores the raw codec-ready bytes in two tiers:
+
+1. Memory: per-process LRU bounded by bytes (zero-latency hits).
+2. Disk: content-addressed files shared across restarts and workers.
+
+Hits stream out immediately without touching the provider.
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, List
+
+from app_nuevo.domain.ports.tts_port import TTSPort
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.domain.value_objects.tts_value_objects import TTSRequest, VoiceMetadata
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_MEMORY_BYTES = 32 * 1024 * 1024
+DEFAULT_DISK_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_TEXT_CHARS = 200   # Longer (one-off) LLM sentences are not cached
+STREAM_CHUNK_BYTES = 3200      # Hits are streamed in 200ms (8kHz G.711) / 100ms (16kHz PCM) chunks
+_FILE_SUFFIX = ".audio"
+
+
+def tts_cache_key(request: TTSRequest, output_format: str, provider: str = "") -> str:
+    """Content address of a TTS request (hex digest)."""
+    material = json.dumps([
+        provider,
+        request.text,
+        request.voice_id,
+        request.language,
+        request.style,
+        request.speed,
+        request.provider_options.get('pitch_hz', request.pitch),
+        request.volume,
+        output_format
+    ], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(material.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class TTSAudioCache:
+    """
+    Two-tier (memory LRU + disk) store of synthesized audio by content key.
+
+    The memory tier and the disk index are only touched from the event loop;
+    disk reads/writes run in the default executor.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike | None = None,
+        max_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        max_disk_bytes: int = DEFAULT_DISK_BYTES
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Disk tier location (None = memory only)
+            max_memory_bytes: Memory tier budget (LRU beyond this)
+            max_disk_bytes: Disk tier budget (LRU by last access beyond this)
+        """
+        self.directory = Path(directory) if directory else None
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+
+        # key -> size; order = last access (loaded lazily from the directory)
+        self._disk_index: OrderedDict[str, int] | None = None
+        self._disk_bytes = 0
+        self._index_lock = asyncio.Lock()
+
+        self._stats = {
+            'lookups': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'bytes_saved': 0,
+            'memory_evictions': 0,
+            'disk_evictions': 0,
+            'disk_errors': 0
+        }
+
+    async def get(self, key: str) -> bytes | None:
+        """Look up audio by key (memory first, then disk)."""
+        self._stats['lookups'] += 1
+
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            self._stats['memory_hits'] += 1
+            self._stats['bytes_saved'] += len(audio)
+            return audio
+
+        audio = await self._disk_get(key)
+        if audio is not None:
+            self._memory_put(key, audio)
+            self._stats['disk_hits'] += 1
+            self._stats['bytes_saved'] += len(audio)
+            return audio
+
+        self._stats['misses'] += 1
+        return None
+
+    async def put(self, key: str, audio: bytes) -> None:
+        """Store audio in both tiers."""
+        if not audio:
+            return
+        self._stats['stores'] += 1
+        self._memory_put(key, audio)
+        await self._disk_put(key, audio)
+
+    # --- Memory tier ---
+
+    def _memory_put(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats['memory_evictions'] += 1
+
+    # --- Disk tier ---
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{_FILE_SUFFIX}"
+
+    async def _ensure_disk_index(self) -> OrderedDict[str, int] | None:
+        if self.directory is None:
+            return None
+        if self._disk_index is not None:
+            return self._disk_index
+
+        async with self._index_lock:
+            if self._disk_index is None:
+                loop = asyncio.get_running_loop()
+                try:
+                    entries = await loop.run_in_executor(None, self._scan_directory)
+                except OSError as e:
+                    logger.warning(f"⚠️ [TTS Cache] Disk tier disabled ({self.directory}): {e}")
+                    self.directory = None
+                    return None
+                self._disk_index = OrderedDict(entries)
+                self._disk_bytes = sum(self._disk_index.values())
+                logger.info(
+                    f"💾 [TTS Cache] Disk tier: {len(self._disk_index)} entries, "
+                    f"{self._disk_bytes / 1024 / 1024:.1f}MB"
+                )
+        return self._disk_index
+
+    def _scan_directory(self) -> list[tuple[str, int]]:
+        """Existing entries, least recently written first (blocking)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in self.directory.glob(f"*/*{_FILE_SUFFIX}"):
+            st = path.stat()
+            entries.append((st.st_mtime, path.stem, st.st_size))
+        entries.sort()
+        return [(key, size) for _, key, size in entries]
+
+    async def _disk_get(self, key: str) -> bytes | None:
+        index = await self._ensure_disk_index()
+        if not index or key not in index:
+            return None
+
+        loop = asyncio.get_running_loop()
+        path = self._path(key)
+        try:
+            audio = await loop.run_in_executor(None, path.read_bytes)
+        except OSError:
+            # Removed behind our back (another worker pruned it)
+            self._disk_forget(key)
+            return None
+        index.move_to_end(key)
+        return audio
+
+    async def _disk_put(self, key: str, audio: bytes) -> None:
+        index = await self._ensure_disk_index()
+        if index is None or key in index:
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._write_file, self._path(key), audio)
+        except OSError as e:
+            self._stats['disk_errors'] += 1
+            logger.warning(f"⚠️ [TTS Cache] Disk write failed: {e}")
+            return
+
+        index[key] = len(audio)
+        self._disk_bytes += len(audio)
+
+        evicted = []
+        while self._disk_bytes > self.max_disk_bytes and len(index) > 1:
+            old_key, _ = next(iter(index.items()))
+            self._disk_forget(old_key)
+            evicted.append(self._path(old_key))
+            self._stats['disk_evictions'] += 1
+        if evicted:
+            await loop.run_in_executor(None, self._remove_files, evicted)
+
+    def _disk_forget(self, key: str) -> None:
+        size = self._disk_index.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    @staticmethod
+    def _write_file(path: Path, audio: bytes) -> None:
+        """Atomic write (readers never see a partial file)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    @staticmethod
+    def _remove_files(paths: list[Path]) -> None:
+        for path in paths:
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with lookups, memory_hits, disk_hits, misses, hit_ratio,
+            bytes_saved, stores, evictions and tier sizes
+        """
+        stats = self._stats.copy()
+        hits = stats['memory_hits'] + stats['disk_hits']
+        stats['hit_ratio'] = round(hits / stats['lookups'], 3) if stats['lookups'] else None
+        stats['memory_entries'] = len(self._memory)
+        stats['memory_bytes'] = self._memory_bytes
+        stats['disk_entries'] = len(self._disk_index) if self._disk_index is not None else None
+        stats['disk_bytes'] = self._disk_bytes
+        return stats
+
+
+class CachedTTSAdapter(TTSPort):
+    """
+    TTSPort decorator serving repeated utterances from TTSAudioCache.
+
+    Usage:
+        tts = CachedTTSAdapter(AzureTTSAdapter(config), TTSAudioCache(".cache/tts"))
+    """
+
+    def __init__(self, inner: TTSPort, cache: TTSAudioCache, max_text_chars: int = DEFAULT_MAX_TEXT_CHARS):
+        """
+        Args:
+            inner: Provider adapter that renders cache misses
+            cache: Audio store (may be shared by several adapters)
+            max_text_chars: Utterances longer than this bypass the cache
+        """
+        self.inner = inner
+        self.cache = cache
+        self.max_text_chars = max_text_chars
+        self._provider = type(inner).__name__
+
+    # Per-call AudioConfig injection (orchestrator) goes to the provider
+    @property
+    def audio_config(self) -> AudioConfig | None:
+        return getattr(self.inner, 'audio_config', None)
+
+    @audio_config.setter
+    def audio_config(self, value: AudioConfig) -> None:
+        self.inner.audio_config = value
+
+    def _key(self, request: TTSRequest) -> str | None:
+        if not request.text or len(request.text) > self.max_text_chars:
+            return None
+        client_type = (request.metadata or {}).get("client_type")
+        audio_config = AudioConfig.from_legacy_mode(client_type) if client_type else self.audio_config
+        output_format = f"{audio_config.encoding}/{audio_config.sample_rate}" if audio_config else request.format
+        return tts_cache_key(request, output_format, self._provider)
+
+    async def synthesize(self, request: TTSRequest) -> bytes:
+        key = self._key(request)
+        if key is None:
+            return await self.inner.synthesize(request)
+
+        audio = await self.cache.get(key)
+        if audio is not None:
+            return audio
+
+        audio = await self.inner.synthesize(request)
+        await self.cache.put(key, audio)
+        return audio
+
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        """
+        Cached: yields the stored audio at once. Miss: streams from the provider
+        and stores the utterance only if it was rendered completely.
+        """
+        key = self._key(request)
+        if key is None:
+            async for chunk in self.inner.synthesize_stream(request):
+                yield chunk
+            return
+
+        audio = await self.cache.get(key)
+        if audio is not None:
+            for chunk in self._replay(audio):
+                yield chunk
+            return
+
+        chunks = []
+        async for chunk in self.inner.synthesize_stream(request):
+            chunks.append(chunk)
+            yield chunk
+        # Reached only if the consumer read to the end (no cancel / early close)
+        await self.cache.put(key, b"".join(chunks))
+
+    async def synthesize_batch_stream(self, requests: List[TTSRequest]) -> AsyncIterator[tuple[int, bytes]]:
+        """
+        Cached requests are replayed; each run of consecutive misses goes to
+        the provider as one batch, and every request in it is stored once its
+        slice of the batch is complete.
+        """
+        keys = [self._key(request) for request in requests]
+        cached = [await self.cache.get(key) if key else None for key in keys]
+
+        start = 0
+        while start < len(requests):
+            if cached[start] is not None:
+                for chunk in self._replay(cached[start]):
+                    yield start, chunk
+                start += 1
+                continue
+
+            end = start
+            while end < len(requests) and cached[end] is None:
+                end += 1
+            rendered: dict[int, list[bytes]] = {}
+            async with contextlib.aclosing(self.inner.synthesize_batch_stream(requests[start:end])) as stream:
+                async for offset, chunk in stream:
+                    rendered.setdefault(start + offset, []).append(chunk)
+                    yield start + offset, chunk
+            # Reached only if the whole run was rendered
+            for index, chunks in rendered.items():
+                if keys[index]:
+                    await self.cache.put(keys[index], b"".join(chunks))
+            start = end
+
+    @staticmethod
+    def _replay(audio: bytes):
+        view = memoryview(audio)
+        for start in range(0, len(view), STREAM_CHUNK_BYTES):
+            yield bytes(view[start:start + STREAM_CHUNK_BYTES])
+
+    async def prerender(self, request: TTSRequest) -> bool:
+        """
+        Render an utterance into the cache ahead of time (startup warm-up).
+
+        Returns:
+            True if it was already cached.
+        """
+        key = self._key(request)
+        if key is None:
+            return False
+        if await self.cache.get(key) is not None:
+            return True
+        await self.cache.put(key, await self.inner.synthesize(request))
+        return False
+
+    async def synthesize_ssml(self, ssml: str) -> bytes:
+        return await self.inner.synthesize_ssml(ssml)
+
+    async def warm_up(self, voice_id: str, audio_config: Any | None = None) -> None:
+        await self.inner.warm_up(voice_id, audio_config)
+
+    async def get_available_voices(self, language: str | None = None) -> List[VoiceMetadata]:
+        return await self.inner.get_available_voices(language)
+
+    async def get_voice_styles(self, voice_id: str) -> List[str]:
+        return await self.inner.get_voice_styles(voice_id)
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache statistics, plus the provider's own stats when it has any."""
+        stats = {'cache': self.cache.get_stats()}
+        if hasattr(self.inner, 'get_stats'):
+            stats['provider'] = self.inner.get_stats()
+        return stats
@@ -5,15 +5,27 @@ Wraps primary TTS with fallback TTS for automatic failure recovery.
 
 Gap Analysis: Score Resiliencia 85/100 -> 100/100
 """
+import asyncio
+import contextlib
 import logging
-from collections.abc import AsyncIterator
-from typing import List, Optional
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, List, Optional
 
 from app_nuevo.domain.value_objects.tts_value_objects import TTSRequest, VoiceMetadata
 from app_nuevo.domain.ports.tts_port import TTSException, TTSPort
+from app_nuevo.infrastructure.observability.latency_histogram import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
+# Constants
+DEFAULT_HEDGE_PERCENTILE = 0.95
+DEFAULT_HEDGE_DELAY_MS = 800       # Used until the primary has enough samples
+MIN_HEDGE_DELAY_MS = 150
+MAX_HEDGE_DELAY_MS = 3000
+MIN_HEDGE_SAMPLES = 20
+DEFAULT_PRIMARY_RETRY_SECONDS = 30.0  # Fallback mode: one request probes the primary this often
+
 
 class TTSWithFallback(TTSPort):
     """
@@ -25,16 +37,29 @@ class TTSWithFallback(TTSPort):
     1. Always try primary TTS first
     2. On failure, use fallback TTS
     3. After 3 consecutive failures, switch to fallback mode
-    4. Auto-recover to primary after success
+    4. Half-open: in fallback mode, one request every primary_retry_seconds
+       goes to the primary again; its success switches back
     """
 
-    def __init__(self, primary: TTSPort, fallback: TTSPort):
+    def __init__(
+        self,
+        primary: TTSPort,
+        fallback: TTSPort,
+        hedging: bool = True,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        hedge_delay_ms: float | None = None,
+        primary_retry_seconds: float = DEFAULT_PRIMARY_RETRY_SECONDS
+    ):
         """
         Initialize TTS with fallback.
 
         Args:
             primary: Primary TTS adapter (e.g., AzureTTSAdapter)
             fallback: Fallback TTS adapter (e.g., GoogleTTSAdapter)
+            hedging: Start the fallback in parallel when the primary is slow
+            hedge_percentile: Primary first-chunk latency percentile used as hedge delay
+            hedge_delay_ms: Fixed hedge delay (disables the adaptive delay)
+            primary_retry_seconds: Interval between primary probes in fallback mode
         """
         self.primary = primary
         self.fallback = fallback
@@ -43,6 +68,26 @@ class TTSWithFallback(TTSPort):
         self._primary_failures = 0
         self._failure_threshold = 3
         self._fallback_active = False
+        self._fallback_since = 0.0  # Last switch to fallback (or last probe)
+        self.primary_retry_seconds = primary_retry_seconds
+
+        # Hedging
+        self.hedging = hedging
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay_ms = hedge_delay_ms
+        self._latency = {
+            'primary': LatencyHistogram(),
+            'fallback': LatencyHistogram()
+        }
+        self._stats = {
+            'requests': 0,
+            'hedges': 0,
+            'primary_wins': 0,
+            'fallback_wins': 0,
+            'primary_failures': 0,
+            'fallback_failures': 0,
+            'primary_probes': 0
+        }
 
         logger.info(
             f"[TTSFallback] Initialized - Primary: {type(primary).__name__}, "
@@ -53,17 +98,14 @@ class TTSWithFallback(TTSPort):
         """
         Synthesize speech with automatic fallback.
         """
-        # Auto-recovery: Reset fallback mode if primary was working
-        if self._fallback_active and self._primary_failures == 0:
-            self._fallback_active = False
-            logger.info("[TTSFallback] Primary recovered, switching back from fallback")
-
-        # Try primary if not in fallback mode
-        if not self._fallback_active:
+        # Try primary if not in fallback mode (or probing it)
+        if self._use_primary():
             try:
                 logger.debug(f"[TTSFallback] Using PRIMARY: {type(self.primary).__name__}")
 
-                return await self.primary.synthesize(request)
+                audio = await self.primary.synthesize(request)
+                self._primary_recovered()
+                return audio
 
             except TTSException as e:
                 self._primary_failures += 1
@@ -75,7 +117,7 @@ class TTSWithFallback(TTSPort):
 
                 # Switch to fallback mode after threshold
                 if self._primary_failures >= self._failure_threshold:
-                    self._fallback_active = True
+                    self._open_circuit()
                     logger.error(
                         f"[TTSFallback] Primary failed {self._failure_threshold}x, "
                         f"SWITCHING TO FALLBACK MODE"
@@ -94,6 +136,220 @@ class TTSWithFallback(TTSPort):
                 f"Fallback: {type(self.fallback).__name__}"
             ) from fallback_error
 
+    async def synthesize_stream(self, request: TTSRequest) -> AsyncIterator[bytes]:
+        """
+        Hedged streaming synthesis.
+
+        The primary starts alone. If its first chunk has not arrived after the
+        hedge delay (adaptive p95 of its first-chunk latency), the fallback is
+        started in parallel; whichever produces a first chunk first is streamed
+        and the other is cancelled. A primary failure before any audio starts
+        the fallback immediately.
+
+        Once audio has been yielded, a failure is re-raised (switching providers
+        mid-utterance would change the voice).
+        """
+        streams = {}
+
+        def starter(name: str, provider: TTSPort) -> Callable[[], Awaitable[bytes]]:
+            def start():
+                streams[name] = provider.synthesize_stream(request)
+                return self._first_chunk(streams[name])
+            return start
+
+        try:
+            winner, first = await self._race(
+                starter('primary', self.primary),
+                starter('fallback', self.fallback)
+            )
+            # Loser (if any) is cancelled by now; release its generator
+            for name, stream in streams.items():
+                if name != winner:
+                    await stream.aclose()
+
+            yield first
+            async for chunk in streams[winner]:
+                yield chunk
+        finally:
+            for stream in streams.values():
+                await stream.aclose()
+
+    async def synthesize_batch_stream(self, requests: List[TTSRequest]) -> AsyncIterator[tuple[int, bytes]]:
+        """
+        Batched synthesis (throughput mode) is not hedged: latency is not the
+        goal there. A primary failure before any audio re-runs the whole
+        batch on the fallback; after audio started it is re-raised.
+        """
+        providers = [('fallback', self.fallback)]
+        if self._use_primary():
+            providers.insert(0, ('primary', self.primary))
+
+        for name, provider in providers:
+            started = False
+            try:
+                async with contextlib.aclosing(provider.synthesize_batch_stream(requests)) as stream:
+                    async for item in stream:
+                        started = True
+                        yield item
+                if name == 'primary':
+                    self._primary_recovered()
+                return
+            except TTSException as e:
+                self._on_failure(name, e)
+                if started or name == 'fallback':
+                    raise
+
+    @staticmethod
+    async def _first_chunk(stream: AsyncIterator[bytes]) -> bytes:
+        """First non-empty chunk of a stream (an empty stream counts as a failure)."""
+        async for chunk in stream:
+            if chunk:
+                return chunk
+        raise TTSException("Stream ended without audio", retryable=True)
+
+    def hedge_delay_seconds(self) -> float:
+        """Current delay before the fallback is fired in parallel."""
+        if self.hedge_delay_ms is not None:
+            return self.hedge_delay_ms / 1000.0
+
+        primary = self._latency['primary']
+        delay_ms = DEFAULT_HEDGE_DELAY_MS
+        if primary.count >= MIN_HEDGE_SAMPLES:
+            delay_ms = primary.percentile(self.hedge_percentile) or DEFAULT_HEDGE_DELAY_MS
+        return min(max(delay_ms, MIN_HEDGE_DELAY_MS), MAX_HEDGE_DELAY_MS) / 1000.0
+
+    async def _race(
+        self,
+        start_primary: Callable[[], Awaitable[Any]],
+        start_fallback: Callable[[], Awaitable[Any]]
+    ) -> tuple[str, Any]:
+        """
+        Run primary (and, when hedged or after a primary failure, fallback)
+        until one produces a result.
+
+        Returns:
+            (winner name, result). The losing call is cancelled.
+        """
+        self._stats['requests'] += 1
+        pending: dict[asyncio.Future, tuple[str, float]] = {}
+
+        def launch(name: str, start: Callable[[], Awaitable[Any]]):
+            pending[asyncio.ensure_future(start())] = (name, time.monotonic())
+
+        use_primary = self._use_primary()
+        if use_primary:
+            launch('primary', start_primary)
+        else:
+            launch('fallback', start_fallback)
+
+        fallback_started = not use_primary
+        deadline = time.monotonic() + self.hedge_delay_seconds()
+        errors: list[Exception] = []
+
+        try:
+            while pending:
+                timeout = None
+                if not fallback_started and self.hedging:
+                    timeout = max(deadline - time.monotonic(), 0.0)
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # Primary is slow: hedge
+                    self._stats['hedges'] += 1
+                    logger.info(f"[TTSFallback] Primary slow (> {self.hedge_delay_seconds() * 1000:.0f}ms), hedging with fallback")
+                    launch('fallback', start_fallback)
+                    fallback_started = True
+                    continue
+
+                for task in done:
+                    name, started_at = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        self._on_success(name, (time.monotonic() - started_at) * 1000)
+                        return name, task.result()
+
+                    errors.append(error)
+                    self._on_failure(name, error)
+                    if name == 'primary' and not fallback_started:
+                        launch('fallback', start_fallback)
+                        fallback_started = True
+
+            logger.error(f"[TTSFallback] BOTH primary AND fallback failed! {errors[-1]}")
+            raise TTSException(
+                f"TTS complete failure - Primary: {type(self.primary).__name__}, "
+                f"Fallback: {type(self.fallback).__name__}",
+                retryable=True,
+                provider="fallback",
+                original_error=errors[-1]
+            ) from errors[-1]
+
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _on_success(self, name: str, latency_ms: float) -> None:
+        self._latency[name].record(latency_ms)
+        self._stats[f'{name}_wins'] += 1
+        if name == 'primary':
+            self._primary_recovered()
+
+    def _on_failure(self, name: str, error: Exception) -> None:
+        self._stats[f'{name}_failures'] += 1
+        if name != 'primary':
+            return
+        self._primary_failures += 1
+        logger.warning(
+            f"[TTSFallback] Primary stream failed ({self._primary_failures}/{self._failure_threshold}): {error}, "
+            f"using fallback"
+        )
+        if self._primary_failures >= self._failure_threshold:
+            self._open_circuit()
+
+    def _use_primary(self) -> bool:
+        """
+        Whether the next request goes to the primary: always outside fallback
+        mode; in fallback mode once per primary_retry_seconds (half-open probe).
+        """
+        if not self._fallback_active:
+            return True
+        if time.monotonic() - self._fallback_since < self.primary_retry_seconds:
+            return False
+        self._fallback_since = time.monotonic()  # One probe per interval
+        self._stats['primary_probes'] += 1
+        logger.info(f"[TTSFallback] Probing primary {type(self.primary).__name__}")
+        return True
+
+    def _open_circuit(self) -> None:
+        self._fallback_active = True
+        self._fallback_since = time.monotonic()
+
+    def _primary_recovered(self) -> None:
+        self._primary_failures = 0
+        if self._fallback_active:
+            self._fallback_active = False
+            logger.info("[TTSFallback] Primary recovered, switching back from fallback")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            Dictionary with request/hedge/win/failure/probe counts, current
+            hedge_delay_ms and per-provider first-chunk latency histograms
+        """
+        stats = self._stats.copy()
+        stats['fallback_active'] = self._fallback_active
+        stats['hedge_delay_ms'] = round(self.hedge_delay_seconds() * 1000, 1)
+        stats['latency'] = {name: hist.snapshot() for name, hist in self._latency.items()}
+        return stats
+
+    async def warm_up(self, voice_id: str, audio_config=None) -> None:
+        """Warm up whichever provider will serve the next request."""
+        provider = self.fallback if self._fallback_active else self.primary
+        await provider.warm_up(voice_id, audio_config)
+
     async def get_available_voices(self, language: str | None = None) -> List[VoiceMetadata]:
         """Get available voices from primary."""
         # Delegate to primary (fallback voices may differ)
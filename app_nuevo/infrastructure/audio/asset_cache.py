@@ -0,0 +1,183 @@
+"""
+Audio Asset Cache.
+
+Process-wide cache of decoded audio assets (background ambience, hold
+sounds). Each file is read, header-stripped, decoded and resampled once per
+(path, sample rate); every call then shares the same read-only PCM instead of
+holding its own copy. Transport encoding happens at playout, after mixing.
+"""
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.infrastructure.audio.codecs import decode_wav, resample_pcm16
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_SOUNDS_DIR = "app_nuevo/interfaces/http/static/sounds"
+
+
+@dataclass(frozen=True, slots=True)
+class AudioAsset:
+    """Decoded, immutable audio asset at one sample rate."""
+    path: str
+    sample_rate: int
+    pcm: np.ndarray   # int16, read-only, at sample_rate
+
+    @property
+    def duration_seconds(self) -> float:
+        return len(self.pcm) / self.sample_rate
+
+    @property
+    def nbytes(self) -> int:
+        return self.pcm.nbytes
+
+
+def _asset_key(path: str, sample_rate: int) -> tuple[str, int]:
+    return (str(Path(path).resolve()), sample_rate)
+
+
+class AudioAssetCache:
+    """
+    Decoded asset cache shared by all calls.
+
+    Usage:
+        cache = get_audio_asset_cache()
+        asset = await cache.load("static/sounds/office.wav", 8000)
+        audio_manager.set_background_pcm(asset.pcm)
+    """
+
+    def __init__(self):
+        self._assets: dict[tuple[str, int], AudioAsset] = {}
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple[str, int], asyncio.Future] = {}
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'load_errors': 0
+        }
+
+    def get(self, path: str, sample_rate: int) -> AudioAsset | None:
+        """Return a cached asset without loading it."""
+        return self._assets.get(_asset_key(path, sample_rate))
+
+    def get_or_load(self, path: str, sample_rate: int) -> AudioAsset:
+        """
+        Load (blocking) or return a cached asset. Thread-safe.
+
+        Raises:
+            FileNotFoundError / ValueError if the file is missing or not a supported WAV.
+        """
+        key = _asset_key(path, sample_rate)
+        with self._lock:
+            asset = self._assets.get(key)
+            if asset is not None:
+                self._stats['hits'] += 1
+                return asset
+            self._stats['misses'] += 1
+
+            try:
+                asset = self._decode(key)
+            except Exception:
+                self._stats['load_errors'] += 1
+                raise
+            self._assets[key] = asset
+
+        logger.info(
+            f"🎵 [AssetCache] Loaded {Path(path).name} at {sample_rate} Hz "
+            f"({asset.duration_seconds:.1f}s, {asset.nbytes} bytes)"
+        )
+        return asset
+
+    async def load(self, path: str, sample_rate: int) -> AudioAsset:
+        """
+        Async get_or_load: decodes in a worker thread on a miss, and
+        concurrent callers for the same key share one load.
+        """
+        key = _asset_key(path, sample_rate)
+        asset = self._assets.get(key)
+        if asset is not None:
+            self._stats['hits'] += 1
+            return asset
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self.get_or_load, path, sample_rate)
+        self._inflight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def warm(self, paths: list[str], audio_configs: list[AudioConfig]) -> int:
+        """
+        Preload every path at every sample rate used by the given formats.
+
+        Returns:
+            Number of assets loaded successfully.
+        """
+        sample_rates = sorted({audio_config.sample_rate for audio_config in audio_configs})
+        loaded = 0
+        for path in paths:
+            for sample_rate in sample_rates:
+                try:
+                    await self.load(path, sample_rate)
+                    loaded += 1
+                except Exception as e:
+                    logger.warning(f"⚠️ [AssetCache] Failed to warm {path}: {e}")
+        return loaded
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with assets, bytes, hits, misses, load_errors
+        """
+        stats = self._stats.copy()
+        stats['assets'] = len(self._assets)
+        stats['bytes'] = sum(asset.nbytes for asset in self._assets.values())
+        return stats
+
+    @staticmethod
+    def _decode(key: tuple[str, int]) -> AudioAsset:
+        path, sample_rate = key
+        data = Path(path).read_bytes()
+
+        samples, source_rate = decode_wav(data)
+        pcm = np.array(resample_pcm16(samples, source_rate, sample_rate), dtype=np.int16)
+        pcm.setflags(write=False)
+
+        return AudioAsset(path=path, sample_rate=sample_rate, pcm=pcm)
+
+
+def list_sound_assets(directory: str = DEFAULT_SOUNDS_DIR) -> list[str]:
+    """WAV files shipped in the sounds directory."""
+    root = Path(directory)
+    if not root.is_dir():
+        return []
+    return sorted(str(p) for p in root.glob("*.wav"))
+
+
+# =============================================================================
+# Global Cache Instance
+# =============================================================================
+_cache: AudioAssetCache | None = None
+_cache_lock = threading.Lock()
+
+def get_audio_asset_cache() -> AudioAssetCache:
+    """Get or create the process-wide asset cache (Singleton)."""
+    global _cache  # noqa: PLW0603 - Singleton pattern for shared decoded assets
+    with _cache_lock:
+        if _cache is None:
+            _cache = AudioAssetCache()
+        return _cache
@@ -0,0 +1,321 @@
+"""
+Audio Codecs.
+
+Vectorized G.711 (mu-law / A-law) <-> PCM16 conversion using precomputed
+lookup tables, plus a streaming polyphase 2x resampler for 8k <-> 16k.
+
+All conversions are a single NumPy table lookup (`np.take`) over a view of
+the input bytes, optionally writing into a caller-provided output array.
+"""
+import logging
+import struct
+
+import numpy as np
+
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+
+logger = logging.getLogger(__name__)
+
+# Constants
+ENCODING_PCM = "pcm"
+ENCODING_MULAW = "mulaw"
+ENCODING_ALAW = "alaw"
+
+_ULAW_BIAS = 0x84
+_ULAW_CLIP = 32635
+_ULAW_SEG_END = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32)
+
+# WAV format tags
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_ALAW = 0x0006
+_WAVE_FORMAT_MULAW = 0x0007
+_WAVE_ENCODINGS = {
+    _WAVE_FORMAT_PCM: ENCODING_PCM,
+    _WAVE_FORMAT_ALAW: ENCODING_ALAW,
+    _WAVE_FORMAT_MULAW: ENCODING_MULAW
+}
+
+
+# -----------------------------------------------------------------------------
+# Lookup tables (built once at import)
+# -----------------------------------------------------------------------------
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    codes = ~np.arange(256, dtype=np.int32) & 0xFF
+    sign = codes & 0x80
+    exponent = (codes >> 4) & 0x07
+    mantissa = codes & 0x0F
+    magnitude = (((mantissa << 3) + _ULAW_BIAS) << exponent) - _ULAW_BIAS
+    return np.where(sign != 0, -magnitude, magnitude).astype(np.int16)
+
+
+def _build_alaw_decode_table() -> np.ndarray:
+    codes = np.arange(256, dtype=np.int32) ^ 0x55
+    sign = codes & 0x80
+    exponent = (codes >> 4) & 0x07
+    mantissa = codes & 0x0F
+    magnitude = np.where(
+        exponent == 0,
+        (mantissa << 4) + 8,
+        ((mantissa << 4) + 0x108) << np.maximum(exponent - 1, 0)
+    )
+    return np.where(sign != 0, magnitude, -magnitude).astype(np.int16)
+
+
+def _segment(values: np.ndarray, base: int) -> np.ndarray:
+    """Position of the highest set bit above `base` (0..7), as used by G.711."""
+    seg = np.zeros(values.shape, dtype=np.int32)
+    for i in range(1, 8):
+        seg[values >= (base << i)] = i
+    return seg
+
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    # Classic g711.c: 14-bit magnitude, bias 33, clip 8159
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(pcm), _ULAW_CLIP >> 2) + (_ULAW_BIAS >> 2)
+    exponent = np.searchsorted(_ULAW_SEG_END, magnitude, side="left")
+    mantissa = (magnitude >> (exponent + 1)) & 0x0F
+    return (((exponent << 4) | mantissa) ^ mask).astype(np.uint8)
+
+
+def _build_alaw_encode_table() -> np.ndarray:
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32)
+    sign = np.where(pcm >= 0, 0x80, 0x00)
+    magnitude = np.minimum(np.where(pcm >= 0, pcm, -pcm - 1), 32767) >> 3
+    exponent = _segment(magnitude, 0x10)
+    mantissa = np.where(exponent == 0, magnitude >> 1, magnitude >> exponent) & 0x0F
+    return ((sign | (exponent << 4) | mantissa) ^ 0x55).astype(np.uint8)
+
+
+ULAW_TO_PCM16 = _build_ulaw_decode_table()
+ALAW_TO_PCM16 = _build_alaw_decode_table()
+PCM16_TO_ULAW = _build_ulaw_encode_table()   # indexed by int16 viewed as uint16
+PCM16_TO_ALAW = _build_alaw_encode_table()
+
+for _table in (ULAW_TO_PCM16, ALAW_TO_PCM16, PCM16_TO_ULAW, PCM16_TO_ALAW):
+    _table.setflags(write=False)
+
+_DECODE_TABLES = {ENCODING_MULAW: ULAW_TO_PCM16, ENCODING_ALAW: ALAW_TO_PCM16}
+_ENCODE_TABLES = {ENCODING_MULAW: PCM16_TO_ULAW, ENCODING_ALAW: PCM16_TO_ALAW}
+
+
+# -----------------------------------------------------------------------------
+# G.711 conversion
+# -----------------------------------------------------------------------------
+
+def decode_to_pcm16(data: bytes | memoryview, encoding: str, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Decode audio bytes to PCM16 samples.
+
+    Args:
+        data: Encoded audio (mulaw/alaw bytes, or little-endian PCM16 for 'pcm')
+        encoding: 'pcm', 'mulaw' or 'alaw'
+        out: Optional int16 array to decode into (len must match sample count)
+
+    Returns:
+        int16 array. For 'pcm' this is a zero-copy view over `data` unless `out` is given.
+    """
+    if encoding == ENCODING_PCM:
+        samples = np.frombuffer(data, dtype=np.int16)
+        if out is None:
+            return samples
+        np.copyto(out, samples)
+        return out
+
+    table = _DECODE_TABLES.get(encoding)
+    if table is None:
+        raise ValueError(f"Unsupported audio encoding: {encoding}")
+    return np.take(table, np.frombuffer(data, dtype=np.uint8), out=out)
+
+
+def encode_from_pcm16(samples: np.ndarray, encoding: str, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Encode PCM16 samples to the target encoding.
+
+    Args:
+        samples: int16 array
+        encoding: 'pcm', 'mulaw' or 'alaw'
+        out: Optional uint8 array to encode into (G.711 only)
+
+    Returns:
+        uint8 array for G.711, or `samples` itself for 'pcm'. Use `.tobytes()`
+        (or pass the array's buffer directly) to send it.
+    """
+    if encoding == ENCODING_PCM:
+        return samples
+
+    table = _ENCODE_TABLES.get(encoding)
+    if table is None:
+        raise ValueError(f"Unsupported audio encoding: {encoding}")
+    return np.take(table, samples.view(np.uint16), out=out)
+
+
+class AudioDecoder:
+    """
+    Ingress decoder keyed off an AudioConfig.
+
+    Converts transport audio to PCM16 once so every downstream consumer
+    (VAD, STT, metrics) shares the same buffer.
+    """
+
+    def __init__(self, audio_config: AudioConfig):
+        if audio_config.encoding not in (ENCODING_PCM, ENCODING_MULAW, ENCODING_ALAW):
+            raise ValueError(f"Unsupported audio encoding: {audio_config.encoding}")
+        self.audio_config = audio_config
+        self.encoding = audio_config.encoding
+
+    @property
+    def passthrough(self) -> bool:
+        """True when the transport already delivers PCM16."""
+        return self.encoding == ENCODING_PCM
+
+    def decode(self, data: bytes) -> bytes:
+        """Decode transport bytes to little-endian PCM16 bytes."""
+        if self.passthrough:
+            return data
+        return decode_to_pcm16(data, self.encoding).tobytes()
+
+
+# -----------------------------------------------------------------------------
+# WAV files
+# -----------------------------------------------------------------------------
+
+def decode_wav(data: bytes) -> tuple[np.ndarray, int]:
+    """
+    Decode a RIFF/WAVE file (PCM16, A-law or mu-law) to mono PCM16.
+
+    Only the `data` chunk is decoded, so headers and trailing chunks
+    (fact, LIST, id3...) never end up in the audio.
+
+    Returns:
+        (int16 samples, sample rate)
+    """
+    if len(data) < 12 or data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = None
+    payload = None
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack_from("<HHIIHH", data, body)
+        elif chunk_id == b"data":
+            payload = memoryview(data)[body:min(body + chunk_size, len(data))]
+        pos = body + chunk_size + (chunk_size & 1)
+
+    if fmt is None or payload is None:
+        raise ValueError("WAV file is missing fmt or data chunk")
+
+    format_tag, channels, sample_rate, _, _, bits_per_sample = fmt
+    encoding = _WAVE_ENCODINGS.get(format_tag)
+    if encoding is None or (encoding == ENCODING_PCM and bits_per_sample != 16):
+        raise ValueError(f"Unsupported WAV format (tag={format_tag}, bits={bits_per_sample})")
+
+    sample_width = 2 if encoding == ENCODING_PCM else 1
+    usable = len(payload) - len(payload) % (sample_width * channels)
+    samples = decode_to_pcm16(payload[:usable], encoding)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return samples, sample_rate
+
+
+def resample_pcm16(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """One-shot resample of a complete PCM16 buffer (see PolyphaseResampler)."""
+    if source_rate == target_rate:
+        return samples
+    return PolyphaseResampler(source_rate, target_rate).process(samples)
+
+
+# -----------------------------------------------------------------------------
+# Resampling (8k <-> 16k)
+# -----------------------------------------------------------------------------
+
+def _design_halfband_lowpass(num_taps: int = 32) -> np.ndarray:
+    """Hamming-windowed sinc low-pass at 3.6 kHz (0.9 of the 8 kHz Nyquist)."""
+    cutoff = 0.225  # cycles/sample at the high rate (3.6 kHz @ 16 kHz)
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(num_taps)
+    return (taps / taps.sum()).astype(np.float32)
+
+
+_DEFAULT_TAPS = _design_halfband_lowpass()
+
+
+class PolyphaseResampler:
+    """
+    Streaming 2x polyphase resampler for 8 kHz <-> 16 kHz PCM16.
+
+    Keeps filter history between calls so chunked input produces the same
+    output as resampling the whole stream at once. Only the output samples
+    that are actually needed are computed (no zero-stuffing, no discarded
+    decimation outputs).
+    """
+
+    def __init__(self, source_rate: int, target_rate: int, taps: np.ndarray | None = None):
+        if {source_rate, target_rate} - {8000, 16000}:
+            raise ValueError(f"Only 8000 <-> 16000 resampling is supported (got {source_rate} -> {target_rate})")
+
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+
+        taps = _DEFAULT_TAPS if taps is None else np.asarray(taps, dtype=np.float32)
+        if len(taps) % 2:
+            taps = np.append(taps, np.float32(0.0))
+        self._h0 = taps[0::2].copy()
+        self._h1 = taps[1::2].copy()
+        self._phase_len = len(self._h0)
+
+        if source_rate < target_rate:
+            self._history = np.zeros(self._phase_len - 1, dtype=np.float32)
+        else:
+            self._history = np.zeros(2 * self._phase_len, dtype=np.float32)
+            self._pending_sample: np.ndarray = np.zeros(0, dtype=np.float32)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample a chunk of int16 samples.
+
+        Returns:
+            int16 array at the target rate.
+        """
+        if self.source_rate == self.target_rate:
+            return samples
+        if self.source_rate < self.target_rate:
+            return self._upsample(samples)
+        return self._downsample(samples)
+
+    def reset(self) -> None:
+        self._history[:] = 0.0
+        if self.source_rate > self.target_rate:
+            self._pending_sample = np.zeros(0, dtype=np.float32)
+
+    def _upsample(self, samples: np.ndarray) -> np.ndarray:
+        n = len(samples)
+        buf = np.concatenate((self._history, samples.astype(np.float32)))
+        self._history = buf[-(self._phase_len - 1):]
+
+        out = np.empty(2 * n, dtype=np.float32)
+        out[0::2] = np.convolve(buf, self._h0, mode="valid")
+        out[1::2] = np.convolve(buf, self._h1, mode="valid")
+        out *= 2.0  # Compensate zero-stuffing gain
+        return np.clip(out, -32768, 32767).astype(np.int16)
+
+    def _downsample(self, samples: np.ndarray) -> np.ndarray:
+        x = np.concatenate((self._pending_sample, samples.astype(np.float32)))
+        usable = len(x) - (len(x) % 2)
+        self._pending_sample = x[usable:]
+        if not usable:
+            return np.zeros(0, dtype=np.int16)
+
+        buf = np.concatenate((self._history, x[:usable]))
+        self._history = buf[-2 * self._phase_len:]
+
+        n = usable // 2
+        even = np.convolve(buf[0::2], self._h0, mode="valid")[1:n + 1]
+        odd = np.convolve(buf[1::2], self._h1, mode="valid")[:n]
+        return np.clip(even + odd, -32768, 32767).astype(np.int16)
@@ -0,0 +1,113 @@
+"""
+Audio Framer.
+
+Re-blocks a stream of arbitrarily sized audio chunks (as delivered by TTS
+providers) into blocks that are exact multiples of the transport frame
+(20ms at the call's codec), so every stage after synthesis handles uniform
+frames and the playout scheduler can send them without re-chunking.
+
+Complete frames are released as soon as they arrive (grouped up to
+max_frames_per_block per block); only a sub-frame remainder (<20ms) is held
+back, in a preallocated buffer. Each emitted block costs one allocation.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_MAX_FRAMES_PER_BLOCK = 10  # 200ms cap: amortizes per-frame pipeline overhead
+
+
+class AudioFramer:
+    """
+    Stateful re-blocker for one ordered audio stream.
+
+    Usage:
+        framer = AudioFramer(frame_size=160, silence_byte=0xFF)
+        for block in framer.push(chunk):   # 0..n blocks, each a multiple of 160 bytes
+            send(block)
+        tail = framer.flush()              # end of stream: last frame padded with silence
+    """
+
+    def __init__(
+        self,
+        frame_size: int,
+        silence_byte: int = 0x00,
+        max_frames_per_block: int = DEFAULT_MAX_FRAMES_PER_BLOCK
+    ):
+        """
+        Initialize framer.
+
+        Args:
+            frame_size: Bytes per transport frame (e.g. 160 for 20ms G.711)
+            silence_byte: Codec silence used to pad the final frame
+            max_frames_per_block: Upper bound of frames grouped into one block
+        """
+        if frame_size <= 0 or max_frames_per_block <= 0:
+            raise ValueError("frame_size and max_frames_per_block must be positive")
+
+        self.frame_size = frame_size
+        self.silence_byte = silence_byte
+        self.max_block_size = frame_size * max_frames_per_block
+        self._carry = bytearray(frame_size)
+        self._carry_view = memoryview(self._carry)
+        self._carry_len = 0
+
+    @property
+    def pending(self) -> int:
+        """Bytes held back waiting for a complete frame."""
+        return self._carry_len
+
+    def push(self, data: bytes) -> list[bytes]:
+        """
+        Add audio.
+
+        Returns:
+            Blocks of whole frames (up to max_frames_per_block each), possibly none.
+        """
+        frame = self.frame_size
+        carry = self._carry_len
+        total = len(data)
+        available = (carry + total) // frame * frame
+        if not available:
+            self._carry[carry:carry + total] = data
+            self._carry_len += total
+            return []
+
+        blocks = []
+        view = memoryview(data)
+        # First block joins the held-back remainder with the new audio
+        first = min(available, self.max_block_size)
+        if carry:
+            blocks.append(b"".join((self._carry_view[:carry], view[:first - carry])))
+        else:
+            blocks.append(bytes(view[:first]))
+
+        offset = first - carry
+        end = available - carry
+        while offset < end:
+            size = min(end - offset, self.max_block_size)
+            blocks.append(bytes(view[offset:offset + size]))
+            offset += size
+
+        remainder = total - end
+        self._carry[:remainder] = view[end:]
+        self._carry_len = remainder
+        return blocks
+
+    def flush(self) -> bytes | None:
+        """
+        End of stream: emit held-back audio padded with silence to a whole
+        number of frames (not a whole block).
+        """
+        if not self._carry_len:
+            return None
+        frames = -(-self._carry_len // self.frame_size)
+        tail = bytearray([self.silence_byte]) * (frames * self.frame_size)
+        tail[:self._carry_len] = self._carry[:self._carry_len]
+        self._carry_len = 0
+        return bytes(tail)
+
+    def reset(self) -> None:
+        """Drop held-back audio (barge-in)."""
+        self._carry_len = 0
@@ -0,0 +1,120 @@
+"""
+Ambience Mixer.
+
+Sums a looping background bed (office ambience, comfort noise) with outbound
+speech frames, so ambience keeps playing under the bot's voice instead of
+dropping out whenever it talks.
+
+The bed is decoded PCM16 that the mixer never copies (it is typically the
+shared read-only buffer from AudioAssetCache). Each 20ms frame is one decode
+(table lookup), a fixed-point gain + add, one clip and one encode (table
+lookup) into preallocated buffers.
+"""
+import logging
+
+import numpy as np
+
+from app_nuevo.infrastructure.audio.codecs import (
+    ENCODING_PCM,
+    decode_to_pcm16,
+    encode_from_pcm16,
+)
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_AMBIENCE_GAIN = 0.3
+_GAIN_SHIFT = 15  # Q15 fixed-point gain
+
+
+class AmbienceMixer:
+    """
+    Per-call mixer over a (possibly shared) ambience bed.
+
+    Usage:
+        mixer = AmbienceMixer(bed_pcm16, encoding="mulaw", frame_samples=160)
+        frame = mixer.mix(speech_frame)   # speech + ambience
+        frame = mixer.mix(None)           # ambience only (gaps)
+    """
+
+    def __init__(
+        self,
+        bed: np.ndarray,
+        encoding: str,
+        frame_samples: int,
+        gain: float = DEFAULT_AMBIENCE_GAIN
+    ):
+        """
+        Initialize mixer.
+
+        Args:
+            bed: int16 ambience samples, already at the transport sample rate
+                (shared, never modified)
+            encoding: Transport encoding of speech frames ('pcm', 'mulaw', 'alaw')
+            frame_samples: Samples per frame (e.g. 160 @ 8kHz, 320 @ 16kHz)
+            gain: Linear gain applied to the ambience (0.0 - 1.0)
+        """
+        if len(bed) == 0:
+            raise ValueError("Ambience bed is empty")
+
+        self.encoding = encoding
+        self.frame_samples = frame_samples
+        self._bed = bed
+        self._bed_len = len(bed)
+        self._index = 0
+        self.set_gain(gain)
+
+        # Per-frame scratch (reused every tick)
+        self._wrap = np.empty(frame_samples, dtype=np.int16)
+        self._speech = np.empty(frame_samples, dtype=np.int16)
+        self._acc = np.empty(frame_samples, dtype=np.int32)
+        self._pcm = np.empty(frame_samples, dtype=np.int16)
+        self._encoded = None if encoding == ENCODING_PCM else np.empty(frame_samples, dtype=np.uint8)
+
+    def set_gain(self, gain: float) -> None:
+        """Change ambience gain."""
+        self.gain = gain
+        self._gain_q15 = int(round(gain * (1 << _GAIN_SHIFT)))
+
+    def _next_bed_slice(self) -> np.ndarray:
+        """Next frame of the loop; contiguous view except when wrapping."""
+        n = self.frame_samples
+        start = self._index
+        end = start + n
+        self._index = end % self._bed_len
+
+        if end <= self._bed_len:
+            return self._bed[start:end]
+
+        # Wrap-around (once per loop): stitch tail + head, repeating short beds
+        filled, pos = 0, start
+        while filled < n:
+            take = min(n - filled, self._bed_len - pos)
+            self._wrap[filled:filled + take] = self._bed[pos:pos + take]
+            filled += take
+            pos = 0
+        return self._wrap
+
+    def mix(self, frame: bytes | None) -> bytes:
+        """
+        Produce one output frame in the transport encoding.
+
+        Args:
+            frame: Speech frame in the transport encoding (exactly one frame),
+                or None to emit ambience only.
+        """
+        bed = self._next_bed_slice()
+
+        acc = self._acc
+        np.multiply(bed, self._gain_q15, out=acc, dtype=np.int32)
+        acc >>= _GAIN_SHIFT
+        if frame is not None:
+            acc += decode_to_pcm16(frame, self.encoding, out=self._speech)
+            np.clip(acc, -32768, 32767, out=acc)
+
+        pcm = self._pcm
+        np.copyto(pcm, acc, casting='unsafe')
+
+        if self._encoded is None:
+            return pcm.tobytes()
+        return encode_from_pcm16(pcm, self.encoding, out=self._encoded).tobytes()
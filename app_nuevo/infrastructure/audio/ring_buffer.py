@@ -0,0 +1,177 @@
+"""
+Audio Ring Buffer.
+
+Preallocated circular byte buffer for streaming PCM audio. Replaces the
+`buffer = buffer[n:]` reslicing pattern, which copies the remaining bytes
+and allocates a new bytearray for every consumed window.
+"""
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Constants
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+class AudioRingBuffer:
+    """
+    Circular buffer over a single preallocated bytearray.
+
+    Writes copy into the buffer through a memoryview; reads convert PCM16
+    straight into a caller-owned float32 array, so steady-state streaming
+    performs no per-window allocations beyond lightweight NumPy views.
+
+    Usage:
+        ring = AudioRingBuffer(capacity=4096)
+        scratch = np.empty(256, dtype=np.float32)
+
+        ring.write(frame.data)
+        while ring.readable >= 512:
+            ring.read_pcm16_float32(scratch)
+            ...
+    """
+
+    def __init__(self, capacity: int = 8192):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Initial capacity in bytes (grows if a write overflows)
+        """
+        # Keep capacity even so PCM16 samples never straddle the wrap point
+        capacity += capacity % 2
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._samples = np.frombuffer(self._buf, dtype=np.int16)  # Whole buffer as PCM16 (even offsets)
+        self._capacity = capacity
+        self._read = 0
+        self._size = 0
+        self._scratch: bytearray | None = None  # Realigns samples after an odd-length write
+
+    @property
+    def readable(self) -> int:
+        """Number of buffered bytes not yet consumed."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def write(self, data: bytes) -> None:
+        """Append bytes, growing the backing buffer only if it would overflow."""
+        n = len(data)
+        if not n:
+            return
+        if self._size + n > self._capacity:
+            self._grow(self._size + n)
+
+        write_pos = (self._read + self._size) % self._capacity
+        first = min(n, self._capacity - write_pos)
+        if first == n:
+            self._buf[write_pos:write_pos + n] = data  # Same-length slice assignment: no resize
+        else:
+            src = memoryview(data)
+            self._view[write_pos:write_pos + first] = src[:first]
+            self._view[0:n - first] = src[first:]
+        self._size += n
+
+    def read_pcm16_float32(self, out: np.ndarray) -> np.ndarray:
+        """
+        Consume len(out) PCM16 samples, converting them in place into `out`.
+
+        Args:
+            out: Preallocated float32 array; its length sets how many samples are read
+
+        Returns:
+            `out`, filled with samples scaled to [-1.0, 1.0).
+        """
+        n_bytes = len(out) * 2
+        if n_bytes > self._size:
+            raise ValueError(f"Not enough audio buffered ({self._size} < {n_bytes} bytes)")
+
+        if self._read % 2:
+            # An odd-length write left the read side mid-sample: int16 views would
+            # need an even offset, so copy the bytes out first (rare slow path)
+            if self._scratch is None or len(self._scratch) < n_bytes:
+                self._scratch = bytearray(n_bytes)
+            aligned = memoryview(self._scratch)[:n_bytes]
+            self.read_into(aligned)
+            np.copyto(out, np.frombuffer(aligned, dtype=np.int16), casting='unsafe')
+            out *= PCM16_SCALE
+            return out
+
+        start = self._read // 2
+        count = len(out)
+        first = min(count, self._capacity // 2 - start)
+        # Cast into `out`, then scale in place: no temporary arrays
+        if first == count:
+            np.copyto(out, self._samples[start:start + count], casting='unsafe')
+        else:
+            np.copyto(out[:first], self._samples[start:], casting='unsafe')
+            np.copyto(out[first:], self._samples[:count - first], casting='unsafe')
+        out *= PCM16_SCALE
+
+        self.consume(n_bytes)
+        return out
+
+    def read_into(self, out: memoryview | bytearray) -> int:
+        """
+        Consume up to len(out) bytes, copying them into `out`.
+
+        Returns:
+            Number of bytes copied (less than len(out) if the buffer ran short).
+        """
+        n_bytes = min(len(out), self._size)
+        first = min(n_bytes, self._capacity - self._read)
+        out[0:first] = self._view[self._read:self._read + first]
+        if first < n_bytes:
+            out[first:n_bytes] = self._view[0:n_bytes - first]
+
+        self.consume(n_bytes)
+        return n_bytes
+
+    def peek_tail(self, n_bytes: int) -> bytes:
+        """
+        Copy the newest n_bytes (at most all buffered bytes) without consuming them.
+
+        Returns:
+            One bytes object, in write order.
+        """
+        n_bytes = min(n_bytes, self._size)
+        start = (self._read + self._size - n_bytes) % self._capacity
+        first = min(n_bytes, self._capacity - start)
+        if first == n_bytes:
+            return bytes(self._view[start:start + n_bytes])
+        return b"".join((self._view[start:], self._view[:n_bytes - first]))
+
+    def consume(self, n_bytes: int) -> None:
+        """Drop n_bytes from the read side without copying."""
+        n_bytes = min(n_bytes, self._size)
+        self._read = (self._read + n_bytes) % self._capacity
+        self._size -= n_bytes
+
+    def clear(self) -> None:
+        """Discard all buffered audio."""
+        self._read = 0
+        self._size = 0
+
+    def _grow(self, required: int) -> None:
+        new_capacity = self._capacity
+        while new_capacity < required:
+            new_capacity *= 2
+
+        new_buf = bytearray(new_capacity)
+        first = min(self._size, self._capacity - self._read)
+        new_buf[0:first] = self._view[self._read:self._read + first]
+        if first < self._size:
+            new_buf[first:self._size] = self._view[0:self._size - first]
+
+        self._view.release()
+        self._buf = new_buf
+        self._view = memoryview(self._buf)
+        self._samples = np.frombuffer(self._buf, dtype=np.int16)
+        self._capacity = new_capacity
+        self._read = 0
+        logger.debug(f"[AudioRingBuffer] Grew to {new_capacity} bytes")
@@ -40,6 +40,19 @@ class Settings(BaseSettings):
     DEFAULT_LLM_PROVIDER: str = "groq"
     DEFAULT_TTS_PROVIDER: str = "azure"
 
+    # --- TTS Audio Cache ---
+    TTS_CACHE_DIR: str = ".cache/tts"  # Empty = memory tier only
+    TTS_CACHE_MEMORY_MB: int = 32
+    TTS_CACHE_DISK_MB: int = 512
+
+    # --- Voice Catalog ---
+    VOICE_CATALOG_SNAPSHOT: str = ".cache/voice_catalog.json"  # Empty = no snapshot
+    VOICE_CATALOG_TTL_SECONDS: int = 3600
+
+    # --- Local STT (offline fallback / load testing) ---
+    LOCAL_STT_MODEL_DIR: str = "models/vosk"  # One Vosk model folder per language (es-MX, en-US, ...)
+    LOCAL_STT_WORKERS: int = 0  # Worker processes (0 = one per core)
+
     # --- VAD Stability ---
     VAD_CONFIRMATION_WINDOW_MS: int = 200
     VAD_ENABLE_CONFIRMATION: bool = True
@@ -51,11 +51,35 @@ class AgentConfig(Base):
     silence_timeout_ms: Mapped[int] = mapped_column(Integer, default=500)
     enable_denoising: Mapped[bool] = mapped_column(Boolean, default=True)
     enable_backchannel: Mapped[bool] = mapped_column(Boolean, default=False)
+    voice_filler_injection: Mapped[bool] = mapped_column(Boolean, default=False, nullable=True)
+    voice_backchanneling: Mapped[bool] = mapped_column(Boolean, default=False, nullable=True)
     max_duration: Mapped[int] = mapped_column(Integer, default=300)
+
+    # Pipeline
+    pipeline_execution_mode: Mapped[str] = mapped_column(String, default="inline", nullable=True)
+    pipeline_hop_queue_size: Mapped[int] = mapped_column(Integer, default=50, nullable=True)
+
+    # TTS
+    tts_synthesis_mode: Mapped[str] = mapped_column(String, default="streaming", nullable=True)
+
+    # Background Audio
+    bg_audio_gain: Mapped[float] = mapped_column(Float, default=0.3, nullable=True)
     
     # Provider Overlays
     silence_timeout_ms_phone: Mapped[int] = mapped_column(Integer, nullable=True)
     silence_timeout_ms_telnyx: Mapped[int] = mapped_column(Integer, nullable=True)
+    pipeline_execution_mode_phone: Mapped[str] = mapped_column(String, nullable=True)
+    pipeline_execution_mode_telnyx: Mapped[str] = mapped_column(String, nullable=True)
+    pipeline_hop_queue_size_phone: Mapped[int] = mapped_column(Integer, nullable=True)
+    pipeline_hop_queue_size_telnyx: Mapped[int] = mapped_column(Integer, nullable=True)
+    tts_synthesis_mode_phone: Mapped[str] = mapped_column(String, nullable=True)
+    tts_synthesis_mode_telnyx: Mapped[str] = mapped_column(String, nullable=True)
+    bg_audio_gain_phone: Mapped[float] = mapped_column(Float, nullable=True)
+    bg_audio_gain_telnyx: Mapped[float] = mapped_column(Float, nullable=True)
+    voice_filler_injection_phone: Mapped[bool] = mapped_column(Boolean, nullable=True)
+    voice_filler_injection_telnyx: Mapped[bool] = mapped_column(Boolean, nullable=True)
+    voice_backchanneling_phone: Mapped[bool] = mapped_column(Boolean, nullable=True)
+    voice_backchanneling_telnyx: Mapped[bool] = mapped_column(Boolean, nullable=True)
 
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -20,6 +21,29 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
 
+# Columns added to existing tables after their first deploy (create_all only
+# creates missing tables): (table, column, SQL type)
+ADDED_COLUMNS = [
+    ("agent_configs", "pipeline_execution_mode", "VARCHAR"),
+    ("agent_configs", "pipeline_hop_queue_size", "INTEGER"),
+    ("agent_configs", "pipeline_execution_mode_phone", "VARCHAR"),
+    ("agent_configs", "pipeline_execution_mode_telnyx", "VARCHAR"),
+    ("agent_configs", "pipeline_hop_queue_size_phone", "INTEGER"),
+    ("agent_configs", "pipeline_hop_queue_size_telnyx", "INTEGER"),
+    ("agent_configs", "tts_synthesis_mode", "VARCHAR"),
+    ("agent_configs", "tts_synthesis_mode_phone", "VARCHAR"),
+    ("agent_configs", "tts_synthesis_mode_telnyx", "VARCHAR"),
+    ("agent_configs", "bg_audio_gain", "FLOAT"),
+    ("agent_configs", "bg_audio_gain_phone", "FLOAT"),
+    ("agent_configs", "bg_audio_gain_telnyx", "FLOAT"),
+    ("agent_configs", "voice_filler_injection", "BOOLEAN"),
+    ("agent_configs", "voice_filler_injection_phone", "BOOLEAN"),
+    ("agent_configs", "voice_filler_injection_telnyx", "BOOLEAN"),
+    ("agent_configs", "voice_backchanneling", "BOOLEAN"),
+    ("agent_configs", "voice_backchanneling_phone", "BOOLEAN"),
+    ("agent_configs", "voice_backchanneling_telnyx", "BOOLEAN"),
+]
+
 async def init_db():
     """
     Initialize database tables safely.
@@ -29,3 +53,5 @@ async def init_db():
     from app_nuevo.infrastructure.database.models import Base
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all, checkfirst=True)
+        for table, column, sql_type in ADDED_COLUMNS:
+            await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {sql_type}"))
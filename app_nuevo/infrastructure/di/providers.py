@@ -4,6 +4,7 @@ DI Providers.
 Factory functions for creating infrastructure adapters.
 Isolates configuration logic from the Container.
 """
+from pathlib import Path
 from typing import Any
 
 # Ports
@@ -15,7 +16,10 @@ from app_nuevo.domain.ports import (
 # Adapters
 from app_nuevo.infrastructure.adapters.llm.groq_llm_adapter import GroqLLMAdapter
 from app_nuevo.infrastructure.adapters.stt.azure_stt_adapter import AzureSTTAdapter
+from app_nuevo.infrastructure.adapters.stt.local_stt_adapter import LocalSTTAdapter
+from app_nuevo.infrastructure.adapters.stt.stt_with_fallback import STTWithFallback
 from app_nuevo.infrastructure.adapters.tts.azure_tts_adapter import AzureTTSAdapter
+from app_nuevo.infrastructure.adapters.tts.cached_tts_adapter import CachedTTSAdapter, TTSAudioCache
 from app_nuevo.infrastructure.adapters.persistence.postgres_config_repository import PostgresConfigRepository
 from app_nuevo.infrastructure.adapters.persistence.sqlalchemy_call_repository import SQLAlchemyCallRepository
 from app_nuevo.infrastructure.adapters.persistence.sqlalchemy_transcript_repository import SQLAlchemyTranscriptRepository
@@ -35,11 +39,22 @@ class InfrastructureProviders:
 
     @staticmethod
     def provide_stt(config: Any = None) -> STTPort:
+        local = LocalSTTAdapter(config)
+        if getattr(config, 'DEFAULT_STT_PROVIDER', 'azure') == 'local':
+            # Fully offline (load testing)
+            return local
+        if Path(local.model_dir).is_dir():
+            return STTWithFallback(AzureSTTAdapter(config), [local])
         return AzureSTTAdapter(config)
 
     @staticmethod
     def provide_tts(config: Any = None) -> TTSPort:
-        return AzureTTSAdapter(config)
+        cache = TTSAudioCache(
+            directory=getattr(config, 'TTS_CACHE_DIR', None),
+            max_memory_bytes=getattr(config, 'TTS_CACHE_MEMORY_MB', 32) * 1024 * 1024,
+            max_disk_bytes=getattr(config, 'TTS_CACHE_DISK_MB', 512) * 1024 * 1024
+        )
+        return CachedTTSAdapter(AzureTTSAdapter(config), cache)
 
     @staticmethod
     def provide_extraction_service() -> ExtractionPort:
@@ -0,0 +1,388 @@
+"""
+Shared Local STT Engine.
+
+Process-wide pool of CPU speech-recognition workers (Vosk / Kaldi) shared by
+every call that uses the local recognizer. Decoding is CPU-bound and holds the
+GIL, so it runs in worker PROCESSES, never on the event loop or in threads:
+
+- Each worker loads a language model once and decodes many streams.
+- A stream is pinned to one worker for its whole life (recognizer state lives
+  there); new streams go to the least loaded worker.
+- Results come back on one shared queue, read by a dispatcher thread that
+  calls the stream's handler (like an SDK callback thread).
+- A worker that dies is respawned; its streams receive an error event so the
+  caller can fail over.
+
+Per-stream CPU time vs audio time is reported back, so the pool exposes its
+real-time factor (CPU seconds per audio second, per core).
+"""
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Constants
+EVENT_PARTIAL = "partial"
+EVENT_FINAL = "final"
+EVENT_ERROR = "error"
+EVENT_CLOSED = "closed"
+HEALTH_CHECK_SECONDS = 1.0  # Dispatcher poll period (dead worker detection)
+TICKS_PER_SECOND = 10_000_000  # Event durations use Azure's 100ns ticks
+
+# Handler(kind, text_or_message, value): value is the utterance duration in
+# ticks for partial/final events, (audio_seconds, cpu_seconds) for closed
+StreamHandler = Callable[[str, str, Any], None]
+
+
+# =============================================================================
+# Engines (instantiated in the parent, used inside the workers)
+# =============================================================================
+
+class VoskEngine:
+    """
+    Vosk/Kaldi recognizer factory.
+
+    Models are looked up as `<model_dir>/<language>` then `<model_dir>/<lang>`
+    (e.g. models/vosk/es-MX, then models/vosk/es, then any models/vosk/es-*)
+    and loaded once per worker.
+    """
+
+    def __init__(self, model_dir: str):
+        self.model_dir = model_dir
+        self._models: dict[str, Any] = {}
+
+    def model_path(self, language: str) -> Path | None:
+        base = Path(self.model_dir)
+        prefix = language.split('-')[0].lower()
+        for name in (language, prefix):
+            if (base / name).is_dir():
+                return base / name
+        # "es" also matches a single regional model such as models/vosk/es-MX
+        if base.is_dir():
+            for path in sorted(base.iterdir()):
+                if path.is_dir() and path.name.lower().startswith(prefix + '-'):
+                    return path
+        return None
+
+    def available(self, language: str) -> bool:
+        return self.model_path(language) is not None
+
+    def create(self, language: str, sample_rate: int) -> "_VoskStream":
+        import vosk  # Optional dependency: only the worker processes need it
+
+        path = self.model_path(language)
+        if path is None:
+            raise FileNotFoundError(f"No local STT model for '{language}' in {self.model_dir}")
+        key = str(path)
+        if key not in self._models:
+            vosk.SetLogLevel(-1)
+            self._models[key] = vosk.Model(key)
+        return _VoskStream(vosk.KaldiRecognizer(self._models[key], sample_rate))
+
+
+class _VoskStream:
+    """One utterance-segmenting recognizer: accept() -> (final, partial)."""
+
+    def __init__(self, recognizer: Any):
+        self._recognizer = recognizer
+
+    def accept(self, data: bytes) -> tuple[str | None, str | None]:
+        if self._recognizer.AcceptWaveform(data):
+            return json.loads(self._recognizer.Result()).get("text", ""), None
+        return None, json.loads(self._recognizer.PartialResult()).get("partial", "")
+
+    def finish(self) -> str:
+        return json.loads(self._recognizer.FinalResult()).get("text", "")
+
+
+# =============================================================================
+# Worker process
+# =============================================================================
+
+def _worker_main(engine: Any, inbox: Any, outbox: Any) -> None:
+    """Decode loop of one worker process."""
+    streams: dict[int, dict[str, Any]] = {}
+    while True:
+        message = inbox.get()
+        if message is None:
+            return
+
+        command, stream_id = message[0], message[1]
+        try:
+            if command == "open":
+                _, _, language, sample_rate = message
+                started = time.process_time()
+                streams[stream_id] = {
+                    'recognizer': engine.create(language, sample_rate),
+                    'bytes_per_second': sample_rate * 2,  # PCM16 mono
+                    'audio_bytes': 0,
+                    'utterance_start': 0,
+                    'last_partial': "",
+                    'cpu': time.process_time() - started
+                }
+
+            elif command == "audio":
+                stream = streams.get(stream_id)
+                if stream is None:
+                    continue
+                data = message[2]
+                started = time.process_time()
+                final, partial = stream['recognizer'].accept(data)
+                stream['cpu'] += time.process_time() - started
+                stream['audio_bytes'] += len(data)
+
+                ticks = (stream['audio_bytes'] - stream['utterance_start']) * TICKS_PER_SECOND // stream['bytes_per_second']
+                if final is not None:
+                    if final:
+                        outbox.put((EVENT_FINAL, stream_id, final, ticks))
+                    stream['utterance_start'] = stream['audio_bytes']
+                    stream['last_partial'] = ""
+                elif partial and partial != stream['last_partial']:
+                    # Only changed hypotheses cross the process boundary
+                    stream['last_partial'] = partial
+                    outbox.put((EVENT_PARTIAL, stream_id, partial, ticks))
+
+            elif command == "close":
+                stream = streams.pop(stream_id, None)
+                if stream is None:
+                    outbox.put((EVENT_CLOSED, stream_id, "", (0.0, 0.0)))
+                    continue
+                started = time.process_time()
+                final = stream['recognizer'].finish()
+                stream['cpu'] += time.process_time() - started
+                if final:
+                    ticks = (stream['audio_bytes'] - stream['utterance_start']) * TICKS_PER_SECOND // stream['bytes_per_second']
+                    outbox.put((EVENT_FINAL, stream_id, final, ticks))
+                audio_seconds = stream['audio_bytes'] / stream['bytes_per_second']
+                outbox.put((EVENT_CLOSED, stream_id, "", (audio_seconds, stream['cpu'])))
+
+        except Exception as e:
+            streams.pop(stream_id, None)
+            outbox.put((EVENT_ERROR, stream_id, f"{type(e).__name__}: {e}", None))
+
+
+# =============================================================================
+# Pool (parent process)
+# =============================================================================
+
+class _Worker:
+    def __init__(self, index: int, process: Any, inbox: Any):
+        self.index = index
+        self.process = process
+        self.inbox = inbox
+        self.streams: set[int] = set()
+
+
+class LocalSTTWorkerPool:
+    """
+    Worker processes shared by all local recognizers.
+
+    Usage:
+        pool = get_local_stt_pool(VoskEngine("models/vosk"))
+        stream_id = pool.open_stream("es-MX", 8000, handler)
+        pool.write(stream_id, pcm16_chunk)
+        pool.close_stream(stream_id)     # handler receives the last final, then "closed"
+    """
+
+    def __init__(self, engine: Any, workers: int = 0):
+        """
+        Args:
+            engine: Picklable recognizer factory (e.g. VoskEngine)
+            workers: Worker processes (0 = one per CPU core)
+        """
+        self.engine = engine
+        self.size = workers or os.cpu_count() or 1
+
+        # Spawn: never fork a process that runs an event loop and SDK threads
+        self._ctx = multiprocessing.get_context("spawn")
+        self._outbox = self._ctx.Queue()
+        self._workers = [self._spawn(i) for i in range(self.size)]
+        self._handlers: dict[int, tuple[StreamHandler, _Worker]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._running = True
+        self._thread = threading.Thread(target=self._dispatch, name="local-stt-dispatcher", daemon=True)
+        self._thread.start()
+
+        self._stats = {
+            'streams_opened': 0,
+            'partials': 0,
+            'finals': 0,
+            'errors': 0,
+            'worker_restarts': 0,
+            'audio_seconds': 0.0,
+            'cpu_seconds': 0.0
+        }
+
+        logger.info(f"🧠 [LocalSTT] Started {self.size} worker process(es)")
+
+    def _spawn(self, index: int) -> _Worker:
+        inbox = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(self.engine, inbox, self._outbox),
+            name=f"local-stt-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        return _Worker(index, process, inbox)
+
+    # --- Streams ---
+
+    def open_stream(self, language: str, sample_rate: int, handler: StreamHandler) -> int:
+        """Start a stream on the least loaded worker and return its id."""
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("Local STT pool is closed")
+            worker = min(self._workers, key=lambda w: len(w.streams))
+            stream_id = next(self._ids)
+            worker.streams.add(stream_id)
+            self._handlers[stream_id] = (handler, worker)
+            self._stats['streams_opened'] += 1
+        worker.inbox.put(("open", stream_id, language, sample_rate))
+        return stream_id
+
+    def write(self, stream_id: int, data: bytes) -> None:
+        """Queue PCM16 audio for the stream (never blocks on decoding)."""
+        entry = self._handlers.get(stream_id)
+        if entry is not None:
+            entry[1].inbox.put(("audio", stream_id, data))
+
+    def close_stream(self, stream_id: int) -> None:
+        """Flush the stream; its handler gets the last final and then "closed"."""
+        entry = self._handlers.get(stream_id)
+        if entry is not None:
+            entry[1].inbox.put(("close", stream_id))
+
+    # --- Dispatcher thread ---
+
+    def _dispatch(self) -> None:
+        next_check = time.monotonic() + HEALTH_CHECK_SECONDS
+        while self._running:
+            if time.monotonic() >= next_check:
+                # Also under load: a busy queue must not hide a dead worker
+                self._check_workers()
+                next_check = time.monotonic() + HEALTH_CHECK_SECONDS
+            try:
+                kind, stream_id, text, value = self._outbox.get(timeout=HEALTH_CHECK_SECONDS)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return  # Pool closed
+
+            if kind == EVENT_CLOSED:
+                with self._lock:
+                    entry = self._handlers.pop(stream_id, None)
+                    if entry:
+                        entry[1].streams.discard(stream_id)
+                    self._stats['audio_seconds'] += value[0]
+                    self._stats['cpu_seconds'] += value[1]
+            elif kind == EVENT_ERROR:
+                with self._lock:
+                    entry = self._handlers.pop(stream_id, None)
+                    if entry:
+                        entry[1].streams.discard(stream_id)
+                self._stats['errors'] += 1
+                logger.error(f"❌ [LocalSTT] Stream {stream_id} failed: {text}")
+            else:
+                entry = self._handlers.get(stream_id)
+                self._stats['partials' if kind == EVENT_PARTIAL else 'finals'] += 1
+
+            if entry is None:
+                continue
+            try:
+                entry[0](kind, text, value)
+            except Exception as e:
+                logger.error(f"❌ [LocalSTT] Stream handler error: {e}")
+
+    def _check_workers(self) -> None:
+        """Respawn dead workers; their streams get an error event."""
+        for i, worker in enumerate(self._workers):
+            if worker.process.is_alive() or not self._running:
+                continue
+            logger.error(f"❌ [LocalSTT] Worker {worker.index} died (exit {worker.process.exitcode}), respawning")
+            self._stats['worker_restarts'] += 1
+            with self._lock:
+                self._workers[i] = self._spawn(worker.index)
+                lost = [(sid, self._handlers.pop(sid, None)) for sid in worker.streams]
+            for stream_id, entry in lost:
+                self._stats['errors'] += 1
+                if entry:
+                    try:
+                        entry[0](EVENT_ERROR, "Local STT worker died", None)
+                    except Exception as e:
+                        logger.error(f"❌ [LocalSTT] Stream handler error: {e}")
+
+    # --- Lifecycle ---
+
+    def close(self) -> None:
+        """Stop the workers; open streams get no further events."""
+        with self._lock:
+            self._running = False
+            workers = list(self._workers)
+            self._handlers.clear()
+
+        for worker in workers:
+            try:
+                worker.inbox.put(None)
+            except (ValueError, OSError):
+                pass
+        for worker in workers:
+            worker.process.join(timeout=2.0)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        self._thread.join(timeout=HEALTH_CHECK_SECONDS + 1.0)
+        logger.info("🧠 [LocalSTT] Stopped")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with streams_opened/active, partials, finals, errors,
+            worker_restarts, audio/cpu seconds and the real-time factor per core
+        """
+        stats = self._stats.copy()
+        stats['audio_seconds'] = round(stats['audio_seconds'], 3)
+        stats['cpu_seconds'] = round(stats['cpu_seconds'], 3)
+        stats['workers'] = self.size
+        stats['streams_active'] = len(self._handlers)
+        stats['rtf_per_core'] = (
+            round(self._stats['cpu_seconds'] / self._stats['audio_seconds'], 4) if self._stats['audio_seconds'] else None
+        )
+        return stats
+
+
+# =============================================================================
+# Global Pool Instance
+# =============================================================================
+
+_pool: LocalSTTWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_local_stt_pool(engine: Any, workers: int = 0) -> LocalSTTWorkerPool:
+    """Get or create the process-wide local STT worker pool (Singleton)."""
+    global _pool  # noqa: PLW0603 - Singleton pattern for shared worker processes
+    with _pool_lock:
+        if _pool is None:
+            _pool = LocalSTTWorkerPool(engine, workers)
+        return _pool
+
+
+def shutdown_local_stt_pool() -> None:
+    """Stop the process-wide local STT pool if it was created."""
+    global _pool  # noqa: PLW0603 - Singleton pattern for shared worker processes
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,254 @@
+"""
+Shared Silero VAD Engine.
+
+Process-wide VAD inference service. Holds a single ONNX Runtime session and
+batches pending windows from every active call into one `session.run`,
+keeping per-stream recurrent state (`_state` / `_context`) outside the model.
+
+Inference runs on a dedicated worker thread so the asyncio loop never blocks
+on ONNX; callers await an asyncio future that the worker resolves.
+"""
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from app_nuevo.infrastructure.ml.vad_model import create_inference_session
+
+logger = logging.getLogger(__name__)
+
+# Constants
+SUPPORTED_SAMPLE_RATES = (8000, 16000)
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_BATCH_WINDOW_SECONDS = 0.002  # Wait up to 2ms to fill a batch
+
+
+def _window_samples(sample_rate: int) -> int:
+    """Silero V5 window size: 512 samples @ 16k, 256 samples @ 8k (32ms)."""
+    return 512 if sample_rate == 16000 else 256
+
+
+def _context_samples(sample_rate: int) -> int:
+    return 64 if sample_rate == 16000 else 32
+
+
+class VADStream:
+    """
+    Per-call recurrent state for the shared VAD engine.
+
+    A stream must have at most one window in flight at a time, since each
+    inference consumes the state produced by the previous one.
+    """
+
+    def __init__(self, sample_rate: int):
+        if sample_rate not in SUPPORTED_SAMPLE_RATES:
+            raise ValueError(f"Supported sampling rates: {SUPPORTED_SAMPLE_RATES}")
+
+        self.sample_rate = sample_rate
+        self.window_samples = _window_samples(sample_rate)
+        self.reset_states()
+
+    def reset_states(self):
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros((1, _context_samples(self.sample_rate)), dtype=np.float32)
+
+
+@dataclass
+class _PendingWindow:
+    stream: VADStream
+    window: np.ndarray
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+
+
+class SileroVADEngine:
+    """
+    Batched multi-stream Silero VAD inference.
+
+    Usage:
+        engine = get_vad_engine(model_path)
+        stream = engine.create_stream(8000)
+        confidence = await engine.infer(stream, audio_float32)
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS
+    ):
+        self.model_path = model_path
+        self.max_batch_size = max_batch_size
+        self.batch_window_seconds = batch_window_seconds
+
+        self.session = create_inference_session(model_path)
+
+        self._pending: list[_PendingWindow] = []
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="silero-vad-engine", daemon=True)
+        self._thread.start()
+
+        self._stats = {
+            'streams_created': 0,
+            'windows': 0,
+            'batches': 0,
+            'max_batch_size': 0,
+            'errors': 0
+        }
+
+        logger.info(f"🎛️ [VADEngine] Shared Silero session loaded from {model_path}")
+
+    def create_stream(self, sample_rate: int) -> VADStream:
+        """Create per-call state for a new audio stream."""
+        self._stats['streams_created'] += 1
+        return VADStream(sample_rate)
+
+    async def infer(self, stream: VADStream, window: np.ndarray) -> float:
+        """
+        Queue one window for batched inference and await its confidence.
+
+        Args:
+            stream: Per-call state returned by create_stream()
+            window: float32 samples, exactly one Silero window long. The array
+                is read by the worker thread and must not be modified until
+                this call returns (callers may reuse it for the next window).
+
+        Returns:
+            Speech probability for the window.
+        """
+        if window.shape[-1] != stream.window_samples:
+            raise ValueError(
+                f"Provided number of samples is {window.shape[-1]} (Required: {stream.window_samples})"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        item = _PendingWindow(stream, window, future, loop)
+
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("VAD engine is closed")
+            self._pending.append(item)
+            self._cond.notify()
+
+        return await future
+
+    def close(self):
+        """Stop the worker thread and fail any pending windows."""
+        with self._cond:
+            self._running = False
+            pending, self._pending = self._pending, []
+            self._cond.notify()
+
+        for item in pending:
+            self._resolve(item, error=RuntimeError("VAD engine closed"))
+
+        self._thread.join(timeout=1.0)
+        logger.info("🎛️ [VADEngine] Stopped")
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with streams_created, windows, batches, max_batch_size, errors
+        """
+        return self._stats.copy()
+
+    # --- Worker thread ---
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+                # Give concurrent calls a moment to join the batch
+                if len(self._pending) < self.max_batch_size and self.batch_window_seconds > 0:
+                    self._cond.wait(self.batch_window_seconds)
+
+                batch = self._pending[:self.max_batch_size]
+                del self._pending[:self.max_batch_size]
+
+            # One session.run per sample rate present in the batch
+            by_rate: dict[int, list[_PendingWindow]] = {}
+            for item in batch:
+                by_rate.setdefault(item.stream.sample_rate, []).append(item)
+
+            for sample_rate, items in by_rate.items():
+                try:
+                    self._run_batch(sample_rate, items)
+                except Exception as e:
+                    self._stats['errors'] += 1
+                    logger.error(f"VAD Engine Inference Error: {e}")
+                    for item in items:
+                        self._resolve(item, error=e)
+
+    def _run_batch(self, sample_rate: int, items: list[_PendingWindow]):
+        context_size = _context_samples(sample_rate)
+
+        x = np.concatenate(
+            [np.concatenate((item.stream._context, item.window.reshape(1, -1)), axis=1) for item in items],
+            axis=0
+        )
+        state = np.concatenate([item.stream._state for item in items], axis=1)
+
+        out, new_state = self.session.run(
+            None,
+            {"input": x, "state": state, "sr": np.array(sample_rate, dtype="int64")}
+        )
+
+        for i, item in enumerate(items):
+            item.stream._state = new_state[:, i:i + 1, :].copy()
+            item.stream._context = x[i:i + 1, -context_size:].copy()
+            self._resolve(item, result=float(out[i][0]))
+
+        self._stats['windows'] += len(items)
+        self._stats['batches'] += 1
+        if len(items) > self._stats['max_batch_size']:
+            self._stats['max_batch_size'] = len(items)
+
+    @staticmethod
+    def _resolve(item: _PendingWindow, result: float | None = None, error: Exception | None = None):
+        def _set():
+            if item.future.done():
+                return
+            if error is not None:
+                item.future.set_exception(error)
+            else:
+                item.future.set_result(result)
+
+        try:
+            item.loop.call_soon_threadsafe(_set)
+        except RuntimeError:
+            # Loop already closed (call torn down)
+            pass
+
+
+# =============================================================================
+# Global Engine Instance
+# =============================================================================
+_engine: SileroVADEngine | None = None
+_engine_lock = threading.Lock()
+
+def get_vad_engine(model_path: str) -> SileroVADEngine:
+    """Get or create the process-wide VAD engine (Singleton)."""
+    global _engine  # noqa: PLW0603 - Singleton pattern for shared ONNX session
+    with _engine_lock:
+        if _engine is None:
+            _engine = SileroVADEngine(model_path)
+        return _engine
+
+def shutdown_vad_engine() -> None:
+    """Close the process-wide VAD engine if it was created."""
+    global _engine  # noqa: PLW0603 - Singleton pattern for shared ONNX session
+    with _engine_lock:
+        if _engine is not None:
+            _engine.close()
+            _engine = None
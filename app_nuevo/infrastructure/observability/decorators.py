@@ -117,9 +117,10 @@ def track_streaming_latency(port_name: str) -> Callable:
             start_time = time.time()
             ttfb_logged = False
             chunk_count = 0
+            stream = func(*args, **kwargs)
 
             try:
-                async for chunk in func(*args, **kwargs):
+                async for chunk in stream:
                     chunk_count += 1
 
                     # Log TTFB on first chunk
@@ -146,6 +147,10 @@ def track_streaming_latency(port_name: str) -> Callable:
                     f"(chunks={chunk_count}, error={type(e).__name__})"
                 )
                 raise
+            finally:
+                # Close the wrapped stream now when the consumer stops early,
+                # instead of whenever the loop's asyncgen finalizer gets to it
+                await stream.aclose()
 
         return wrapper
     return decorator
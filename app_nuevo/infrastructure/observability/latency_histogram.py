@@ -0,0 +1,95 @@
+"""
+Latency Histogram - P3 (Observability)
+
+Bucketed latency distribution with exponential aging, cheap enough to update
+on every request and used to drive adaptive timeouts (e.g. TTS hedging delay).
+"""
+import bisect
+import threading
+from typing import Any
+
+# Constants
+# Bucket upper bounds (ms); the last bucket is open-ended
+DEFAULT_BUCKETS_MS = (
+    10, 25, 50, 75, 100, 150, 200, 250, 300, 400, 500, 650, 800,
+    1000, 1300, 1600, 2000, 2500, 3200, 4000, 5000, 7500, 10000
+)
+DEFAULT_HALF_LIFE_SAMPLES = 500  # Counts are halved after this many samples
+
+
+class LatencyHistogram:
+    """
+    Aging latency histogram.
+
+    Counts are halved every `half_life_samples` observations, so percentiles
+    follow the provider's current behaviour instead of its all-time average.
+
+    Usage:
+        hist = LatencyHistogram()
+        hist.record(182.0)
+        p95 = hist.percentile(0.95)   # ms, None until there is data
+    """
+
+    def __init__(
+        self,
+        buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS,
+        half_life_samples: int = DEFAULT_HALF_LIFE_SAMPLES
+    ):
+        self.buckets_ms = tuple(buckets_ms)
+        self.half_life_samples = half_life_samples
+        self._counts = [0.0] * (len(self.buckets_ms) + 1)
+        self._total = 0.0
+        self._since_decay = 0
+        self._samples = 0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float) -> None:
+        """Add one observation."""
+        index = bisect.bisect_left(self.buckets_ms, latency_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += 1
+            self._samples += 1
+            self._max_ms = max(self._max_ms, latency_ms)
+
+            self._since_decay += 1
+            if self._since_decay >= self.half_life_samples:
+                self._counts = [c / 2 for c in self._counts]
+                self._total /= 2
+                self._since_decay = 0
+
+    @property
+    def count(self) -> int:
+        """Observations recorded (all time)."""
+        return self._samples
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Latency (ms) below which a fraction q of observations fall,
+        linearly interpolated inside the bucket. None if empty.
+        """
+        with self._lock:
+            if self._total <= 0:
+                return None
+            target = q * self._total
+            cumulative = 0.0
+            for index, count in enumerate(self._counts):
+                if count and cumulative + count >= target:
+                    lower = self.buckets_ms[index - 1] if index > 0 else 0.0
+                    upper = self.buckets_ms[index] if index < len(self.buckets_ms) else max(self._max_ms, lower)
+                    fraction = (target - cumulative) / count
+                    return min(lower + (upper - lower) * fraction, self._max_ms)
+                cumulative += count
+            return self._max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summary for get_stats(): count, p50, p95, p99, max (ms)."""
+        p50, p95, p99 = (self.percentile(q) for q in (0.5, 0.95, 0.99))
+        return {
+            'count': self._samples,
+            'p50_ms': round(p50, 1) if p50 is not None else None,
+            'p95_ms': round(p95, 1) if p95 is not None else None,
+            'p99_ms': round(p99, 1) if p99 is not None else None,
+            'max_ms': round(self._max_ms, 1)
+        }
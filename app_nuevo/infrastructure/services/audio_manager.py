@@ -3,13 +3,26 @@ Audio Manager.
 
 Handles audio streaming, queuing, and chunking strategies for different client types.
 Encapsulates low-level audio transport logic avoiding blocking operations.
+
+Outbound audio is released by a paced playout scheduler: exactly one 20ms
+frame per tick on a monotonic clock, with absolute deadlines so sleep
+overshoot never accumulates into drift. Background ambience is mixed under
+speech (AmbienceMixer) rather than alternating with it.
 """
 import asyncio
 import contextlib
 import logging
+import time
 from pathlib import Path
 
+import numpy as np
+
 from app_nuevo.domain.ports import AudioTransport
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.infrastructure.audio.asset_cache import get_audio_asset_cache
+from app_nuevo.infrastructure.audio.codecs import decode_to_pcm16
+from app_nuevo.infrastructure.audio.mixer import DEFAULT_AMBIENCE_GAIN, AmbienceMixer
+from app_nuevo.infrastructure.audio.ring_buffer import AudioRingBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +33,21 @@ CLIENT_TYPE_BROWSER = "browser"
 CLIENT_TYPE_TWILIO = "twilio"
 CLIENT_TYPE_TELNYX = "telnyx"
 
+MAX_CATCHUP_FRAMES = 3  # Behind schedule by more than this -> resync clock instead of bursting
+PARTIAL_FRAME_HOLD_TICKS = 1  # Ticks to wait for the rest of a partial frame before padding
+
+SILENCE_BYTES = {
+    "mulaw": 0xFF,
+    "alaw": 0xD5,
+    "pcm": 0x00
+}
+
+
+def frame_size_bytes(audio_config: AudioConfig) -> int:
+    """Bytes in one STREAM_INTERVAL_SECONDS frame for the given format."""
+    bytes_per_sample = max(audio_config.bits_per_sample // 8, 1)
+    return int(audio_config.sample_rate * STREAM_INTERVAL_SECONDS) * bytes_per_sample * audio_config.channels
+
 
 class AudioManager:
     """
@@ -27,28 +55,46 @@ class AudioManager:
 
     Responsibilities:
     - Audio queue management (async)
-    - Chunked audio transmission (adapted to client type)
-    - Background audio looping (comfort noise)
+    - Paced frame transmission (one 20ms frame per tick, adapted to client format)
+    - Background audio mixing (ambience under speech, comfort noise in gaps)
     - Stream lifecycle management
     """
 
-    def __init__(self, transport: AudioTransport, client_type: str = CLIENT_TYPE_TWILIO):
+    def __init__(
+        self,
+        transport: AudioTransport,
+        client_type: str = CLIENT_TYPE_TWILIO,
+        audio_config: AudioConfig | None = None
+    ):
         """
         Initialize AudioManager.
 
         Args:
             transport: Audio transport interface (WebSocket wrapper)
             client_type: Client identifier (browser/twilio/telnyx)
+            audio_config: Outbound audio format (defaults to client_type mapping)
         """
         self.transport = transport
         self.client_type = client_type
+        self.audio_config = audio_config or AudioConfig.from_legacy_mode(client_type)
 
         # Audio Queue (unbounded by default, implicit backpressure via pipeline)
         self.audio_queue: asyncio.Queue = asyncio.Queue()
 
+        # Playout State: queued blobs are re-blocked into fixed frames here
+        self.frame_size = frame_size_bytes(self.audio_config)
+        self.silence_byte = SILENCE_BYTES.get(self.audio_config.encoding, 0x00)
+        self._playout = AudioRingBuffer(self.frame_size * 50)
+        self._frame = bytearray(self.frame_size)
+        self._frame_view = memoryview(self._frame)
+        self._partial_ticks = 0
+
+        # Frame-aligned blob being played in place (framed TTS output skips the ring buffer)
+        self._block: bytes | None = None
+        self._block_offset = 0
+
         # Background Audio State
-        self.bg_loop_buffer: bytes | None = None
-        self.bg_loop_index: int = 0
+        self.mixer: AmbienceMixer | None = None
 
         # Stream Task
         self.stream_task: asyncio.Task | None = None
@@ -59,6 +105,20 @@ class AudioManager:
         # Bot speaking state
         self.is_bot_speaking = False
 
+        self._stats = {
+            'ticks': 0,
+            'speech_frames': 0,
+            'background_frames': 0,  # Ambience-only frames (gaps)
+            'mixed_frames': 0,       # Speech frames with ambience mixed in
+            'padded_frames': 0,      # Final partial frames completed with silence
+            'underruns': 0,          # Ticks with speech pending but less than a frame buffered (incl. utterance tails)
+            'late_ticks': 0,         # Ticks that woke after their deadline + 1 interval
+            'resyncs': 0,            # Clock resets after falling > MAX_CATCHUP_FRAMES behind
+            'cancelled_bytes': 0,    # Audio discarded by barge-in/clear
+            'jitter_max_ms': 0.0,
+            'jitter_avg_ms': 0.0     # EWMA of wake-up lateness
+        }
+
     async def start(self):
         """Start audio streaming loop."""
         if not self.stream_task:
@@ -72,14 +132,14 @@ class AudioManager:
             with contextlib.suppress(asyncio.CancelledError):
                 await self.stream_task
             self.stream_task = None
-            logger.info("🔇 [AudioManager] Stream loop stopped")
+            logger.info(f"🔇 [AudioManager] Stream loop stopped | stats={self.get_stats()}")
 
     async def send_audio_chunked(self, audio_data: bytes) -> None:
         """
-        Queue audio for chunked transmission.
+        Queue audio for paced transmission.
 
-        For telephony: chunks to CHUNK_SIZE_TELEPHONY
-        For browser: sends full blob
+        The stream loop re-blocks queued audio into 20ms frames
+        (160 bytes for telephony, 640 bytes for 16kHz PCM) and releases one per tick.
 
         Args:
             audio_data: Raw audio bytes to transmit
@@ -95,16 +155,23 @@ class AudioManager:
         await self.audio_queue.put(audio_data)
 
     async def clear_queue(self):
-        """Clear all pending audio from queue."""
+        """Clear all pending audio from queue and playout buffer."""
         count = 0
         while not self.audio_queue.empty():
             try:
-                self.audio_queue.get_nowait()
+                blob = self.audio_queue.get_nowait()
                 self.audio_queue.task_done()
+                self._stats['cancelled_bytes'] += len(blob)
                 count += 1
             except asyncio.QueueEmpty:
                 break
 
+        # Drop the partially played utterance: takes effect on the next tick (<20ms)
+        self._stats['cancelled_bytes'] += self._playout.readable + self._block_remaining()
+        self._playout.clear()
+        self._block = None
+        self._partial_ticks = 0
+
         if count > 0:
             logger.info(f"🗑️ [AudioManager] Cleared {count} audio chunks from queue")
 
@@ -114,121 +181,214 @@ class AudioManager:
         await self.clear_queue()
         self.is_bot_speaking = False
 
-    def set_background_audio(self, audio_buffer: bytes):
+    @property
+    def is_playing(self) -> bool:
+        """True while speech audio is still queued or buffered for playout."""
+        return self._has_pending_speech()
+
+    def _block_remaining(self) -> int:
+        return len(self._block) - self._block_offset if self._block is not None else 0
+
+    def get_stats(self) -> dict[str, float]:
         """
-        Set background audio loop buffer.
+        Get playout scheduler statistics.
+
+        Returns:
+            Dictionary with tick/frame counters, underruns, late ticks and jitter (ms)
+        """
+        stats = self._stats.copy()
+        buffered = self._playout.readable + self._block_remaining()
+        stats['buffered_ms'] = round(buffered / self.frame_size * STREAM_INTERVAL_SECONDS * 1000, 1)
+        return stats
+
+    def set_background_audio(self, audio_buffer: bytes, gain: float = DEFAULT_AMBIENCE_GAIN):
+        """
+        Set background audio from raw audio in the transport encoding.
 
         Args:
-            audio_buffer: Audio to loop during silence
+            audio_buffer: Headerless audio to loop (transport codec and rate)
+            gain: Ambience gain relative to speech
         """
-        self.bg_loop_buffer = audio_buffer
-        self.bg_loop_index = 0
-        logger.info(f"🎵 [AudioManager] Background audio set ({len(audio_buffer)} bytes)")
+        bed = decode_to_pcm16(audio_buffer[:len(audio_buffer) - len(audio_buffer) % self._bytes_per_sample()],
+                              self.audio_config.encoding)
+        self.set_background_pcm(bed, gain)
 
-    async def load_background_audio(self, file_path: str):
+    def set_background_pcm(self, samples: np.ndarray, gain: float = DEFAULT_AMBIENCE_GAIN):
         """
-        Load background audio from file path (Non-blocking).
-        Uses a thread executor to avoid blocking the asyncio loop during disk IO.
+        Set background audio from PCM16 samples at the transport sample rate.
 
         Args:
-            file_path: Path to .wav file
+            samples: int16 NumPy array (may be shared/read-only across calls)
+            gain: Ambience gain relative to speech
+        """
+        frame_samples = self.frame_size // self._bytes_per_sample()
+        self.mixer = AmbienceMixer(samples, self.audio_config.encoding, frame_samples, gain)
+        logger.info(f"🎵 [AudioManager] Background audio set ({len(samples)} samples, gain={gain})")
+
+    async def load_background_audio(self, file_path: str, gain: float = DEFAULT_AMBIENCE_GAIN):
+        """
+        Load background audio from a .wav file path (Non-blocking).
+
+        Decoding happens once per process and sample rate in the shared AudioAssetCache
+        (worker thread on a miss); this call only references the cached read-only PCM.
+
+        Args:
+            file_path: Path to .wav file (PCM16, A-law or mu-law)
+            gain: Ambience gain relative to speech
         """
         if not Path(file_path).exists():
             logger.warning(f"⚠️ [AudioManager] Background audio file not found: {file_path}")
             return
 
         try:
-            loop = asyncio.get_running_loop()
-            # Offload blocking IO to thread pool
-            audio_data = await loop.run_in_executor(None, self._read_file_sync, file_path)
-            self.set_background_audio(audio_data)
+            asset = await get_audio_asset_cache().load(file_path, self.audio_config.sample_rate)
+            self.set_background_pcm(asset.pcm, gain)
         except Exception as e:
             logger.error(f"❌ [AudioManager] Failed to load background audio: {e}")
 
-    @staticmethod
-    def _read_file_sync(path: str) -> bytes:
-        """Sync helper for file reading (runs in thread)."""
-        with open(path, 'rb') as f:
-            return f.read()
+    def _bytes_per_sample(self) -> int:
+        return max(self.audio_config.bits_per_sample // 8, 1)
 
     async def _audio_stream_loop(self):
         """
-        Main audio streaming loop.
+        Main audio streaming loop (paced playout scheduler).
 
-        Continuously transmits audio chunks from queue or background audio.
+        Releases exactly one frame per STREAM_INTERVAL_SECONDS tick: speech when
+        available, otherwise background audio. Deadlines are absolute on the
+        monotonic clock, so oversleeping one tick shortens the next sleep
+        instead of accumulating drift. When there is nothing to play the loop
+        parks on the queue instead of ticking.
         """
+        next_tick = time.monotonic()
+
         while True:
             try:
-                # Try to get audio from queue (non-blocking with timeout)
-                try:
-                    audio_blob = await asyncio.wait_for(
-                        self.audio_queue.get(),
-                        timeout=0.1
-                    )
-
-                    # Transmit queued audio
-                    await self._transmit_audio(audio_blob)
+                if not self._has_pending_speech() and not self.mixer:
+                    # Idle: wait for speech without spinning, then restart the clock
+                    blob = await self.audio_queue.get()
                     self.audio_queue.task_done()
+                    self._accept(blob)
+                    next_tick = time.monotonic()
+
+                frame = self._next_frame()
+                if frame is not None:
+                    await self.transport.send_audio(frame)
 
-                except TimeoutError:
-                    # No queued audio - send background audio if available
-                    # Only play background noise if we are SURE bot is not talking
-                    if self.bg_loop_buffer and not self.is_bot_speaking:
-                        await self._transmit_background_audio()
-                    else:
-                        # Small sleep to prevent busy loop
-                        await asyncio.sleep(STREAM_INTERVAL_SECONDS)
+                next_tick = await self._wait_next_tick(next_tick)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"❌ [AudioManager] Stream loop error: {e}", exc_info=True)
                 await asyncio.sleep(0.1)
-
-    async def _transmit_audio(self, audio_blob: bytes):
+                next_tick = time.monotonic()
+
+    async def _wait_next_tick(self, previous_tick: float) -> float:
+        """Sleep until the next absolute deadline and record jitter. Returns that deadline."""
+        next_tick = previous_tick + STREAM_INTERVAL_SECONDS
+        delay = next_tick - time.monotonic()
+
+        if delay < -MAX_CATCHUP_FRAMES * STREAM_INTERVAL_SECONDS:
+            # Loop stalled (GC, blocking call): resync rather than burst the backlog
+            self._stats['resyncs'] += 1
+            return time.monotonic()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        lateness = max(time.monotonic() - next_tick, 0.0)
+        self._record_jitter(lateness)
+        return next_tick
+
+    def _record_jitter(self, lateness: float) -> None:
+        stats = self._stats
+        stats['ticks'] += 1
+        lateness_ms = lateness * 1000
+        if lateness > STREAM_INTERVAL_SECONDS:
+            stats['late_ticks'] += 1
+        if lateness_ms > stats['jitter_max_ms']:
+            stats['jitter_max_ms'] = round(lateness_ms, 2)
+        stats['jitter_avg_ms'] = round(stats['jitter_avg_ms'] * 0.95 + lateness_ms * 0.05, 3)
+
+    def _has_pending_speech(self) -> bool:
+        return self._block is not None or self._playout.readable > 0 or not self.audio_queue.empty()
+
+    def _accept(self, blob: bytes) -> None:
+        """Route a dequeued blob: frame-aligned audio is played in place, the rest is re-blocked."""
+        if self._block is None and not self._playout.readable and len(blob) % self.frame_size == 0:
+            self._block = blob
+            self._block_offset = 0
+        else:
+            self._playout.write(blob)
+
+    def _fill_playout(self) -> None:
+        """Dequeue blobs until a full frame is available."""
+        while (
+            self._block is None
+            and self._playout.readable < self.frame_size
+            and not self.audio_queue.empty()
+        ):
+            blob = self.audio_queue.get_nowait()
+            self.audio_queue.task_done()
+            self._accept(blob)
+
+    def _next_block_frame(self) -> bytes:
+        """Next frame of the in-place block (no copy when the block is a single frame)."""
+        block, start = self._block, self._block_offset
+        end = start + self.frame_size
+        if end >= len(block):
+            self._block = None
+            return block if start == 0 else block[start:]
+        self._block_offset = end
+        return block[start:end]
+
+    def _next_frame(self) -> bytes | None:
         """
-        Transmit audio blob with chunking based on client type.
+        Build the frame for this tick.
 
-        Args:
-            audio_blob: Audio data to transmit
+        Returns:
+            One frame of speech (with ambience mixed in), ambience only, or None (gap).
         """
-        if self.client_type == CLIENT_TYPE_BROWSER:
-            # Browser: send full blob
-            await self.transport.send_audio(audio_blob)
-            # logger.debug(f"📤 [AudioManager] Sent {len(audio_blob)} bytes (browser)")
-        else:
-            # Telephony: chunking
-            chunk_size = CHUNK_SIZE_TELEPHONY
-            for i in range(0, len(audio_blob), chunk_size):
-                chunk = audio_blob[i:i + chunk_size]
-                await self.transport.send_audio(chunk)
-
-            # logger.debug(f"📤 [AudioManager] Sent {len(audio_blob)} bytes in chunks")
-
-        # Note: We do NOT auto-reset is_bot_speaking to False here anymore.
-        # It's safer to let the Orchestrator/Pipeline signal explicit "End of Turn".
-        # For now, we keep it simple but logged.
-
-        if self.audio_queue.empty():
-             # Graceful state update: Only reset if we truly have nothing left.
-             pass
-
-    async def _transmit_background_audio(self):
-        """Transmit background audio chunk."""
-        if not self.bg_loop_buffer:
-            return
-
-        chunk_size = CHUNK_SIZE_TELEPHONY
-        chunk = self.bg_loop_buffer[
-            self.bg_loop_index : self.bg_loop_index + chunk_size
-        ]
-
-        if len(chunk) < chunk_size:
-            # Loop back to start
-            self.bg_loop_index = 0
-            chunk = self.bg_loop_buffer[0:chunk_size]
-        else:
-            self.bg_loop_index += chunk_size
-
-        await self.transport.send_audio(chunk)
-        await asyncio.sleep(STREAM_INTERVAL_SECONDS)
+        self._fill_playout()
+
+        if self._block is not None:
+            self._partial_ticks = 0
+            self._stats['speech_frames'] += 1
+            return self._mix_speech_frame(self._next_block_frame())
+
+        buffered = self._playout.readable
+        if buffered >= self.frame_size:
+            self._partial_ticks = 0
+            self._playout.read_into(self._frame_view)
+            self._stats['speech_frames'] += 1
+            return self._mix_speech_frame(self._frame)
+
+        if buffered > 0:
+            # Partial frame: give the producer a tick to deliver the rest
+            if self._partial_ticks < PARTIAL_FRAME_HOLD_TICKS:
+                self._partial_ticks += 1
+                self._stats['underruns'] += 1
+                return self._next_background_frame()
+
+            # End of utterance: pad the tail with codec silence
+            self._partial_ticks = 0
+            n = self._playout.read_into(self._frame_view)
+            self._frame[n:] = bytes([self.silence_byte]) * (self.frame_size - n)
+            self._stats['speech_frames'] += 1
+            self._stats['padded_frames'] += 1
+            return self._mix_speech_frame(self._frame)
+
+        return self._next_background_frame()
+
+    def _mix_speech_frame(self, frame: bytes | bytearray) -> bytes:
+        if not self.mixer:
+            return bytes(frame)  # No copy for bytes
+        self._stats['mixed_frames'] += 1
+        return self.mixer.mix(frame)
+
+    def _next_background_frame(self) -> bytes | None:
+        """Next frame of the ambience loop (comfort audio), if any."""
+        if not self.mixer:
+            return None
+        self._stats['background_frames'] += 1
+        return self.mixer.mix(None)
@@ -0,0 +1,298 @@
+"""
+Voice Catalog Service.
+
+Stale-while-revalidate cache of the TTS provider's voice list (voices and
+their styles):
+
+- Readers never wait on the provider once the catalog has data: an expired
+  catalog is served as-is while ONE background refresh runs (single-flight).
+- A background refresher task renews the catalog before it expires.
+- Every successful refresh is persisted as a JSON snapshot, so a cold start
+  serves the dashboard from disk instead of waiting on the provider.
+- With no catalog at all (no snapshot, provider unreachable) the dashboard
+  gets a small built-in voice list, so the voice picker is never empty.
+"""
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_TTL_SECONDS = 3600           # Catalog considered stale after this
+DEFAULT_REFRESH_INTERVAL_SECONDS = 3000  # Background refresh period (< TTL: readers never see it stale)
+RETRY_INTERVAL_SECONDS = 60          # No new refresh this soon after a failed one
+SNAPSHOT_VERSION = 1
+
+# A voice entry: {"id", "name", "gender", "locale", "styles": [{"id", "label"}]}
+VoiceFetcher = Callable[[], Awaitable[list[dict[str, Any]]]]
+
+
+class VoiceCatalog:
+    """
+    Voice list with stale-while-revalidate semantics.
+
+    Usage:
+        catalog = VoiceCatalog(fetch_voices, snapshot_path=".cache/voice_catalog.json")
+        await catalog.start()                   # load snapshot + background refresher
+        voices = await catalog.get_voices("es-MX")
+        await catalog.stop()
+    """
+
+    def __init__(
+        self,
+        fetcher: VoiceFetcher,
+        snapshot_path: str | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        fallback_voices: list[dict[str, Any]] | None = None
+    ):
+        """
+        Args:
+            fetcher: Coroutine returning the provider's voice entries
+            snapshot_path: JSON snapshot file (None = memory only)
+            ttl_seconds: Age after which a read triggers a refresh
+            refresh_interval_seconds: Period of the background refresher
+            fallback_voices: Voice entries shown on the dashboard while there is no catalog
+        """
+        self.fetcher = fetcher
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.ttl_seconds = ttl_seconds
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.fallback_voices = fallback_voices or []
+
+        self._voices: list[dict[str, Any]] = []
+        self._styles: dict[str, list[dict[str, str]]] = {}
+        self._updated_at = 0.0  # Wall clock (snapshots survive restarts)
+        self._snapshot_checked = False
+        self._last_failure_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+        self._refresher_task: asyncio.Task | None = None
+        self._stats = {
+            'reads': 0,
+            'stale_reads': 0,
+            'blocking_reads': 0,
+            'refreshes': 0,
+            'refresh_failures': 0,
+            'coalesced_refreshes': 0,
+            'snapshot_loads': 0,
+            'fallback_reads': 0
+        }
+
+    # --- Lifecycle ---
+
+    async def start(self) -> None:
+        """Load the snapshot (if any) and start the background refresher."""
+        await self._load_snapshot()
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._refresher())
+
+    async def stop(self) -> None:
+        """Stop the background refresher and any in-flight refresh."""
+        for task in (self._refresher_task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._refresher_task = None
+        self._refresh_task = None
+
+    async def _refresher(self) -> None:
+        """Refresh whenever the catalog is older than the refresh interval."""
+        while True:
+            try:
+                if self.age_seconds >= self.refresh_interval_seconds:
+                    await self.refresh()
+                delay = self.refresh_interval_seconds - self.age_seconds
+            except Exception as e:
+                logger.warning(f"⚠️ [VoiceCatalog] Background refresh failed: {e}")
+                delay = RETRY_INTERVAL_SECONDS
+            await asyncio.sleep(max(delay, 1.0))
+
+    # --- Reads ---
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self._updated_at if self._updated_at else float('inf')
+
+    @property
+    def is_stale(self) -> bool:
+        return self.age_seconds >= self.ttl_seconds
+
+    async def get_catalog(self) -> list[dict[str, Any]]:
+        """
+        All voice entries.
+
+        Waits on the provider only when there is no data at all (no snapshot,
+        first start). A stale catalog is returned immediately and refreshed in
+        the background.
+        """
+        self._stats['reads'] += 1
+        if not self._voices:
+            await self._load_snapshot()
+
+        if not self._voices:
+            if self._retry_allowed():
+                self._stats['blocking_reads'] += 1
+                with contextlib.suppress(Exception):
+                    await self.refresh()
+        elif self.is_stale and self._retry_allowed():
+            self._stats['stale_reads'] += 1
+            self._refresh_in_background()
+
+        return self._voices
+
+    async def get_voices(self, language: str | None = None) -> list[dict[str, Any]]:
+        voices = await self.get_catalog()
+        if language:
+            return [v for v in voices if v.get("locale") == language]
+        return voices
+
+    async def get_styles(self, voice_id: str) -> list[dict[str, str]]:
+        await self.get_catalog()
+        return self._styles.get(voice_id, [])
+
+    async def get_dashboard_catalog(self) -> tuple[dict[str, list[dict]], dict[str, list[dict]]]:
+        """
+        Dashboard shape. Falls back to fallback_voices while the catalog is
+        empty (cold start without snapshot and the provider unreachable).
+
+        Returns:
+            (voices by locale: [{"id", "name", "gender"}], styles by voice id)
+        """
+        voices = await self.get_catalog()
+        if not voices:
+            self._stats['fallback_reads'] += 1
+            voices = self.fallback_voices
+
+        voices_by_locale: dict[str, list[dict]] = {}
+        for voice in voices:
+            voices_by_locale.setdefault(voice["locale"], []).append({
+                "id": voice["id"],
+                "name": voice["name"],
+                "gender": str(voice["gender"]).lower()
+            })
+        return voices_by_locale, self._styles
+
+    # --- Refresh ---
+
+    async def refresh(self) -> list[dict[str, Any]]:
+        """
+        Fetch the voice list now. Concurrent callers share one provider call.
+
+        Raises:
+            The fetcher's exception (the current catalog is kept).
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+        else:
+            self._stats['coalesced_refreshes'] += 1
+        # Shielded: a cancelled reader must not abort the shared refresh
+        return await asyncio.shield(self._refresh_task)
+
+    def _retry_allowed(self) -> bool:
+        """Failing provider: readers don't hammer it (the refresher keeps retrying)."""
+        return time.monotonic() - self._last_failure_at >= RETRY_INTERVAL_SECONDS or not self._last_failure_at
+
+    def _refresh_in_background(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        else:
+            self._stats['coalesced_refreshes'] += 1
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            logger.warning(f"⚠️ [VoiceCatalog] Refresh failed, serving stale catalog: {task.exception()}")
+
+    async def _do_refresh(self) -> list[dict[str, Any]]:
+        self._stats['refreshes'] += 1
+        try:
+            voices = await self.fetcher()
+        except Exception:
+            self._stats['refresh_failures'] += 1
+            self._last_failure_at = time.monotonic()
+            raise
+        if not voices:
+            # An empty list is an API failure, not a real catalog: keep what we have
+            self._stats['refresh_failures'] += 1
+            self._last_failure_at = time.monotonic()
+            raise RuntimeError("Provider returned no voices")
+
+        self._set(voices, time.time())
+        logger.info(f"✅ [VoiceCatalog] Cached {len(voices)} voices and styles.")
+        await self._save_snapshot()
+        return voices
+
+    def _set(self, voices: list[dict[str, Any]], updated_at: float) -> None:
+        # Atomic swap: readers see either the old or the new catalog
+        self._styles = {v["id"]: v.get("styles") or [] for v in voices}
+        self._voices = voices
+        self._updated_at = updated_at
+
+    # --- Snapshot ---
+
+    async def _load_snapshot(self) -> None:
+        if self._snapshot_checked or self.snapshot_path is None:
+            return
+        self._snapshot_checked = True
+        try:
+            data = await asyncio.to_thread(self._read_snapshot, self.snapshot_path)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"⚠️ [VoiceCatalog] Ignoring unreadable snapshot {self.snapshot_path}: {e}")
+            return
+
+        if data.get("version") != SNAPSHOT_VERSION or not data.get("voices") or self._voices:
+            return
+        self._set(data["voices"], float(data.get("updated_at", 0.0)))
+        self._stats['snapshot_loads'] += 1
+        logger.info(
+            f"📂 [VoiceCatalog] Loaded {len(self._voices)} voices from snapshot "
+            f"(age {self.age_seconds / 60:.0f} min)"
+        )
+
+    async def _save_snapshot(self) -> None:
+        if self.snapshot_path is None:
+            return
+        data = {"version": SNAPSHOT_VERSION, "updated_at": self._updated_at, "voices": self._voices}
+        try:
+            await asyncio.to_thread(self._write_snapshot, self.snapshot_path, data)
+        except Exception as e:
+            logger.warning(f"⚠️ [VoiceCatalog] Could not write snapshot: {e}")
+
+    @staticmethod
+    def _read_snapshot(path: Path) -> dict[str, Any]:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_snapshot(path: Path, data: dict[str, Any]) -> None:
+        """Atomic write: readers (other workers) never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def get_stats(self) -> dict[str, Any]:
+        """Read/refresh counters plus catalog size and age."""
+        stats = self._stats.copy()
+        stats['voices'] = len(self._voices)
+        stats['age_seconds'] = round(self.age_seconds, 1) if self._updated_at else None
+        stats['stale'] = self.is_stale
+        return stats
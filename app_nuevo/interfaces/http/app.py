@@ -1,6 +1,7 @@
 """
 FastAPI Application Factory.
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -45,11 +46,49 @@ async def lifespan(app: FastAPI):
     logger.info("🌱 Seeding default data...")
     await seed_default_config()
     logger.info("✅ Seeding complete")
+
+    # Warm decoded background/hold audio (shared read-only across calls)
+    from app_nuevo.domain.value_objects.audio_config import AudioConfig
+    from app_nuevo.infrastructure.audio.asset_cache import get_audio_asset_cache, list_sound_assets
+    asset_cache = get_audio_asset_cache()
+    await asset_cache.warm(
+        list_sound_assets(),
+        [AudioConfig.telephony(), AudioConfig.telephony_alaw(), AudioConfig.high_quality()]
+    )
+    logger.info(f"✅ Audio assets warmed: {asset_cache.get_stats()}")
+
+    # Pre-render profile greetings into the TTS cache (background: don't delay readiness)
+    from app_nuevo.application.services.tts_warmup import prerender_greetings
+    from app_nuevo.domain.ports import TTSPort
+
+    async def _warm_greetings():
+        try:
+            rendered = await prerender_greetings(container.resolve(TTSPort), container.resolve(ConfigRepositoryPort))
+            logger.info(f"✅ TTS greetings pre-rendered: {rendered}")
+        except Exception as e:
+            logger.warning(f"⚠️ TTS greeting warm-up failed: {e}")
+
+    app.state.tts_warmup_task = asyncio.create_task(_warm_greetings())
+
+    # Voice catalog: snapshot from disk now, Azure refresh in the background
+    from app_nuevo.infrastructure.adapters.tts.azure_tts_adapter import get_voice_catalog
+    voice_catalog = get_voice_catalog()
+    await voice_catalog.start()
     
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down Voice Assistant App...")
+    app.state.tts_warmup_task.cancel()
+    await voice_catalog.stop()
+
+    # Stop shared VAD inference thread (created lazily by the first call)
+    from app_nuevo.infrastructure.ml.vad_engine import shutdown_vad_engine
+    shutdown_vad_engine()
+
+    # Stop shared local STT worker processes (created lazily by the first call)
+    from app_nuevo.infrastructure.ml.local_stt_engine import shutdown_local_stt_pool
+    shutdown_local_stt_pool()
     # Cleanup resources if needed
     # (e.g., container.close() or manage.disconnect())
 
@@ -166,20 +205,12 @@ def create_app() -> FastAPI:
             merged_config[f"{k}_telnyx"] = v
             if k == "llm_provider": merged_config["llm_provider_telnyx"] = v
 
-        # 4. Fetch Catalogs (Stubs for now, to be filled by Adapters)
-        # In a real scenario, we'd resolve TTSAdapter/LLMAdapter here
-        voices_json = {
-            "azure": {
-                "es-MX": [
-                    {"id": "es-MX-DaliaNeural", "name": "Dalia (Femenino)", "gender": "female"},
-                    {"id": "es-MX-JorgeNeural", "name": "Jorge (Masculino)", "gender": "male"}
-                ],
-                "en-US": [
-                    {"id": "en-US-JennyNeural", "name": "Jenny (Female)", "gender": "female"}
-                ]
-            }
-        }
-        styles_json = {} # Azure styles
+        # 4. Fetch Catalogs
+        # Voices/styles: shared catalog (served from memory/snapshot, refreshed in background)
+        from app_nuevo.infrastructure.adapters.tts.azure_tts_adapter import get_voice_catalog
+        azure_voices, azure_styles = await get_voice_catalog().get_dashboard_catalog()
+        voices_json = {"azure": azure_voices}
+        styles_json = azure_styles
         models_json = {
             "groq": [{"id": "llama-3.1-70b-versatile", "name": "Llama 3.1 70B"}],
             "openai": [{"id": "gpt-4o", "name": "GPT-4o"}]
@@ -11,9 +11,12 @@ class PCMProcessor extends AudioWorkletProcessor {
         this.available = 0;
 
         // --- 2. Input Buffer for Mic (Capture) ---
+        // Each flush posts a transferable ArrayBuffer framed for the binary WS protocol:
+        // [version u8][type u8][seq u16 LE] + PCM16 samples (header keeps samples 2-byte aligned).
+        this.headerSize = 4;
         this.inBufferSize = 4096;
-        this.inBuffer = new Int16Array(this.inBufferSize);
-        this.inPtr = 0;
+        this.inSeq = 0;
+        this.newInputFrame();
 
         // Messaging Handlers
         this.port.onmessage = (e) => {
@@ -22,13 +25,25 @@ class PCMProcessor extends AudioWorkletProcessor {
             // Let's support both or just raw array for speed.
             // If it's a typed array, treat as TTS feed.
             if (data && data.length && (data instanceof Int16Array || data instanceof ArrayBuffer)) {
-                this.writeOutput(new Int16Array(data.buffer || data));
+                // Int16Array may be a view past the binary frame header: use it as-is
+                this.writeOutput(data instanceof Int16Array ? data : new Int16Array(data));
             } else if (data && data.type === 'feed') {
                 this.writeOutput(data.buffer);
             }
         };
     }
 
+    newInputFrame() {
+        this.inFrame = new ArrayBuffer(this.headerSize + this.inBufferSize * 2);
+        const header = new DataView(this.inFrame, 0, this.headerSize);
+        header.setUint8(0, 1);                      // Protocol version
+        header.setUint8(1, 1);                      // Frame type: audio
+        header.setUint16(2, this.inSeq, true);      // Sequence (wraps at 16 bits)
+        this.inSeq = (this.inSeq + 1) & 0xFFFF;
+        this.inBuffer = new Int16Array(this.inFrame, this.headerSize, this.inBufferSize);
+        this.inPtr = 0;
+    }
+
     writeOutput(int16Data) {
         // Write incoming TTS Int16 chunks to Ring Buffer (Float32)
         for (let i = 0; i < int16Data.length; i++) {
@@ -54,10 +69,10 @@ class PCMProcessor extends AudioWorkletProcessor {
 
                 this.inBuffer[this.inPtr++] = s;
 
-                // Flush Input Buffer
+                // Flush Input Buffer (transfer ownership, no copy)
                 if (this.inPtr >= this.inBufferSize) {
-                    this.port.postMessage(this.inBuffer); // Post Int16Array
-                    this.inPtr = 0;
+                    this.port.postMessage(this.inFrame, [this.inFrame]);
+                    this.newInputFrame();
                 }
             }
         }
@@ -2,6 +2,8 @@
  * Simulator Mixin
  * Handles logic for the Browser Simulator (Microphone, WebSocket, Audio Visualization).
  */
+const BINARY_HEADER_BYTES = 4; // [version u8][type u8][seq u16 LE] ahead of each binary audio frame
+
 export const SimulatorMixin = {
     simState: 'ready',
     ws: null,
@@ -16,6 +18,7 @@ export const SimulatorMixin = {
     metrics: { llm_latency: null, tts_latency: null },
     vadLevel: 0,
     isAgentSpeaking: false,
+    binaryAudio: false, // Negotiated with backend on 'start' (raw PCM16 frames instead of Base64 JSON)
 
     nextStartTime: 0,
     bgAudio: null,
@@ -56,6 +59,7 @@ export const SimulatorMixin = {
         try {
             this.ws = new WebSocket(wsUrl);
             this.ws.binaryType = 'arraybuffer'; // Optimization: Receive raw bytes
+            this.binaryAudio = false;
 
             this.ws.onopen = async () => {
                 console.log("WS Connected");
@@ -74,7 +78,8 @@ export const SimulatorMixin = {
                         start: {
                             streamSid: 'browser-' + Date.now(),
                             callSid: 'sim-' + Date.now(),
-                            media_format: { encoding: 'audio/pcm', sample_rate: 16000, channels: 1 }
+                            media_format: { encoding: 'audio/pcm', sample_rate: 16000, channels: 1 },
+                            binary_audio: true
                         }
                     }));
                 }
@@ -84,7 +89,11 @@ export const SimulatorMixin = {
                 try {
                     // Handle Binary Audio (PCM16 from Backend)
                     if (event.data instanceof ArrayBuffer) {
-                        const pcm16 = new Int16Array(event.data);
+                        // Framing is fixed by the 'transport' ack: [version u8][type u8][seq u16 LE] + PCM16
+                        // once negotiated, headerless PCM16 before that
+                        const pcm16 = this.binaryAudio
+                            ? new Int16Array(event.data, BINARY_HEADER_BYTES)
+                            : new Int16Array(event.data);
                         if (this.processor) {
                             this.processor.port.postMessage(pcm16);
 
@@ -105,6 +114,9 @@ export const SimulatorMixin = {
                         // Legacy/Fallback for JSON encoded audio
                         const payload = msg.media ? msg.media.payload : msg.data;
                         this.playAudio(payload);
+                    } else if (msg.type === 'transport') {
+                        // Backend accepted binary audio frames
+                        this.binaryAudio = !!msg.binary_audio;
                     } else if (msg.type === 'config') {
                         if (msg.config.background_sound && msg.config.background_sound !== 'none') {
                             this.playBackgroundSound(msg.config.background_sound);
@@ -224,10 +236,15 @@ export const SimulatorMixin = {
                 this.processor.port.onmessage = (event) => {
                     if (!this.ws || this.ws.readyState !== WebSocket.OPEN) return;
 
-                    const pcm16 = event.data; // Int16Array
+                    const frame = event.data; // ArrayBuffer: 4-byte header + PCM16
+
+                    if (this.binaryAudio) {
+                        this.ws.send(frame);
+                        return;
+                    }
 
-                    // Convert to Base64 (Main Thread)
-                    const bytes = new Uint8Array(pcm16.buffer);
+                    // Fallback: Convert PCM16 (without header) to Base64 (Main Thread)
+                    const bytes = new Uint8Array(frame, 4);
                     let binary = '';
                     const len = bytes.byteLength;
                     // Chunked optimization for large strings
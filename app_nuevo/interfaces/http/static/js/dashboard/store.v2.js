@@ -142,6 +142,7 @@ export function dashboardStore() {
                 voicePacing: s.voice_pacing_ms || 0,
                 voiceBgSound: s.background_sound || 'none',
                 voiceBgUrl: s.background_sound_url || '',
+                voiceBgGain: s.bg_audio_gain ?? 0.3,
 
                 // NEW: TTS Controls (Browser)
                 voiceStability: s.voice_stability || 0.5,
@@ -150,6 +151,7 @@ export function dashboardStore() {
                 voiceSpeakerBoost: s.voice_speaker_boost !== undefined ? s.voice_speaker_boost : true,
                 voiceMultilingual: s.voice_multilingual !== undefined ? s.voice_multilingual : true,
                 ttsLatencyOptimization: s.tts_latency_optimization || 0,
+                ttsSynthesisMode: s.tts_synthesis_mode || 'streaming',
                 ttsOutputFormat: s.tts_output_format || 'pcm_16000',
                 voiceFillerInjection: s.voice_filler_injection || false,
                 voiceBackchanneling: s.voice_backchanneling || false,
@@ -162,6 +164,8 @@ export function dashboardStore() {
                 interruptRMS: s.voice_sensitivity || 500, // Generic/Simulator
                 silence: s.silence_timeout_ms || 5000,
                 blacklist: s.hallucination_blacklist || '',
+                pipelineExecutionMode: s.pipeline_execution_mode || 'inline',
+                pipelineHopQueueSize: s.pipeline_hop_queue_size || 50,
                 enableEndCall: s.enable_end_call,
                 segmentationStrategy: s.segmentation_strategy || 'default',
                 enableDialKeypad: s.enable_dial_keypad,
@@ -310,6 +314,7 @@ export function dashboardStore() {
                 voiceStyleDegree: s.voice_style_degree_phone || 1.0,
                 voicePacing: s.voice_pacing_ms_phone || 0,
                 voiceBgSound: s.background_sound_phone || 'none',
+                voiceBgGain: s.bg_audio_gain_phone ?? s.bg_audio_gain ?? 0.3,
 
                 // NEW: TTS Controls (Twilio)
                 voiceStability: s.voice_stability_phone || 0.5,
@@ -318,6 +323,7 @@ export function dashboardStore() {
                 voiceSpeakerBoost: s.voice_speaker_boost_phone !== undefined ? s.voice_speaker_boost_phone : true,
                 voiceMultilingual: s.voice_multilingual_phone !== undefined ? s.voice_multilingual_phone : true,
                 ttsLatencyOptimization: s.tts_latency_optimization_phone || 0,
+                ttsSynthesisMode: s.tts_synthesis_mode_phone || s.tts_synthesis_mode || 'streaming',
                 ttsOutputFormat: s.tts_output_format_phone || 'pcm_8000',
                 voiceFillerInjection: s.voice_filler_injection_phone || false,
                 voiceBackchanneling: s.voice_backchanneling_phone || false,
@@ -329,6 +335,8 @@ export function dashboardStore() {
                 silence: s.silence_timeout_ms_phone || 5000,
                 inputMin: s.input_min_characters_phone || 0,
                 blacklist: s.hallucination_blacklist_phone || '',
+                pipelineExecutionMode: s.pipeline_execution_mode_phone || s.pipeline_execution_mode || 'inline',
+                pipelineHopQueueSize: s.pipeline_hop_queue_size_phone || s.pipeline_hop_queue_size || 50,
                 denoise: s.enable_denoising_phone || false,
 
                 crm_enabled: s.crm_enabled || false,
@@ -423,6 +431,7 @@ export function dashboardStore() {
                 voicePacing: s.voice_pacing_ms_telnyx || 0,
                 voiceBgSound: s.background_sound_telnyx || 'none',
                 voiceBgUrl: s.background_sound_url_telnyx || '',
+                voiceBgGain: s.bg_audio_gain_telnyx ?? s.bg_audio_gain ?? 0.3,
 
                 // NEW: TTS Controls (Telnyx)
                 voiceStability: s.voice_stability_telnyx || 0.5,
@@ -431,6 +440,7 @@ export function dashboardStore() {
                 voiceSpeakerBoost: s.voice_speaker_boost_telnyx !== undefined ? s.voice_speaker_boost_telnyx : true,
                 voiceMultilingual: s.voice_multilingual_telnyx !== undefined ? s.voice_multilingual_telnyx : true,
                 ttsLatencyOptimization: s.tts_latency_optimization_telnyx || 0,
+                ttsSynthesisMode: s.tts_synthesis_mode_telnyx || s.tts_synthesis_mode || 'streaming',
                 ttsOutputFormat: s.tts_output_format_telnyx || 'pcm_8000',
                 voiceFillerInjection: s.voice_filler_injection_telnyx || false,
                 voiceBackchanneling: s.voice_backchanneling_telnyx || false,
@@ -443,6 +453,8 @@ export function dashboardStore() {
                 silence: s.silence_timeout_ms_telnyx || 5000,
                 inputMin: s.input_min_characters_telnyx || 0,
                 blacklist: s.hallucination_blacklist_telnyx || '',
+                pipelineExecutionMode: s.pipeline_execution_mode_telnyx || s.pipeline_execution_mode || 'inline',
+                pipelineHopQueueSize: s.pipeline_hop_queue_size_telnyx || s.pipeline_hop_queue_size || 50,
                 denoise: s.enable_denoising_telnyx || false,
                 krisp: s.enable_krisp_telnyx || false,
                 vad: s.enable_vad_telnyx || false,
@@ -36,6 +36,7 @@ class BrowserConfigUpdate(BaseModel):
     voice_multilingual: bool | None = Field(None, alias="voiceMultilingual")
     tts_latency_optimization: int | None = Field(None, alias="ttsLatencyOptimization")
     tts_output_format: str | None = Field(None, alias="ttsOutputFormat")
+    tts_synthesis_mode: str | None = Field(None, pattern="^(streaming|throughput)$", alias="ttsSynthesisMode")
     voice_filler_injection: bool | None = Field(None, alias="voiceFillerInjection")
     voice_backchanneling: bool | None = Field(None, alias="voiceBackchanneling")
     text_normalization_rule: str | None = Field(None, alias="textNormalizationRule")
@@ -47,6 +48,7 @@ class BrowserConfigUpdate(BaseModel):
     # Behavior
     background_sound: str | None = Field(None, max_length=50, alias="voiceBgSound")
     background_sound_url: str | None = Field(None, alias="voiceBgUrl")
+    bg_audio_gain: float | None = Field(None, ge=0.0, le=1.0, alias="voiceBgGain")
     idle_timeout: float | None = Field(None, ge=5.0, le=120.0, alias="idleTimeout")
     idle_message: str | None = Field(None, max_length=500, alias="idleMessage")
     inactivity_max_retries: int | None = Field(None, ge=1, le=10, alias="maxRetries")
@@ -60,6 +62,8 @@ class BrowserConfigUpdate(BaseModel):
 
     # Advanced
     hallucination_blacklist: str | None = Field(None, max_length=500, alias="blacklist")
+    pipeline_execution_mode: str | None = Field(None, pattern="^(inline|task)$", alias="pipelineExecutionMode")
+    pipeline_hop_queue_size: int | None = Field(None, ge=5, le=500, alias="pipelineHopQueueSize")
 
     # Conversation Style
     response_length: str | None = Field(None, alias="responseLength")
@@ -30,6 +30,7 @@ class TelnyxConfigUpdate(BaseModel):
     voice_style_degree_telnyx: float | None = Field(None, alias="voiceStyleDegree")
     background_sound_telnyx: str | None = Field(None, alias="voiceBgSound")
     background_sound_url_telnyx: str | None = Field(None, alias="voiceBgUrl")
+    bg_audio_gain_telnyx: float | None = Field(None, ge=0.0, le=1.0, alias="voiceBgGain")
 
     # Advanced TTS (Telnyx)
     voice_stability_telnyx: float | None = Field(None, alias="voiceStability")
@@ -39,6 +40,7 @@ class TelnyxConfigUpdate(BaseModel):
     voice_multilingual_telnyx: bool | None = Field(None, alias="voiceMultilingual")
     tts_latency_optimization_telnyx: int | None = Field(None, alias="ttsLatencyOptimization")
     tts_output_format_telnyx: str | None = Field(None, alias="ttsOutputFormat")
+    tts_synthesis_mode_telnyx: str | None = Field(None, pattern="^(streaming|throughput)$", alias="ttsSynthesisMode")
     voice_filler_injection_telnyx: bool | None = Field(None, alias="voiceFillerInjection")
     voice_backchanneling_telnyx: bool | None = Field(None, alias="voiceBackchanneling")
     text_normalization_rule_telnyx: str | None = Field(None, alias="textNormalizationRule")
@@ -108,6 +110,8 @@ class TelnyxConfigUpdate(BaseModel):
 
     # Advanced
     hallucination_blacklist_telnyx: str | None = Field(None, max_length=500, alias="blacklist")
+    pipeline_execution_mode_telnyx: str | None = Field(None, pattern="^(inline|task)$", alias="pipelineExecutionMode")
+    pipeline_hop_queue_size_telnyx: int | None = Field(None, ge=5, le=500, alias="pipelineHopQueueSize")
 
     # Telnyx Connectivity (Ghost UI fix - auditoría Tab 6)
     telnyx_api_key: str | None = Field(None, alias="telnyxApiKey")
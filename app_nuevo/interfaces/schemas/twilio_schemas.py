@@ -28,6 +28,7 @@ class TwilioConfigUpdate(BaseModel):
     voice_volume: int | None = Field(None, alias="voiceVolume")
     voice_style_degree: float | None = Field(None, alias="voiceStyleDegree")
     background_sound: str | None = Field(None, alias="voiceBgSound")
+    bg_audio_gain_phone: float | None = Field(None, ge=0.0, le=1.0, alias="voiceBgGain")
 
     # Advanced TTS (Phone)
     voice_stability: float | None = Field(None, alias="voiceStability")
@@ -37,8 +38,9 @@ class TwilioConfigUpdate(BaseModel):
     voice_multilingual: bool | None = Field(None, alias="voiceMultilingual")
     tts_latency_optimization: int | None = Field(None, alias="ttsLatencyOptimization")
     tts_output_format: str | None = Field(None, alias="ttsOutputFormat")
-    voice_filler_injection: bool | None = Field(None, alias="voiceFillerInjection")
-    voice_backchanneling: bool | None = Field(None, alias="voiceBackchanneling")
+    tts_synthesis_mode_phone: str | None = Field(None, pattern="^(streaming|throughput)$", alias="ttsSynthesisMode")
+    voice_filler_injection_phone: bool | None = Field(None, alias="voiceFillerInjection")
+    voice_backchanneling_phone: bool | None = Field(None, alias="voiceBackchanneling")
     text_normalization_rule: str | None = Field(None, alias="textNormalizationRule")
 
     # STT Configuration
@@ -93,6 +95,8 @@ class TwilioConfigUpdate(BaseModel):
 
     # Advanced
     hallucination_blacklist: str | None = Field(None, max_length=500, alias="blacklist")
+    pipeline_execution_mode_phone: str | None = Field(None, pattern="^(inline|task)$", alias="pipelineExecutionMode")
+    pipeline_hop_queue_size_phone: int | None = Field(None, ge=5, le=500, alias="pipelineHopQueueSize")
 
     # Conversation Style
     response_length: str | None = Field(None, alias="responseLength")
@@ -16,7 +16,7 @@ from starlette.websockets import WebSocketState
 from app_nuevo.interfaces.http.dependencies import get_container, DIContainer
 from app_nuevo.interfaces.websocket.connection_manager import manager
 from app_nuevo.application.services.voice_orchestrator import VoiceOrchestratorService
-from app_nuevo.infrastructure.adapters.transport.simulator import SimulatorTransport
+from app_nuevo.infrastructure.adapters.transport.simulator import SimulatorTransport, unpack_audio_frame
 from app_nuevo.domain.value_objects.frames import TextFrame
 
 # Ports required for Orchestrator Factory/Init
@@ -99,8 +99,22 @@ async def simulator_stream(
             if websocket.client_state == WebSocketState.DISCONNECTED:
                 break
                 
-            data = await websocket.receive_text()
-            
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Binary audio frames (negotiated on "start")
+            if message.get("bytes") is not None:
+                frame = unpack_audio_frame(message["bytes"])
+                if frame is not None:
+                    _, payload = frame
+                    await orchestrator.process_audio_bytes(payload)
+                continue
+
+            data = message.get("text")
+            if data is None:
+                continue
+
             try:
                 msg = json.loads(data)
             except json.JSONDecodeError:
@@ -110,8 +124,11 @@ async def simulator_stream(
             event = msg.get("event")
 
             if event == "start":
-                # Only if protocol requires explicit start signal acknowledgement
-                pass
+                # Client may opt into binary audio frames for media in both directions
+                # Ack first: the client switches framing on it, so it must precede the first framed packet
+                if msg.get("start", {}).get("binary_audio"):
+                    await transport.send_json({"type": "transport", "binary_audio": True})
+                    transport.enable_binary_audio()
             
             elif event == "media":
                 # Audio Payload
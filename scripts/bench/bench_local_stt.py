@@ -0,0 +1,145 @@
+"""
+Local STT throughput benchmark: concurrent streams on the shared worker pool.
+
+Opens N streams on a LocalSTTWorkerPool and pushes S seconds of 8kHz PCM16
+into each as fast as the pool accepts it (100ms writes, as LocalSTTRecognizer
+coalesces 20ms frames), then closes them and waits for the last finals.
+Reports audio seconds processed per wall second (x real time), the workers'
+CPU real-time factor per core, and the wall time per audio second including
+IPC and dispatch.
+
+Engines:
+    noop       no recognition work: pool, IPC and dispatch overhead only
+    synthetic  CPU model of a small acoustic model (per 10ms: FFT + four
+               257x256 matmuls), emitting a partial per write and a final
+               every 2s
+    vosk       VoskEngine over --model-dir (needs vosk and a model installed)
+
+Usage:
+    python -m scripts.bench.bench_local_stt [--engine synthetic] [--streams 20]
+        [--seconds 30] [--workers 1] [--model-dir models/vosk]
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from app_nuevo.infrastructure.ml.local_stt_engine import (
+    EVENT_CLOSED,
+    EVENT_ERROR,
+    EVENT_FINAL,
+    LocalSTTWorkerPool,
+    VoskEngine,
+)
+
+SAMPLE_RATE = 8000
+WRITE_MS = 100
+FINAL_EVERY_SECONDS = 2
+
+
+class SyntheticEngine:
+    """Deterministic stand-in for a recognizer (picklable: runs in the workers)."""
+
+    def __init__(self, work: bool = True):
+        self.work = work
+        self._weights = None
+
+    def available(self, language: str) -> bool:
+        return True
+
+    def create(self, language: str, sample_rate: int) -> "_SyntheticStream":
+        if self._weights is None:
+            self._weights = np.random.default_rng(0).random((257, 256), dtype=np.float32)
+        return _SyntheticStream(self, sample_rate)
+
+
+class _SyntheticStream:
+    def __init__(self, engine: SyntheticEngine, sample_rate: int):
+        self.engine = engine
+        self.sample_rate = sample_rate
+        self.pending_bytes = 0
+        self.words = 0
+
+    def accept(self, data: bytes) -> tuple[str | None, str | None]:
+        if self.engine.work:
+            hop = self.sample_rate // 100
+            samples = np.frombuffer(data, dtype=np.int16).astype(np.float32)
+            frames = samples[:len(samples) // hop * hop].reshape(-1, hop)
+            features = np.abs(np.fft.rfft(frames, 512, axis=1)).astype(np.float32)
+            for _ in range(2):
+                features = np.tanh(features @ self.engine._weights) @ self.engine._weights.T
+
+        self.pending_bytes += len(data)
+        if self.pending_bytes >= self.sample_rate * 2 * FINAL_EVERY_SECONDS:
+            text = "palabra " * self.words + "fin"
+            self.pending_bytes = self.words = 0
+            return text, None
+        self.words += 1
+        return None, "palabra " * self.words
+
+    def finish(self) -> str:
+        return ""
+
+
+def build_engine(name: str, model_dir: str):
+    if name == "vosk":
+        return VoskEngine(model_dir)
+    return SyntheticEngine(work=name == "synthetic")
+
+
+def run(engine, language: str, streams: int, seconds: int, workers: int) -> dict:
+    pool = LocalSTTWorkerPool(engine, workers=workers)
+    closed = threading.Semaphore(0)
+    counts = {'finals': 0, 'errors': 0}
+
+    def handler(kind: str, text: str, value):
+        if kind == EVENT_FINAL:
+            counts['finals'] += 1
+        elif kind == EVENT_ERROR:
+            counts['errors'] += 1
+            closed.release()
+        elif kind == EVENT_CLOSED:
+            closed.release()
+
+    rng = np.random.default_rng(0)
+    chunk = rng.integers(-2000, 2000, SAMPLE_RATE * WRITE_MS // 1000, dtype=np.int16).tobytes()
+    try:
+        stream_ids = [pool.open_stream(language, SAMPLE_RATE, handler) for _ in range(streams)]
+        started = time.perf_counter()
+        for _ in range(seconds * 1000 // WRITE_MS):
+            for stream_id in stream_ids:
+                pool.write(stream_id, chunk)
+        for stream_id in stream_ids:
+            pool.close_stream(stream_id)
+        for _ in stream_ids:
+            closed.acquire()
+        wall = time.perf_counter() - started
+        stats = pool.get_stats()
+    finally:
+        pool.close()
+    stats.update(counts, wall=wall)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--engine", choices=("noop", "synthetic", "vosk"), default="synthetic")
+    parser.add_argument("--streams", type=int, default=20, help="Concurrent streams")
+    parser.add_argument("--seconds", type=int, default=30, help="Audio seconds per stream")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (0 = one per core)")
+    parser.add_argument("--model-dir", default="models/vosk", help="Vosk models (--engine vosk)")
+    parser.add_argument("--language", default="es-MX")
+    args = parser.parse_args()
+
+    stats = run(build_engine(args.engine, args.model_dir), args.language, args.streams, args.seconds, args.workers)
+    audio = stats['audio_seconds']
+    print(f"{args.engine}: {args.streams} streams x {args.seconds}s @ {SAMPLE_RATE} Hz on {stats['workers']} worker(s)")
+    print(f"  audio processed   {audio:.0f}s in {stats['wall']:.2f}s wall -> {audio / stats['wall']:.0f}x real time")
+    print(f"  worker CPU RTF    {stats['rtf_per_core']} per core")
+    print(f"  wall per audio s  {stats['wall'] / audio:.4f}s (including IPC and dispatch)")
+    print(f"  finals {stats['finals']}, errors {stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Ambience mixing CPU benchmark: AmbienceMixer vs an audioop reference.
+
+Mixes the bundled office ambience under 20ms speech frames for each transport
+encoding (mu-law/A-law @ 8kHz, PCM16 @ 16kHz). Reports time per frame (best
+of 5 runs) and the share of one core a single call spends mixing (50 frames
+per second), plus the largest difference from the audioop reference in
+decoded PCM16 samples (the mixer's Q15 gain rounds differently from
+audioop.mul, and one LSB can move a G.711 code by one step). The reference
+decodes, scales, adds and re-encodes with audioop; it is skipped where
+audioop is unavailable.
+
+Usage:
+    python -m scripts.bench.bench_mixer [--frames 20000] [--wav path/to/ambience.wav]
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app_nuevo.infrastructure.audio.codecs import (
+    ENCODING_ALAW,
+    ENCODING_MULAW,
+    ENCODING_PCM,
+    decode_to_pcm16,
+    decode_wav,
+    encode_from_pcm16,
+    resample_pcm16,
+)
+from app_nuevo.infrastructure.audio.mixer import DEFAULT_AMBIENCE_GAIN, AmbienceMixer
+
+try:
+    import audioop
+except ImportError:  # Removed in Python 3.13
+    audioop = None
+
+DEFAULT_WAV = Path("app_nuevo/interfaces/http/static/sounds/office.wav")
+FRAMES_PER_SECOND = 50
+TRANSPORTS = (
+    (ENCODING_MULAW, 8000),
+    (ENCODING_ALAW, 8000),
+    (ENCODING_PCM, 16000),
+)
+
+
+class AudioopMixer:
+    """Reference mixer: per-frame audioop decode, gain, add and encode."""
+
+    def __init__(self, bed: np.ndarray, encoding: str, frame_samples: int, gain: float):
+        self.encoding = encoding
+        self.frame_bytes = frame_samples * 2
+        self.gain = gain
+        looped = bed.tobytes()
+        self._bed = looped + looped[:self.frame_bytes]  # Head appended: every frame is one slice
+        self._bed_len = len(looped)
+        self._index = 0
+
+    def mix(self, frame: bytes | None) -> bytes:
+        start = self._index
+        self._index = (start + self.frame_bytes) % self._bed_len
+        acc = audioop.mul(self._bed[start:start + self.frame_bytes], 2, self.gain)
+        if frame is not None:
+            if self.encoding == ENCODING_MULAW:
+                frame = audioop.ulaw2lin(frame, 2)
+            elif self.encoding == ENCODING_ALAW:
+                frame = audioop.alaw2lin(frame, 2)
+            acc = audioop.add(acc, frame, 2)
+        if self.encoding == ENCODING_MULAW:
+            return audioop.lin2ulaw(acc, 2)
+        if self.encoding == ENCODING_ALAW:
+            return audioop.lin2alaw(acc, 2)
+        return acc
+
+
+def load_bed(path: Path, sample_rate: int) -> np.ndarray:
+    samples, source_rate = decode_wav(path.read_bytes())
+    return resample_pcm16(samples, source_rate, sample_rate)
+
+
+def speech_frames(encoding: str, frame_samples: int, count: int) -> list[bytes | None]:
+    """Loud speech-like frames with a 1-in-5 gap (ambience-only ticks)."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(count):
+        if i % 5 == 4:
+            frames.append(None)
+            continue
+        pcm = rng.integers(-20000, 20000, frame_samples, dtype=np.int16)
+        frames.append(pcm.tobytes() if encoding == ENCODING_PCM else encode_from_pcm16(pcm, encoding).tobytes())
+    return frames
+
+
+def time_per_frame(mixer_cls, bed: np.ndarray, encoding: str, frame_samples: int, frames) -> float:
+    best = float('inf')
+    for _ in range(5):
+        mixer = mixer_cls(bed, encoding, frame_samples, DEFAULT_AMBIENCE_GAIN)
+        started = time.perf_counter()
+        for frame in frames:
+            mixer.mix(frame)
+        best = min(best, time.perf_counter() - started)
+    return best / len(frames) * 1e6
+
+
+def max_difference(bed: np.ndarray, encoding: str, frame_samples: int, frames) -> int:
+    """Largest absolute sample difference vs the reference, after decoding."""
+    mixer = AmbienceMixer(bed, encoding, frame_samples, DEFAULT_AMBIENCE_GAIN)
+    reference = AudioopMixer(bed, encoding, frame_samples, DEFAULT_AMBIENCE_GAIN)
+    worst = 0
+    for frame in frames:
+        ours = decode_to_pcm16(mixer.mix(frame), encoding).astype(np.int32)
+        theirs = decode_to_pcm16(reference.mix(frame), encoding).astype(np.int32)
+        worst = max(worst, int(np.abs(ours - theirs).max()))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=20_000, help="20ms frames mixed per run")
+    parser.add_argument("--wav", type=Path, default=DEFAULT_WAV, help="Ambience file (RIFF/WAVE)")
+    args = parser.parse_args()
+
+    print(f"{args.frames} x 20ms frames, ambience {args.wav}, gain {DEFAULT_AMBIENCE_GAIN}")
+    print(f"{'transport':<14} {'mixer':<9} {'us/frame':>9} {'% core/call':>12} {'max |diff|':>11}")
+    for encoding, sample_rate in TRANSPORTS:
+        frame_samples = sample_rate // FRAMES_PER_SECOND
+        bed = load_bed(args.wav, sample_rate)
+        frames = speech_frames(encoding, frame_samples, args.frames)
+        label = f"{encoding} {sample_rate // 1000}k"
+
+        candidates = [("numpy", AmbienceMixer)]
+        if audioop is not None:
+            candidates.append(("audioop", AudioopMixer))
+        difference = str(max_difference(bed, encoding, frame_samples, frames[:2000])) if audioop else "-"
+
+        for name, mixer_cls in candidates:
+            per_frame = time_per_frame(mixer_cls, bed, encoding, frame_samples, frames)
+            core = per_frame * FRAMES_PER_SECOND / 1e6 * 100
+            print(f"{label:<14} {name:<9} {per_frame:>9.2f} {core:>11.3f}% {difference if name == 'numpy' else '':>11}")
+
+
+if __name__ == "__main__":
+    main()
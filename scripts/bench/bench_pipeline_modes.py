@@ -0,0 +1,107 @@
+"""
+Pipeline execution mode benchmark: inline chaining vs per-processor inboxes.
+
+Feeds 20ms audio frames in real time through a pipeline whose LLM stage is
+slow (it sleeps on every transcript) and measures how late each audio frame
+reaches the first processor, i.e. how long ingestion waits on LLM/TTS work.
+
+Usage:
+    python -m scripts.bench.bench_pipeline_modes [--seconds 4] [--llm-ms 300]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app_nuevo.application.common.frame_processor import FrameDirection, FrameProcessor
+from app_nuevo.application.services.pipeline_service import (
+    EXECUTION_MODE_INLINE,
+    EXECUTION_MODE_TASK,
+    PipelineService,
+)
+from app_nuevo.domain.value_objects.frames import AudioFrame, Frame, TextFrame
+
+FRAME_SECONDS = 0.02
+FRAME_BYTES = 320  # 20ms PCM16 @ 8kHz
+
+
+class IngressProbe(FrameProcessor):
+    """First stage (STT position): records when each audio frame arrives."""
+
+    def __init__(self):
+        super().__init__(name="Ingress")
+        self.delays: list[float] = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        if isinstance(frame, AudioFrame):
+            self.delays.append(time.perf_counter() - frame.metadata['due'])
+        await self.push_frame(frame, direction)
+
+
+class SlowStage(FrameProcessor):
+    """Sleeps on every transcript (LLM/TTS position)."""
+
+    def __init__(self, name: str, seconds: float):
+        super().__init__(name=name)
+        self.seconds = seconds
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        if isinstance(frame, TextFrame):
+            await asyncio.sleep(self.seconds)
+        await self.push_frame(frame, direction)
+
+
+async def run(mode: str, seconds: float, llm_ms: float, tts_ms: float, text_every: int) -> dict:
+    probe = IngressProbe()
+    pipeline = PipelineService(
+        [probe, SlowStage("LLM", llm_ms / 1000), SlowStage("TTS", tts_ms / 1000)],
+        max_queue_size=1000,
+        execution_mode=mode
+    )
+    await pipeline.start()
+
+    frames = int(seconds / FRAME_SECONDS)
+    start = time.perf_counter()
+    for index in range(frames):
+        due = start + index * FRAME_SECONDS
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await pipeline.queue_frame(AudioFrame(data=bytes(FRAME_BYTES), sample_rate=8000, metadata={'due': due}))
+        if index % text_every == text_every - 1:
+            await pipeline.queue_frame(TextFrame(text="hola"))
+
+    while len(probe.delays) < frames:
+        await asyncio.sleep(FRAME_SECONDS)
+    stats = pipeline.get_queue_stats()
+    await pipeline.stop()
+
+    delays = sorted(d * 1000 for d in probe.delays)
+    return {
+        'p50': statistics.median(delays),
+        'p99': delays[int(len(delays) * 0.99) - 1],
+        'max': delays[-1],
+        'stats': stats
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=4.0, help="Audio fed per mode")
+    parser.add_argument("--llm-ms", type=float, default=300.0, help="LLM stage time per transcript")
+    parser.add_argument("--tts-ms", type=float, default=100.0, help="TTS stage time per transcript")
+    parser.add_argument("--text-every", type=int, default=50, help="Audio frames between transcripts")
+    args = parser.parse_args()
+
+    print(f"{args.seconds:.0f}s of 20ms audio, LLM {args.llm_ms:.0f}ms + TTS {args.tts_ms:.0f}ms "
+          f"per transcript every {args.text_every * FRAME_SECONDS:.1f}s")
+    print(f"{'mode':<8} {'ingress p50':>12} {'p99':>10} {'max':>10}")
+    for mode in (EXECUTION_MODE_INLINE, EXECUTION_MODE_TASK):
+        result = await run(mode, args.seconds, args.llm_ms, args.tts_ms, args.text_every)
+        print(f"{mode:<8} {result['p50']:>10.1f}ms {result['p99']:>8.1f}ms {result['max']:>8.1f}ms")
+        if mode == EXECUTION_MODE_TASK:
+            for name, hop in result['stats'].items():
+                print(f"    {name:<10} max_depth={hop.get('max_depth', hop['depth'])} "
+                      f"blocked={hop.get('blocked', 0)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
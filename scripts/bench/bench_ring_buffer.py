@@ -0,0 +1,99 @@
+"""
+VAD audio accumulation benchmark: bytearray reslicing vs AudioRingBuffer.
+
+Feeds 20ms PCM16 frames and cuts 32ms Silero windows as float32, the way the
+VAD processor does. Reports time per frame (best of 5 runs) and the memory
+allocated per window while feeding (tracemalloc high-water mark per frame):
+reslicing allocates two bytearrays and two NumPy arrays per window, the ring
+buffer reuses one buffer and one float32 array.
+
+Usage:
+    python -m scripts.bench.bench_ring_buffer [--frames 50000] [--sample-rate 8000]
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from app_nuevo.infrastructure.audio.ring_buffer import AudioRingBuffer
+
+
+class Reslice:
+    """Previous VADProcessor accumulation."""
+
+    def __init__(self, window_bytes: int):
+        self.window_bytes = window_bytes
+        self.buffer = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        self.buffer.extend(data)
+        while len(self.buffer) >= self.window_bytes:
+            chunk = self.buffer[:self.window_bytes]
+            self.buffer = self.buffer[self.window_bytes:]
+            np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+class Ring:
+    """Current VADProcessor accumulation."""
+
+    def __init__(self, window_bytes: int):
+        self.window_bytes = window_bytes
+        self.buffer = AudioRingBuffer(capacity=window_bytes * 4)
+        self.scratch = np.empty(window_bytes // 2, dtype=np.float32)
+
+    def feed(self, data: bytes) -> None:
+        self.buffer.write(data)
+        while self.buffer.readable >= self.window_bytes:
+            self.buffer.read_pcm16_float32(self.scratch)
+
+
+def time_per_frame(cls, frames: list[bytes], window_bytes: int) -> float:
+    best = float('inf')
+    for _ in range(5):
+        method = cls(window_bytes)
+        started = time.perf_counter()
+        for data in frames:
+            method.feed(data)
+        best = min(best, time.perf_counter() - started)
+    return best / len(frames) * 1e6
+
+
+def allocated_per_frame(cls, frames: list[bytes], window_bytes: int) -> float:
+    method = cls(window_bytes)
+    for data in frames[:10]:
+        method.feed(data)  # Warm up (first allocations of the scratch state)
+
+    allocated = 0
+    tracemalloc.start()
+    for data in frames:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        method.feed(data)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - current
+    tracemalloc.stop()
+    return allocated / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=50_000, help="20ms frames fed")
+    parser.add_argument("--sample-rate", type=int, choices=(8000, 16000), default=8000)
+    args = parser.parse_args()
+
+    frame_bytes = args.sample_rate // 50 * 2
+    window_bytes = (512 if args.sample_rate == 16000 else 256) * 2
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(-3000, 3000, frame_bytes // 2, dtype=np.int16).tobytes() for _ in range(args.frames)]
+
+    print(f"{args.frames} x 20ms frames @ {args.sample_rate} Hz, {window_bytes // 2}-sample windows")
+    print(f"{'method':<8} {'us/frame':>9} {'bytes allocated/frame':>22}")
+    for cls in (Reslice, Ring):
+        per_frame = time_per_frame(cls, frames, window_bytes)
+        allocated = allocated_per_frame(cls, frames[:5000], window_bytes)
+        print(f"{cls.__name__.lower():<8} {per_frame:>9.2f} {allocated:>22.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Reply segmentation benchmark: sentence-level serial TTS vs clause-level overlapped TTS.
+
+Deterministic fakes: an LLM streaming one word every 30ms, a TTS with 150ms
+to first byte rendering 5x faster than real time, and a sink that plays each
+audio frame for its real duration. Tokens go through TextSegmenter (with its
+max-latency deadline) into TTSProcessor, the way LLMProcessor feeds it.
+Reports time to first audio after the first token and the time the last
+audio finished playing.
+
+Usage:
+    python -m scripts.bench.bench_segmenter [--token-ms 30] [--ttfb-ms 150]
+"""
+import argparse
+import asyncio
+import time
+import types
+
+from app_nuevo.application.common.frame_processor import FrameProcessor
+from app_nuevo.application.components.tts_processor import TTSProcessor
+from app_nuevo.domain.services.text_segmenter import TextSegmenter
+from app_nuevo.domain.value_objects.frames import AudioFrame, TextFrame
+
+REPLY = (
+    "Claro, con mucho gusto te ayudo con tu reservación para el viernes, "
+    "solo necesito confirmar algunos datos contigo. ¿Me puedes dar tu nombre completo "
+    "y el número de personas que asistirán? También dime si prefieres terraza o salón interior."
+)
+CHARS_PER_SECOND = 15     # Speech rate of the fake voice
+RENDER_FACTOR = 0.2       # Fake TTS renders 5x faster than real time
+BYTES_PER_SECOND = 8000   # mu-law @ 8kHz (twilio profile)
+TTS_CHUNK_SECONDS = 0.1
+
+
+class FakeTTS:
+    def __init__(self, ttfb: float):
+        self.ttfb = ttfb
+
+    async def synthesize_stream(self, request):
+        await asyncio.sleep(self.ttfb)
+        for _ in range(max(int(len(request.text) / CHARS_PER_SECOND / TTS_CHUNK_SECONDS), 1)):
+            await asyncio.sleep(TTS_CHUNK_SECONDS * RENDER_FACTOR)
+            yield b'\xff' * int(BYTES_PER_SECOND * TTS_CHUNK_SECONDS)
+
+
+class PlayoutSink(FrameProcessor):
+    """Plays each frame for its duration, like the transport's paced output."""
+
+    def __init__(self):
+        super().__init__(name="PlayoutSink")
+        self.first_audio: float | None = None
+        self.last_audio: float | None = None
+
+    async def process_frame(self, frame, direction):
+        if isinstance(frame, AudioFrame):
+            self.first_audio = self.first_audio or time.monotonic()
+            await asyncio.sleep(len(frame.data) / BYTES_PER_SECOND)
+            self.last_audio = time.monotonic()
+
+
+async def stream_reply(token_seconds: float, segmenter: TextSegmenter, tts: TTSProcessor) -> float:
+    """Segment a fake token stream into TTSProcessor; returns the first token time."""
+    segment_index = 0
+
+    async def emit(segments: list[str]):
+        nonlocal segment_index
+        for segment in segments:
+            await tts.process_frame(
+                TextFrame(text=segment, trace_id="bench", metadata={'segment_index': segment_index}), 1
+            )
+            segment_index += 1
+
+    first_token = None
+    for word in REPLY.split(" "):
+        deadline = time.monotonic() + token_seconds
+        while (remaining := segmenter.time_until_deadline()) is not None and remaining < deadline - time.monotonic():
+            await asyncio.sleep(remaining)
+            await emit(segmenter.poll())
+        await asyncio.sleep(max(deadline - time.monotonic(), 0))
+        first_token = first_token or time.monotonic()
+        await emit(segmenter.push(word + " "))
+    if (tail := segmenter.flush()):
+        await emit([tail])
+    return first_token
+
+
+async def run(token_seconds: float, ttfb: float, clause_level: bool) -> tuple[float, float]:
+    config = types.SimpleNamespace(
+        client_type='twilio',
+        response_delay_seconds=0.0,
+        tts_max_inflight=2 if clause_level else 1
+    )
+    segmenter = TextSegmenter(
+        clause_min_words=6 if clause_level else 10 ** 6,
+        max_latency_seconds=0.6 if clause_level else None
+    )
+    tts = TTSProcessor(FakeTTS(ttfb), config)
+    sink = PlayoutSink()
+    tts.link(sink)
+    await tts.start()
+
+    first_token = await stream_reply(token_seconds, segmenter, tts)
+    while tts._tts_queue.qsize() or tts._active_segments or sink.last_audio is None:
+        await asyncio.sleep(0.01)
+    await tts.stop()
+    return (sink.first_audio - first_token) * 1000, (sink.last_audio - first_token) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--token-ms", type=float, default=30.0, help="Fake LLM delay per word")
+    parser.add_argument("--ttfb-ms", type=float, default=150.0, help="Fake TTS time to first byte")
+    args = parser.parse_args()
+
+    print(f"{len(REPLY.split())} words @ {args.token_ms:.0f}ms, TTS TTFB {args.ttfb_ms:.0f}ms")
+    print(f"{'segmentation':<22} {'TTFA after 1st token':>21} {'last audio':>11}")
+    for label, clause_level in (("sentence, serial", False), ("clause, 2 in flight", True)):
+        ttfa, last = asyncio.run(run(args.token_ms / 1000, args.ttfb_ms / 1000, clause_level))
+        print(f"{label:<22} {ttfa:>19.0f}ms {last:>9.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
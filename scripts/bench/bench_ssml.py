@@ -0,0 +1,88 @@
+"""
+Azure SSML building benchmark: per-sentence formatting vs cached templates.
+
+Builds the SSML document for a stream of reply sentences with the previous
+builder (whole document formatted per sentence, text not escaped) and with
+AzureTTSAdapter._build_ssml (cached per-voice template + escaped text).
+Reports time per sentence (best of 5) and how many documents each builder
+produced that are not well-formed XML (Azure rejects those, forcing a retry).
+
+Needs the Azure Speech SDK installed (the adapter module imports it); no
+credentials or network are used.
+
+Usage:
+    python -m scripts.bench.bench_ssml [--sentences 200000]
+"""
+import argparse
+import timeit
+import xml.etree.ElementTree as ET
+
+from app_nuevo.domain.value_objects.tts_value_objects import TTSRequest
+from app_nuevo.infrastructure.adapters.tts.azure_tts_adapter import AzureTTSAdapter
+
+SENTENCES = [
+    "Claro, con gusto le ayudo con su pedido de hoy.",
+    "El total es de $350 & incluye envío.",
+    "Su cita quedó para el viernes a las 10.",
+    "Promoción: 2x1 en pizzas < 30 cm.",
+    "¿Le puedo ayudar en algo más?",
+    "La opción \"premium\" cuesta 20% más.",
+]
+
+
+def legacy_build_ssml(request: TTSRequest) -> str:
+    """Previous AzureTTSAdapter._build_ssml."""
+    style_tag = ""
+    if request.style and request.style.lower() != "default":
+        style_tag = f'<mstts:express-as style="{request.style}">'
+        style_close = '</mstts:express-as>'
+    else:
+        style_close = ""
+
+    rate = f"{request.speed}"
+    pitch_val = request.provider_options.get('pitch_hz', request.pitch)
+    pitch = f"{pitch_val:+.0f}Hz" if pitch_val != 0 else "0Hz"
+    volume = f"{request.volume}"
+
+    return (
+        '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
+        f'xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="{request.language}">'
+        f'<voice name="{request.voice_id}">{style_tag}'
+        f'<prosody rate="{rate}" pitch="{pitch}" volume="{volume}">{request.text}</prosody>'
+        f'{style_close}</voice></speak>'
+    )
+
+
+def malformed(build, requests: list[TTSRequest]) -> int:
+    failures = 0
+    for request in requests:
+        try:
+            ET.fromstring(build(request))
+        except ET.ParseError:
+            failures += 1
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sentences", type=int, default=200_000, help="Documents built per timing run")
+    args = parser.parse_args()
+
+    requests = [
+        TTSRequest(text=text, voice_id="es-MX-DaliaNeural", style="cheerful", speed=1.1, pitch=2, volume=90)
+        for text in SENTENCES
+    ]
+    adapter = AzureTTSAdapter.__new__(AzureTTSAdapter)  # SSML only: no SDK config, pool or catalog
+    adapter._ssml_templates = {}
+
+    print(f"{len(SENTENCES)} reply sentences, one voice profile")
+    print(f"{'builder':<10} {'us/sentence':>12} {'malformed':>10}")
+    for name, build in (("legacy", legacy_build_ssml), ("template", adapter._build_ssml)):
+        number = args.sentences // len(requests)
+        best = min(timeit.repeat(lambda: [build(r) for r in requests], number=number, repeat=5))
+        per_sentence = best / (number * len(requests)) * 1e6
+        print(f"{name:<10} {per_sentence:>12.2f} {malformed(build, requests):>7}/{len(requests)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+STT filter benchmark: per-final linear phrase scan vs compiled STTFilters.
+
+Builds a blacklist and an interruption list of 500 random 1-3 word phrases
+each and matches a 96-character utterance that hits neither (the common
+case: every phrase is tried). The linear scan is the previous per-final
+filter: lower-case the text, then test each phrase as a substring. Reports
+time per utterance for one list and for both lists (STTFilters normalizes
+the text once and shares it), plus the cost of compiling both lists cold
+and with the pattern cache warm.
+
+Usage:
+    python -m scripts.bench.bench_stt_filters [--phrases 500]
+"""
+import argparse
+import random
+import string
+import time
+import timeit
+
+from app_nuevo.domain.services import stt_filters
+from app_nuevo.domain.services.stt_filters import STTFilters, normalize_text
+
+UTTERANCE = (
+    "hola buenas tardes quiero información sobre mi pedido número cuatro cinco seis por favor gracias"
+)
+
+
+def random_phrases(count: int, rng: random.Random) -> list[str]:
+    words = [
+        "".join(rng.choices(string.ascii_lowercase + "áéíóñ", k=rng.randint(3, 9)))
+        for _ in range(3000)
+    ]
+    return [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(count)]
+
+
+def linear_scan(phrases: list[str], text: str) -> str | None:
+    """Previous filter: one substring test per phrase."""
+    lowered = text.lower()
+    for phrase in phrases:
+        if phrase.lower() in lowered:
+            return phrase
+    return None
+
+
+def per_call_us(fn, number: int = 20_000) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--phrases", type=int, default=500, help="Phrases per list")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    blacklist = random_phrases(args.phrases, rng)
+    interruptions = random_phrases(args.phrases, rng)
+
+    stt_filters._compile_phrases.cache_clear()
+    started = time.perf_counter()
+    filters = STTFilters(blacklist=blacklist, interruption_phrases=interruptions)
+    compile_cold = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    STTFilters(blacklist=blacklist, interruption_phrases=interruptions)
+    compile_warm = (time.perf_counter() - started) * 1000
+
+    assert filters.blacklisted(UTTERANCE) is None and linear_scan(blacklist, UTTERANCE) is None
+
+    def compiled_both():
+        normalized = normalize_text(UTTERANCE)
+        return filters.blacklisted(normalized, True), filters.interruption(normalized, True)
+
+    print(f"{args.phrases} phrases per list, {len(UTTERANCE)}-char utterance (no match)")
+    print(f"{'lists':<11} {'linear us':>10} {'compiled us':>12}")
+    print(f"{'one':<11} {per_call_us(lambda: linear_scan(blacklist, UTTERANCE)):>10.1f} "
+          f"{per_call_us(lambda: filters.blacklisted(UTTERANCE)):>12.1f}")
+    print(f"{'both':<11} "
+          f"{per_call_us(lambda: (linear_scan(blacklist, UTTERANCE), linear_scan(interruptions, UTTERANCE))):>10.1f} "
+          f"{per_call_us(compiled_both):>12.1f}")
+    print(f"compile both lists: {compile_cold:.1f} ms cold, {compile_warm:.2f} ms with the pattern cache warm")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+TTS output framing benchmark: provider chunks as-is vs AudioFramer blocks.
+
+Runs mu-law audio in irregular provider-sized chunks (200-4800 bytes, as
+Azure streams them) through MetricsProcessor -> PipelineOutputSink ->
+AudioManager playout, with 20ms transport frames pulled as the paced sender
+would. Compares forwarding each provider chunk as one AudioFrame against
+re-blocking with AudioFramer at 1, 5 and 10 transport frames per block.
+Reports pipeline frames per second of audio and process CPU per second of
+audio (best of 3 runs).
+
+Usage:
+    python -m scripts.bench.bench_tts_framing [--seconds 600]
+"""
+import argparse
+import asyncio
+import random
+import time
+import types
+
+from app_nuevo.application.common.frame_processor import FrameDirection
+from app_nuevo.application.components.metrics_processor import MetricsProcessor
+from app_nuevo.application.components.output_sink import PipelineOutputSink
+from app_nuevo.domain.value_objects.audio_config import AudioConfig
+from app_nuevo.domain.value_objects.frames import AudioFrame
+from app_nuevo.infrastructure.audio.framer import AudioFramer
+from app_nuevo.infrastructure.services.audio_manager import AudioManager
+
+BYTES_PER_SECOND = 8000  # mu-law @ 8kHz
+FRAME_BYTES = 160        # 20ms
+MULAW_SILENCE = 0xFF
+
+
+class CountingTransport:
+    def __init__(self):
+        self.sent = 0
+
+    async def send_audio(self, frame: bytes):
+        self.sent += 1
+
+
+class Orchestrator:
+    """What PipelineOutputSink calls on the orchestrator."""
+
+    def __init__(self, audio_manager: AudioManager):
+        self.audio_manager = audio_manager
+
+    async def send_audio_chunked(self, data: bytes):
+        await self.audio_manager.send_audio_chunked(data)
+
+    async def interrupt_speaking(self):
+        pass
+
+
+async def run(seconds: int, frames_per_block: int | None) -> tuple[float, int, int]:
+    """Returns (CPU seconds, pipeline frames, transport frames)."""
+    rng = random.Random(7)
+    transport = CountingTransport()
+    audio_manager = AudioManager(transport, 'twilio', AudioConfig.telephony())
+    metrics = MetricsProcessor(types.SimpleNamespace())
+    metrics.link(PipelineOutputSink(Orchestrator(audio_manager)))
+    framer = AudioFramer(FRAME_BYTES, MULAW_SILENCE, frames_per_block) if frames_per_block else None
+
+    total = seconds * BYTES_PER_SECOND
+    produced = pipeline_frames = 0
+    started = time.process_time()
+    while produced < total:
+        chunk = bytes(rng.randint(200, 4800))
+        produced += len(chunk)
+        for block in framer.push(chunk) if framer else (chunk,):
+            await metrics.process_frame(
+                AudioFrame(data=block, sample_rate=8000, channels=1), FrameDirection.DOWNSTREAM
+            )
+            pipeline_frames += 1
+
+        # Paced sender: pull every complete 20ms frame now buffered
+        while audio_manager._has_pending_speech() and (
+            audio_manager._playout.readable + audio_manager._block_remaining() >= FRAME_BYTES
+            or not audio_manager.audio_queue.empty()
+        ):
+            if audio_manager._next_frame():
+                transport.sent += 1
+    return time.process_time() - started, pipeline_frames, transport.sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=600, help="Seconds of audio per run")
+    args = parser.parse_args()
+
+    print(f"{args.seconds}s of mu-law audio in 200-4800 B provider chunks")
+    print(f"{'framing':<20} {'pipeline frames/s':>18} {'transport frames':>17} {'CPU ms/audio-s':>15}")
+    for label, frames_per_block in (
+        ("provider chunks", None),
+        ("framer, 1/block", 1),
+        ("framer, <=5/block", 5),
+        ("framer, <=10/block", 10),
+    ):
+        runs = [asyncio.run(run(args.seconds, frames_per_block)) for _ in range(3)]
+        cpu = min(r[0] for r in runs)
+        _, pipeline_frames, transport_frames = runs[0]
+        print(
+            f"{label:<20} {pipeline_frames / args.seconds:>18.1f} {transport_frames:>17} "
+            f"{cpu * 1000 / args.seconds:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
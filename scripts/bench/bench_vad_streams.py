@@ -0,0 +1,104 @@
+"""
+VAD multi-stream benchmark: one ONNX session per call vs the shared batched engine.
+
+Each simulated call delivers one 32ms Silero window every 32ms (real time).
+For 1, 50 and 200 concurrent calls it reports window latency (submit ->
+confidence), the worst event-loop lag, and CPU seconds per second of audio.
+
+Requires onnxruntime and the Silero model file.
+
+Usage:
+    python -m scripts.bench.bench_vad_streams --model path/to/silero_vad.onnx [--seconds 5]
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from app_nuevo.infrastructure.ml.vad_engine import SileroVADEngine
+from app_nuevo.infrastructure.ml.vad_model import SileroOnnxModel
+
+SAMPLE_RATE = 8000
+WINDOW_SAMPLES = 256  # 32ms @ 8kHz
+WINDOW_SECONDS = WINDOW_SAMPLES / SAMPLE_RATE
+DEFAULT_MODEL = "app-nuevo/assets/models/vad/silero_vad.onnx"
+
+
+async def _loop_lag(stop: asyncio.Event, lags: list[float]):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.005)
+        lags.append(time.perf_counter() - started - 0.005)
+
+
+async def run(mode: str, model: str, streams: int, seconds: float) -> dict:
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal((streams, WINDOW_SAMPLES)) * 0.1).astype(np.float32)
+    windows = int(seconds / WINDOW_SECONDS)
+    latencies: list[float] = []
+
+    if mode == "per-call":
+        models = [SileroOnnxModel(model) for _ in range(streams)]
+
+        async def infer(index: int) -> None:
+            models[index](audio[index], SAMPLE_RATE)  # Inline on the loop, as before
+    else:
+        engine = SileroVADEngine(model)
+        vad_streams = [engine.create_stream(SAMPLE_RATE) for _ in range(streams)]
+
+        async def infer(index: int) -> None:
+            await engine.infer(vad_streams[index], audio[index])
+
+    async def call(index: int, start: float):
+        for n in range(windows):
+            due = start + n * WINDOW_SECONDS + index * WINDOW_SECONDS / streams  # Staggered calls
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            submitted = time.perf_counter()
+            await infer(index)
+            latencies.append(time.perf_counter() - submitted)
+
+    stop, lags = asyncio.Event(), []
+    lag_task = asyncio.create_task(_loop_lag(stop, lags))
+    cpu_started = time.process_time()
+    start = time.perf_counter() + 0.05
+    await asyncio.gather(*(call(i, start) for i in range(streams)))
+    cpu = time.process_time() - cpu_started
+    stop.set()
+    await lag_task
+
+    stats = None
+    if mode == "shared":
+        stats = engine.get_stats()
+        engine.close()
+
+    latencies.sort()
+    return {
+        'p50': latencies[len(latencies) // 2] * 1000,
+        'p99': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        'loop_lag': max(lags) * 1000,
+        'cpu_per_audio_second': cpu / (streams * windows * WINDOW_SECONDS),
+        'stats': stats
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="Silero VAD ONNX file")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Audio per call")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 50, 200])
+    args = parser.parse_args()
+
+    print(f"{'streams':>7} {'mode':<9} {'p50':>8} {'p99':>9} {'loop lag':>9} {'cpu/audio s':>12}  batches")
+    for streams in args.streams:
+        for mode in ("per-call", "shared"):
+            r = await run(mode, args.model, streams, args.seconds)
+            batch = ""
+            if r['stats']:
+                batch = f"avg {r['stats']['windows'] / max(r['stats']['batches'], 1):.1f}, max {r['stats']['max_batch_size']}"
+            print(f"{streams:>7} {mode:<9} {r['p50']:>6.2f}ms {r['p99']:>7.2f}ms {r['loop_lag']:>7.1f}ms "
+                  f"{r['cpu_per_audio_second']:>12.4f}  {batch}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
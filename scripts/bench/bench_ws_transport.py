@@ -0,0 +1,114 @@
+"""
+Simulator WebSocket transport benchmark: JSON+Base64 vs binary audio framing.
+
+Drives one simulator connection's audio in both directions for S seconds:
+- outbound (server -> browser): 20ms PCM16 frames through
+  SimulatorTransport.send_audio, JSON mode vs binary mode (pack_audio_frame),
+  into a WebSocket stand-in that only counts what it is handed;
+- inbound (browser -> server): the worklet's mic frames (4096 samples) as the
+  router parses them: json.loads + Base64 decode of a "media" event vs
+  unpack_audio_frame of a binary message.
+Client-side encoding is prepared up front; only server work is timed.
+Reports bytes on the wire and process CPU per connection-second for each
+direction (best of 3 runs).
+
+Usage:
+    python -m scripts.bench.bench_ws_transport [--seconds 600] [--sample-rate 16000]
+"""
+import argparse
+import asyncio
+import base64
+import json
+import time
+
+from app_nuevo.infrastructure.adapters.transport.simulator import (
+    SimulatorTransport,
+    pack_audio_frame,
+    unpack_audio_frame,
+)
+
+OUT_FRAME_SECONDS = 0.02
+IN_FRAME_SAMPLES = 4096  # audio-worklet-processor.js inBufferSize
+
+
+class CountingWebSocket:
+    """What SimulatorTransport calls on the FastAPI WebSocket."""
+
+    def __init__(self):
+        self.wire_bytes = 0
+
+    async def send_text(self, data: str):
+        self.wire_bytes += len(data)
+
+    async def send_bytes(self, data: bytes):
+        self.wire_bytes += len(data)
+
+
+async def outbound(binary: bool, seconds: int, sample_rate: int) -> tuple[float, int]:
+    """Returns (CPU seconds, wire bytes)."""
+    websocket = CountingWebSocket()
+    transport = SimulatorTransport(websocket)
+    if binary:
+        transport.enable_binary_audio()
+    frame = bytes(int(sample_rate * OUT_FRAME_SECONDS) * 2)
+
+    started = time.process_time()
+    for _ in range(int(seconds / OUT_FRAME_SECONDS)):
+        await transport.send_audio(frame, sample_rate)
+    return time.process_time() - started, websocket.wire_bytes
+
+
+def inbound(binary: bool, seconds: int, sample_rate: int) -> tuple[float, int]:
+    """Returns (CPU seconds, wire bytes)."""
+    pcm = bytes(IN_FRAME_SAMPLES * 2)
+    if binary:
+        message = {"type": "websocket.receive", "bytes": pack_audio_frame(pcm, 0)}
+        wire = len(message["bytes"])
+    else:
+        text = json.dumps({"event": "media", "media": {"payload": base64.b64encode(pcm).decode(), "track": "inbound"}})
+        message = {"type": "websocket.receive", "text": text}
+        wire = len(text)
+    count = int(seconds * sample_rate / IN_FRAME_SAMPLES)
+
+    # Mirrors the router's receive loop up to the orchestrator call
+    started = time.process_time()
+    for _ in range(count):
+        if message.get("bytes") is not None:
+            frame = unpack_audio_frame(message["bytes"])
+            if frame is not None:
+                bytes(frame[1])
+            continue
+        msg = json.loads(message.get("text"))
+        if msg.get("event") == "media":
+            payload = msg.get("media", {}).get("payload")
+            if payload:
+                base64.b64decode(payload)
+    return time.process_time() - started, wire * count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=600, help="Connection seconds per run")
+    parser.add_argument("--sample-rate", type=int, default=16000, help="PCM16 rate in both directions")
+    args = parser.parse_args()
+
+    print(f"{args.seconds}s of PCM16 @ {args.sample_rate} Hz per direction "
+          f"(out: {OUT_FRAME_SECONDS * 1000:.0f}ms frames, in: {IN_FRAME_SAMPLES}-sample mic frames)")
+    print(f"{'direction':<10} {'framing':<8} {'wire B/s':>10} {'overhead':>9} {'CPU us/conn-s':>14}")
+    payload_per_second = args.sample_rate * 2
+    for direction in ("outbound", "inbound"):
+        for label, binary in (("json", False), ("binary", True)):
+            if direction == "outbound":
+                runs = [asyncio.run(outbound(binary, args.seconds, args.sample_rate)) for _ in range(3)]
+            else:
+                runs = [inbound(binary, args.seconds, args.sample_rate) for _ in range(3)]
+            cpu = min(r[0] for r in runs)
+            wire_per_second = runs[0][1] / args.seconds
+            print(
+                f"{direction:<10} {label:<8} {wire_per_second:>10.0f} "
+                f"{wire_per_second / payload_per_second - 1:>8.1%} {cpu * 1e6 / args.seconds:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
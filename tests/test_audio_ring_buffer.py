@@ -0,0 +1,39 @@
+"""AudioRingBuffer reads across the wrap point."""
+import numpy as np
+
+from app_nuevo.infrastructure.audio.ring_buffer import AudioRingBuffer
+
+
+def wrapped_ring() -> AudioRingBuffer:
+    """Capacity 16 with 12 readable bytes (0..11) starting at offset 10."""
+    ring = AudioRingBuffer(capacity=16)
+    ring.write(bytes(10))
+    ring.consume(10)
+    ring.write(bytes(range(12)))
+    return ring
+
+
+def test_peek_tail_does_not_consume():
+    ring = wrapped_ring()
+    assert ring.peek_tail(4) == bytes(range(8, 12))
+    assert ring.peek_tail(10) == bytes(range(2, 12))  # Spans the wrap point
+    assert ring.peek_tail(100) == bytes(range(12))
+    assert ring.readable == 12
+
+    out = bytearray(12)
+    ring.read_into(out)
+    assert bytes(out) == bytes(range(12))
+    assert ring.peek_tail(4) == b""
+
+
+def test_pcm16_read_after_odd_length_write():
+    ring = AudioRingBuffer(capacity=16)
+    samples = np.array([1000, -2000, 3000, -4000], dtype=np.int16)
+    ring.write(b"\x00")
+    ring.consume(1)
+    ring.write(samples.tobytes())
+
+    out = np.empty(4, dtype=np.float32)
+    ring.read_pcm16_float32(out)
+    np.testing.assert_array_equal(out, samples / np.float32(32768.0))
+    assert ring.readable == 0
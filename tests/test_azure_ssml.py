@@ -0,0 +1,88 @@
+"""Azure SSML building: user text and profile values never become markup."""
+import asyncio
+import xml.etree.ElementTree as ET
+
+import pytest
+
+azure_tts = pytest.importorskip("app_nuevo.infrastructure.adapters.tts.azure_tts_adapter")
+
+from app_nuevo.domain.value_objects.tts_value_objects import TTSRequest  # noqa: E402
+
+SSML_NS = "{http://www.w3.org/2001/10/synthesis}"
+MSTTS_NS = "{https://www.w3.org/2001/mstts}"
+
+
+def make_adapter():
+    """Adapter without SDK config or voice catalog (only SSML building is used)."""
+    adapter = azure_tts.AzureTTSAdapter.__new__(azure_tts.AzureTTSAdapter)
+    adapter._ssml_templates = {}
+    adapter.audio_config = azure_tts.AudioConfig.from_legacy_mode("twilio")
+    return adapter
+
+
+def spoken_text(root: ET.Element) -> str:
+    return "".join(root.find(f".//{SSML_NS}prosody").itertext())
+
+
+@pytest.mark.parametrize("text", [
+    "Precio < 5 & \"oferta\" > 3",
+    "Tom's & Jerry's <b>oferta</b>",
+    "a &amp; b &lt; c",
+    "]]> <![CDATA[ x ]]>",
+])
+def test_text_special_characters_are_escaped(text):
+    root = ET.fromstring(make_adapter()._build_ssml(TTSRequest(text=text, voice_id="es-MX-DaliaNeural")))
+    assert spoken_text(root) == text
+    assert len(list(root.find(f".//{SSML_NS}prosody"))) == 0
+
+
+def test_bookmark_in_text_is_not_markup():
+    text = 'Hola <bookmark mark="1"/> adiós <mstts:express-as style="angry">'
+    root = ET.fromstring(make_adapter()._build_ssml(TTSRequest(text=text, voice_id="es-MX-DaliaNeural")))
+    assert root.find(f".//{SSML_NS}bookmark") is None
+    assert spoken_text(root) == text
+
+
+def test_style_and_voice_are_quoted_attributes():
+    style = 'cheerful"><bookmark mark="9"/><mstts:express-as style=\'sad'
+    voice = "es-MX-Dalia\"Neural' x=\"1"
+    request = TTSRequest(text="Hola", voice_id=voice, style=style)
+    root = ET.fromstring(make_adapter()._build_ssml(request))
+
+    assert root.find(f".//{SSML_NS}bookmark") is None
+    [express] = root.findall(f".//{MSTTS_NS}express-as")
+    assert express.get("style") == style
+    assert root.find(f"{SSML_NS}voice").get("name") == voice
+    assert spoken_text(root) == "Hola"
+
+
+def test_template_cache_keeps_texts_apart():
+    adapter = make_adapter()
+    first = adapter._build_ssml(TTSRequest(text="uno & dos", voice_id="v", style="cheerful"))
+    second = adapter._build_ssml(TTSRequest(text="<tres>", voice_id="v", style="cheerful"))
+    assert len(adapter._ssml_templates) == 1
+    assert spoken_text(ET.fromstring(first)) == "uno & dos"
+    assert spoken_text(ET.fromstring(second)) == "<tres>"
+
+
+def test_batch_document_only_has_its_own_bookmarks():
+    adapter = make_adapter()
+    documents = []
+
+    async def capture(ssml, *args, **kwargs):
+        documents.append(ssml)
+        return
+        yield
+
+    adapter._stream_ssml = capture
+    texts = ['Uno <bookmark mark="7"/>. ', "Dos & tres. ", "<prosody rate='9'>Cuatro"]
+    requests = [TTSRequest(text=text, voice_id="v") for text in texts]
+
+    async def drain():
+        return [item async for item in adapter.synthesize_batch_stream(requests)]
+
+    assert asyncio.run(drain()) == []
+    root = ET.fromstring(documents[0])
+    marks = [mark.get("mark") for mark in root.iter(f"{SSML_NS}bookmark")]
+    assert marks == ["1", "2"]
+    assert spoken_text(root) == "".join(texts)
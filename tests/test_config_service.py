@@ -0,0 +1,23 @@
+"""Per-client profile overlays on the ConfigDTO the orchestrator receives."""
+from app_nuevo.domain.ports.config_repository_port import ConfigDTO
+from app_nuevo.domain.services.config_service import apply_client_overlay
+
+
+def test_profile_column_replaces_default_for_its_client():
+    config = ConfigDTO(bg_audio_gain=0.3, bg_audio_gain_phone=0.0, bg_audio_gain_telnyx=0.5)
+    apply_client_overlay(config, "twilio")
+    assert config.bg_audio_gain == 0.0  # A muted profile is a real value, not "unset"
+
+    config = ConfigDTO(bg_audio_gain=0.3, bg_audio_gain_telnyx=0.5)
+    apply_client_overlay(config, "telnyx")
+    assert config.bg_audio_gain == 0.5
+
+
+def test_unset_profile_column_keeps_default():
+    config = ConfigDTO(bg_audio_gain=0.3)
+    apply_client_overlay(config, "twilio")
+    assert config.bg_audio_gain == 0.3
+
+    config = ConfigDTO(bg_audio_gain=0.3, bg_audio_gain_phone=0.8)
+    apply_client_overlay(config, "browser")
+    assert config.bg_audio_gain == 0.3
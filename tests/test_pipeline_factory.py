@@ -0,0 +1,79 @@
+"""PipelineFactory: profile flags decide which optional stages are built."""
+import asyncio
+import types
+
+import pytest
+
+pipeline_factory = pytest.importorskip("app_nuevo.application.factories.pipeline_factory")
+
+from app_nuevo.application.components.filler_processor import FillerProcessor  # noqa: E402
+from app_nuevo.application.components.stt_processor import STTProcessor  # noqa: E402
+from app_nuevo.application.components.tts_processor import TTSProcessor  # noqa: E402
+from app_nuevo.domain.ports.config_repository_port import ConfigDTO  # noqa: E402
+from app_nuevo.domain.services.config_service import apply_client_overlay  # noqa: E402
+from app_nuevo.infrastructure.messaging.control_channel import ControlChannel  # noqa: E402
+
+AUDIO_MANAGER = types.SimpleNamespace(silence_byte=0xFF, frame_size=160)  # What HoldAudioPlayer reads
+
+
+class RuntimeConfig(ConfigDTO):
+    """ConfigDTO plus the unset optional settings processors read with attribute access."""
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name == "get_profile":
+            raise AttributeError(name)
+        return None
+
+
+def profile(client_type: str, **fields) -> ConfigDTO:
+    """Config as the orchestrator hands it to the factory (client_type + overlay applied)."""
+    config = RuntimeConfig(stt_language="es-MX", silence_timeout_ms=500, **fields)
+    config.client_type = client_type
+    apply_client_overlay(config, client_type)
+    return config
+
+
+@pytest.fixture(autouse=True)
+def no_recognizer(monkeypatch):
+    """Starting recognition is not under test."""
+    async def initialize(self):
+        pass
+    monkeypatch.setattr(STTProcessor, "initialize", initialize)
+
+
+async def build(config) -> list:
+    pipeline = await pipeline_factory.PipelineFactory.create_pipeline(
+        config=config,
+        stt_port=types.SimpleNamespace(),
+        llm_port=types.SimpleNamespace(),
+        tts_port=types.SimpleNamespace(),
+        control_channel=ControlChannel(),
+        conversation_history=[],
+        initial_context_data={},
+        crm_service=None,
+        tools={},
+        stream_id="stream-1",
+        transcript_callback=lambda role, text: None,
+        orchestrator_ref=types.SimpleNamespace(audio_manager=AUDIO_MANAGER),
+        loop=asyncio.get_running_loop()
+    )
+    return pipeline.processors
+
+
+@pytest.mark.parametrize("client_type, fields", [
+    ("browser", {"voice_filler_injection": True}),
+    ("browser", {"voice_backchanneling": True}),
+    ("twilio", {"voice_filler_injection_phone": True}),
+    ("telnyx", {"voice_backchanneling_telnyx": True}),
+])
+def test_enabled_profile_gets_filler_before_tts(client_type, fields):
+    processors = asyncio.run(build(profile(client_type, **fields)))
+    kinds = [type(p) for p in processors]
+    assert FillerProcessor in kinds
+    assert kinds.index(FillerProcessor) == kinds.index(TTSProcessor) - 1
+
+
+def test_disabled_profile_has_no_filler():
+    # The browser flag does not leak into the phone profile
+    processors = asyncio.run(build(profile("twilio", voice_filler_injection=True, voice_filler_injection_phone=False)))
+    assert FillerProcessor not in [type(p) for p in processors]
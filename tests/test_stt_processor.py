@@ -0,0 +1,52 @@
+"""STTProcessor keyword barge-in honours the Interruption Threshold on partials."""
+import asyncio
+import types
+
+from app_nuevo.application.components.stt_processor import STTProcessor
+from app_nuevo.domain.value_objects.frames import CancelFrame
+from app_nuevo.domain.value_objects.stt_value_objects import STTEvent, STTResultReason
+
+
+class RecordingControlChannel:
+    def __init__(self):
+        self.interrupts: list[str] = []
+
+    async def send_interrupt(self, text: str = ""):
+        self.interrupts.append(text)
+
+
+async def run_events(events: list[STTEvent]) -> tuple[list[str], list]:
+    """Feed recognizer events; returns (out-of-band interrupts, frames delivered)."""
+    config = types.SimpleNamespace(client_type='twilio', input_min_characters=4, interruption_phrases=["no", "espera"])
+    control_channel = RecordingControlChannel()
+    processor = STTProcessor(types.SimpleNamespace(), config, asyncio.get_running_loop(), control_channel)
+    frames = []
+
+    async def sink(frame):
+        frames.append(frame)
+
+    processor.set_event_sink(sink)
+    await processor.start()
+    for event in events:
+        processor._on_stt_event(event)
+    await asyncio.sleep(0.05)
+    await processor._bridge.stop()
+    return control_channel.interrupts, frames
+
+
+def test_short_partial_does_not_barge_in():
+    interrupts, frames = asyncio.run(run_events([
+        STTEvent(reason=STTResultReason.RECOGNIZING_SPEECH, text="no"),
+    ]))
+    assert interrupts == []
+    assert not any(isinstance(frame, CancelFrame) for frame in frames)
+
+
+def test_partial_over_threshold_barges_in_once():
+    interrupts, frames = asyncio.run(run_events([
+        STTEvent(reason=STTResultReason.RECOGNIZING_SPEECH, text="no"),
+        STTEvent(reason=STTResultReason.RECOGNIZING_SPEECH, text="no espera"),
+        STTEvent(reason=STTResultReason.RECOGNIZED_SPEECH, text="no espera"),
+    ]))
+    assert interrupts == ["Keyword: no"]
+    assert sum(isinstance(frame, CancelFrame) for frame in frames) == 1
@@ -0,0 +1,166 @@
+"""STTWithFallback streaming failover with scripted recognizers."""
+import asyncio
+
+from app_nuevo.domain.ports.stt_port import STTPort
+from app_nuevo.domain.value_objects.stt_value_objects import STTConfig, STTEvent, STTResultReason
+from app_nuevo.infrastructure.adapters.stt.stt_with_fallback import STTWithFallback
+
+BYTES_PER_SECOND = 16000  # PCM16 @ 8kHz (twilio profile)
+
+
+class _Done:
+    def get(self):
+        return None
+
+
+class ScriptedRecognizer:
+    """Records the audio it receives; the test emits its events."""
+
+    def __init__(self):
+        self.audio = bytearray()
+        self.callback = None
+        self.started = False
+        self.stopped = False
+
+    def subscribe(self, callback):
+        self.callback = callback
+
+    async def start_continuous_recognition(self):
+        self.started = True
+
+    def start_continuous_recognition_async(self):
+        self.started = True
+        return _Done()
+
+    async def stop_continuous_recognition(self):
+        self.stopped = True
+
+    def stop_continuous_recognition_async(self):
+        self.stopped = True
+        return _Done()
+
+    def write(self, audio_data: bytes):
+        self.audio += audio_data
+
+    def emit(self, reason: STTResultReason, text: str = "", error: str | None = None):
+        self.callback(STTEvent(reason=reason, text=text, error_details=error))
+
+
+class ScriptedProvider(STTPort):
+    def __init__(self):
+        self.recognizers: list[ScriptedRecognizer] = []
+        self.released: list[ScriptedRecognizer] = []
+
+    def create_recognizer(self, config, on_interruption_callback=None, event_loop=None):
+        recognizer = ScriptedRecognizer()
+        self.recognizers.append(recognizer)
+        return recognizer
+
+    async def release_recognizer(self, recognizer):
+        self.released.append(recognizer)
+
+    async def transcribe_audio(self, audio_bytes: bytes, language: str = "es") -> str:
+        return ""
+
+    async def close(self):
+        pass
+
+
+def audio(value: int, seconds: float) -> bytes:
+    return bytes([value]) * int(BYTES_PER_SECOND * seconds)
+
+
+async def until(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.005)
+
+
+def make(fallbacks: int = 1, stall_timeout: float = 3.0):
+    primary = ScriptedProvider()
+    providers = [ScriptedProvider() for _ in range(fallbacks)]
+    stt = STTWithFallback(primary, providers, replay_seconds=10.0, stall_timeout=stall_timeout)
+    recognizer = stt.create_recognizer(STTConfig(audio_mode="twilio"))
+    events: list[STTEvent] = []
+    recognizer.subscribe(events.append)
+    return stt, recognizer, primary, providers, events
+
+
+def test_cancel_fails_over_and_replays_audio_since_last_final():
+    async def scenario():
+        stt, recognizer, primary, [fallback], events = make()
+        await recognizer.start_continuous_recognition()
+        first = primary.recognizers[0]
+
+        recognizer.write(audio(1, 1.0))
+        first.emit(STTResultReason.RECOGNIZED_SPEECH, "hola")
+        recognizer.write(audio(2, 0.5))
+        first.emit(STTResultReason.CANCELED, error="connection lost")
+
+        await until(lambda: fallback.recognizers and fallback.recognizers[0].audio)
+        replacement = fallback.recognizers[0]
+        assert replacement.started
+        assert bytes(replacement.audio) == audio(2, 0.5)
+
+        # Live audio now goes to the replacement only; the failed one is stopped and released
+        recognizer.write(audio(3, 0.1))
+        assert bytes(replacement.audio) == audio(2, 0.5) + audio(3, 0.1)
+        await until(lambda: primary.released)
+        assert first.stopped and primary.released == [first]
+
+        # Late events from the replaced recognizer are dropped
+        first.emit(STTResultReason.RECOGNIZING_SPEECH, "eco")
+        replacement.emit(STTResultReason.RECOGNIZED_SPEECH, "adiós")
+        assert [(e.reason, e.text) for e in events] == [
+            (STTResultReason.RECOGNIZED_SPEECH, "hola"),
+            (STTResultReason.RECOGNIZED_SPEECH, "adiós"),
+        ]
+
+        stats = stt.get_stats()
+        assert stats['failovers'] == 1 and stats['failovers_cancel'] == 1
+        assert stats['time_to_recover']['count'] == 1
+
+    asyncio.run(scenario())
+
+
+def test_stall_during_speech_fails_over():
+    async def scenario():
+        stt, recognizer, primary, [fallback], events = make(stall_timeout=0.05)
+        await recognizer.start_continuous_recognition()
+
+        recognizer.set_speech_active(True)
+        recognizer.write(audio(1, 0.2))
+        assert not fallback.recognizers  # Not stalled yet
+
+        await asyncio.sleep(0.06)  # No events from the primary while VAD reports speech
+        recognizer.write(audio(2, 0.2))
+
+        await until(lambda: fallback.recognizers and fallback.recognizers[0].audio)
+        assert bytes(fallback.recognizers[0].audio) == audio(1, 0.2) + audio(2, 0.2)
+        assert stt.get_stats()['failovers_stall'] == 1
+        assert events == []
+
+    asyncio.run(scenario())
+
+
+def test_replay_is_kept_for_a_further_failover():
+    async def scenario():
+        stt, recognizer, primary, [first_fallback, second_fallback], events = make(fallbacks=2)
+        await recognizer.start_continuous_recognition()
+
+        recognizer.write(audio(1, 1.0))
+        primary.recognizers[0].emit(STTResultReason.RECOGNIZED_SPEECH, "hola")
+        recognizer.write(audio(2, 0.5))
+        primary.recognizers[0].emit(STTResultReason.CANCELED, error="down")
+        await until(lambda: first_fallback.recognizers and first_fallback.recognizers[0].audio)
+
+        # No final from the first fallback: the next one gets everything since "hola"
+        recognizer.write(audio(3, 0.25))
+        first_fallback.recognizers[0].emit(STTResultReason.CANCELED, error="down too")
+        await until(lambda: second_fallback.recognizers and second_fallback.recognizers[0].audio)
+
+        assert bytes(second_fallback.recognizers[0].audio) == audio(2, 0.5) + audio(3, 0.25)
+        assert stt.get_stats()['failovers'] == 2
+
+    asyncio.run(scenario())
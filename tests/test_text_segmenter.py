@@ -0,0 +1,68 @@
+"""TextSegmenter max-latency deadline and the LLM stream wait built on it."""
+import asyncio
+
+from app_nuevo.application.components.llm_processor import LLMProcessor
+from app_nuevo.domain.services.text_segmenter import TextSegmenter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_segmenter(clock: FakeClock) -> TextSegmenter:
+    return TextSegmenter(min_chars=10, clause_min_words=6, max_latency_seconds=0.5, clock=clock)
+
+
+def test_poll_cuts_at_last_word_boundary_after_deadline():
+    clock = FakeClock()
+    segmenter = make_segmenter(clock)
+    assert segmenter.push("Hola qué tal") == []
+
+    clock.now = 0.4
+    assert segmenter.poll() == []
+    clock.now = 0.5
+    assert segmenter.poll() == ["Hola qué "]
+    assert segmenter.pending == "tal"
+
+
+def test_deadline_disarmed_when_there_is_no_word_boundary():
+    clock = FakeClock()
+    segmenter = make_segmenter(clock)
+    segmenter.push("Supercalifragilístico")
+
+    clock.now = 1.0
+    assert segmenter.time_until_deadline() == 0.0
+    assert segmenter.poll() == []
+    # Nothing to cut: no deadline until more text arrives (a 0 here busy-loops the caller)
+    assert segmenter.time_until_deadline() is None
+
+    segmenter.push("espialidoso y")
+    assert segmenter.time_until_deadline() == 0.0
+    assert segmenter.poll() == ["Supercalifragilísticoespialidoso "]
+    assert segmenter.time_until_deadline() == 0.5
+
+
+def test_stream_stall_without_word_boundary_does_not_spin():
+    async def stalled_stream():
+        yield "Supercalifragilístico"
+        await asyncio.sleep(0.3)  # Provider stall, several deadlines long
+        yield " fin."
+
+    async def consume():
+        segmenter = TextSegmenter(max_latency_seconds=0.02)
+        deadlines = 0
+        async for chunk in LLMProcessor._stream_with_deadline(stalled_stream(), segmenter):
+            if chunk is None:
+                deadlines += 1
+                assert segmenter.poll() == []
+            else:
+                segmenter.push(chunk)
+        return deadlines, segmenter.flush()
+
+    deadlines, remaining = asyncio.run(consume())
+    assert deadlines == 1
+    assert remaining == "Supercalifragilístico fin."
@@ -0,0 +1,52 @@
+"""TTSProcessor throughput mode: batches never span two replies."""
+import asyncio
+import types
+
+from app_nuevo.application.components.tts_processor import SYNTHESIS_MODE_THROUGHPUT, TTSProcessor
+from app_nuevo.domain.value_objects.frames import TextFrame
+
+
+class RecordingTTS:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self.single: list[str] = []
+
+    async def synthesize_stream(self, request):
+        self.single.append(request.text)
+        yield b'\xff' * 160
+
+    async def synthesize_batch_stream(self, requests):
+        self.batches.append([request.text for request in requests])
+        for index in range(len(requests)):
+            yield index, b'\xff' * 160
+
+
+def test_throughput_batches_split_on_reply_start():
+    async def scenario():
+        tts_port = RecordingTTS()
+        config = types.SimpleNamespace(
+            client_type='twilio',
+            tts_synthesis_mode=SYNTHESIS_MODE_THROUGHPUT,
+            tts_batch_window_ms=50
+        )
+        processor = TTSProcessor(tts_port, config)
+        await processor.start()
+
+        # Two replies of the same call: trace_id is the call's stream id for both
+        replies = [["Hola, ", "¿cómo estás? "], ["Te confirmo la cita. ", "Es el viernes. "]]
+        for reply in replies:
+            for index, text in enumerate(reply):
+                await processor.process_frame(
+                    TextFrame(text=text, trace_id="stream-1", metadata={'segment_index': index}), 1
+                )
+
+        for _ in range(100):
+            if sum(map(len, tts_port.batches)) + len(tts_port.single) == 4:
+                break
+            await asyncio.sleep(0.01)
+        await processor.stop()
+        return tts_port.batches, tts_port.single
+
+    batches, single = asyncio.run(scenario())
+    assert batches == [["Hola, ", "¿cómo estás? "], ["Te confirmo la cita. ", "Es el viernes. "]]
+    assert single == []
@@ -0,0 +1,52 @@
+"""TTSWithFallback fallback mode and its half-open primary probe."""
+import asyncio
+
+from app_nuevo.domain.ports.tts_port import TTSException
+from app_nuevo.infrastructure.adapters.tts.tts_with_fallback import TTSWithFallback
+
+
+class FakeTTS:
+    def __init__(self, name: str):
+        self.name = name
+        self.healthy = True
+        self.calls = 0
+
+    async def synthesize_stream(self, request):
+        self.calls += 1
+        if not self.healthy:
+            raise TTSException(f"{self.name} down", retryable=True)
+        yield self.name.encode()
+
+
+async def speak(tts: TTSWithFallback) -> bytes:
+    return b"".join([chunk async for chunk in tts.synthesize_stream(None)])
+
+
+def test_fallback_mode_probes_primary_and_recovers():
+    async def scenario():
+        primary, fallback = FakeTTS("primary"), FakeTTS("fallback")
+        tts = TTSWithFallback(primary, fallback, hedging=False, primary_retry_seconds=0.05)
+
+        primary.healthy = False
+        for _ in range(3):
+            assert await speak(tts) == b"fallback"
+        assert tts.is_using_fallback()
+
+        # Open: primary is not tried until the retry interval passes
+        assert await speak(tts) == b"fallback"
+        assert primary.calls == 3
+
+        # Half-open probe fails: still in fallback mode, request served by the fallback
+        await asyncio.sleep(0.06)
+        assert await speak(tts) == b"fallback"
+        assert primary.calls == 4
+        assert tts.is_using_fallback()
+
+        # Next probe succeeds: back to the primary
+        primary.healthy = True
+        await asyncio.sleep(0.06)
+        assert await speak(tts) == b"primary"
+        assert not tts.is_using_fallback()
+        assert tts.get_stats()['primary_probes'] == 2
+
+    asyncio.run(scenario())
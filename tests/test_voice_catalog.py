@@ -0,0 +1,52 @@
+"""VoiceCatalog cold start without a snapshot and with the provider down."""
+import asyncio
+
+from app_nuevo.infrastructure.services.voice_catalog import VoiceCatalog
+
+FALLBACK = [
+    {"id": "es-MX-DaliaNeural", "name": "Dalia (Femenino)", "gender": "female", "locale": "es-MX", "styles": []},
+    {"id": "en-US-JennyNeural", "name": "Jenny (Female)", "gender": "female", "locale": "en-US", "styles": []},
+]
+FETCHED = [
+    {"id": "es-MX-JorgeNeural", "name": "Jorge", "gender": "Male", "locale": "es-MX",
+     "styles": [{"id": "cheerful", "label": "Alegre"}]},
+]
+
+
+def test_dashboard_falls_back_when_there_is_no_catalog(tmp_path):
+    calls = []
+
+    async def unreachable():
+        calls.append(1)
+        raise ConnectionError("Azure unreachable")
+
+    async def scenario():
+        catalog = VoiceCatalog(unreachable, snapshot_path=str(tmp_path / "voices.json"), fallback_voices=FALLBACK)
+        voices, styles = await catalog.get_dashboard_catalog()
+        assert voices == {
+            "es-MX": [{"id": "es-MX-DaliaNeural", "name": "Dalia (Femenino)", "gender": "female"}],
+            "en-US": [{"id": "en-US-JennyNeural", "name": "Jenny (Female)", "gender": "female"}],
+        }
+        assert styles == {}
+        assert calls == [1]
+
+        # The fallback is not cached as the catalog: adapters still see no voices
+        assert await catalog.get_voices("es-MX") == []
+        stats = catalog.get_stats()
+        assert stats['fallback_reads'] == 1 and stats['voices'] == 0
+
+    asyncio.run(scenario())
+
+
+def test_fetched_catalog_replaces_the_fallback(tmp_path):
+    async def fetch():
+        return FETCHED
+
+    async def scenario():
+        catalog = VoiceCatalog(fetch, snapshot_path=str(tmp_path / "voices.json"), fallback_voices=FALLBACK)
+        voices, styles = await catalog.get_dashboard_catalog()
+        assert voices == {"es-MX": [{"id": "es-MX-JorgeNeural", "name": "Jorge", "gender": "male"}]}
+        assert styles == {"es-MX-JorgeNeural": [{"id": "cheerful", "label": "Alegre"}]}
+        assert catalog.get_stats()['fallback_reads'] == 0
+
+    asyncio.run(scenario())